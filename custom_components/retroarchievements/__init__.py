@@ -4,13 +4,41 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .api import RetroAchievementsApiClient
-from .const import CONF_USERNAME, DOMAIN, PLATFORMS, SERVICE_REFRESH
-from .coordinator import RetroAchievementsDataUpdateCoordinator
+from homeassistant.helpers.storage import Store
+
+from .api import (
+    RetroAchievementsApiClient,
+    async_get_api_metrics,
+    async_get_rate_limiter,
+    async_get_response_cache,
+)
+from .cache import GameExtendedCache, game_extended_store_key
+from .const import (
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_USERNAME,
+    DATA_GLOBAL_COORDINATOR,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    PLATFORMS,
+    SERVICE_GET_REFRESH_PROFILE,
+    SERVICE_REFRESH,
+    STORAGE_VERSION,
+)
+from .coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+    RetroAchievementsGlobalDataUpdateCoordinator,
+    snapshot_store_key,
+)
 
 type RetroAchievementsConfigEntry = ConfigEntry[RetroAchievementsDataUpdateCoordinator]
 
@@ -19,46 +47,138 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: RetroAchievementsConfigEntry
 ) -> bool:
     """Set up RetroAchievements from a config entry."""
+    rate_limiter = async_get_rate_limiter(hass, entry.data[CONF_API_KEY])
+    rate_limiter.configure(
+        entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+    )
     api_client = RetroAchievementsApiClient(
         username=entry.data[CONF_USERNAME],
         api_key=entry.data[CONF_API_KEY],
         session=async_get_clientsession(hass),
+        response_cache=async_get_response_cache(hass, entry.data[CONF_API_KEY]),
+        rate_limiter=rate_limiter,
+        metrics=async_get_api_metrics(hass, entry.data[CONF_API_KEY]),
     )
 
+    start_global = DATA_GLOBAL_COORDINATOR not in hass.data.get(DOMAIN, {})
+    global_coordinator = await _async_get_global_coordinator(hass, api_client, entry)
     coordinator = RetroAchievementsDataUpdateCoordinator(
-        hass=hass, api_client=api_client, entry=entry
+        hass=hass,
+        api_client=api_client,
+        entry=entry,
+        global_coordinator=global_coordinator,
+    )
+    entry.async_on_unload(
+        global_coordinator.async_add_listener(coordinator.async_handle_global_update)
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_load_cache()
+    restored = await coordinator.async_restore_snapshot()
+    if start_global:
+        # Started after the restore so the AOTW baseline is seeded first.
+        entry.async_create_background_task(
+            hass,
+            global_coordinator.async_refresh(),
+            f"{DOMAIN} global data refresh",
+        )
+    if restored:
+        # Entities come up with the last-known state; refresh live data later.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} warm start refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    if (unsub_probe := coordinator.async_start_presence_probe()) is not None:
+        entry.async_on_unload(unsub_probe)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    _async_register_refresh_service(hass)
+    _async_register_services(hass)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
 
-def _async_register_refresh_service(hass: HomeAssistant) -> None:
-    """Register the refresh service (once for the whole integration)."""
+async def _async_get_global_coordinator(
+    hass: HomeAssistant,
+    api_client: RetroAchievementsApiClient,
+    entry: RetroAchievementsConfigEntry,
+) -> RetroAchievementsGlobalDataUpdateCoordinator:
+    """Return the shared site-wide coordinator, creating it for the first entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    global_coordinator = domain_data.get(DATA_GLOBAL_COORDINATOR)
+    if global_coordinator is None:
+        global_coordinator = RetroAchievementsGlobalDataUpdateCoordinator(
+            hass, api_client
+        )
+        domain_data[DATA_GLOBAL_COORDINATOR] = global_coordinator
+        await global_coordinator.async_register_shutdown()
+    else:
+        global_coordinator.api_client = api_client
+    global_coordinator.entry_ids.add(entry.entry_id)
+
+    async def _async_release() -> None:
+        global_coordinator.entry_ids.discard(entry.entry_id)
+        if not global_coordinator.entry_ids:
+            domain_data.pop(DATA_GLOBAL_COORDINATOR, None)
+            await global_coordinator.async_shutdown()
+        elif global_coordinator.api_client is api_client:
+            # Hand polling to a remaining account, e.g. if this one's key was
+            # revoked and the entry removed.
+            for entry_id in global_coordinator.entry_ids:
+                remaining = hass.config_entries.async_get_entry(entry_id)
+                if coordinator := getattr(remaining, "runtime_data", None):
+                    global_coordinator.use_api_client(coordinator.api_client)
+                    break
+
+    entry.async_on_unload(_async_release)
+    return global_coordinator
+
+
+def _loaded_entries(hass: HomeAssistant) -> list[RetroAchievementsConfigEntry]:
+    """Return the config entries that currently have a coordinator."""
+    entries: list[RetroAchievementsConfigEntry] = hass.config_entries.async_entries(
+        DOMAIN
+    )
+    return [e for e in entries if getattr(e, "runtime_data", None)]
+
+
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services (once for the whole integration)."""
     if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
         return
 
     async def _handle_refresh(_call: ServiceCall) -> None:
-        entries: list[RetroAchievementsConfigEntry] = hass.config_entries.async_entries(
-            DOMAIN
-        )
-        loaded = [e for e in entries if getattr(e, "runtime_data", None)]
+        loaded = _loaded_entries(hass)
         if not loaded:
             msg = "No loaded RetroAchievements entries to refresh"
             raise HomeAssistantError(msg)
         for entry in loaded:
-            await entry.runtime_data.async_request_refresh()
+            await entry.runtime_data.async_request_full_refresh()
+
+    async def _handle_get_refresh_profile(_call: ServiceCall) -> ServiceResponse:
+        return {
+            "entries": {
+                entry.entry_id: {
+                    "username": entry.data[CONF_USERNAME],
+                    "enabled": entry.runtime_data.profiler.enabled,
+                    "refreshes": entry.runtime_data.profiler.as_list(),
+                }
+                for entry in _loaded_entries(hass)
+            }
+        }
 
     hass.services.async_register(DOMAIN, SERVICE_REFRESH, _handle_refresh)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_REFRESH_PROFILE,
+        _handle_get_refresh_profile,
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 async def async_unload_entry(
@@ -67,16 +187,33 @@ async def async_unload_entry(
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        # Awaited here: async_on_unload jobs are not awaited before a reload
+        # sets the entry up again and restores the snapshot.
+        await entry.runtime_data.async_save_snapshot()
         remaining = [
             e
             for e in hass.config_entries.async_entries(DOMAIN)
             if e.entry_id != entry.entry_id and getattr(e, "runtime_data", None)
         ]
-        if not remaining and hass.services.has_service(DOMAIN, SERVICE_REFRESH):
-            hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+        if not remaining:
+            for service in (SERVICE_REFRESH, SERVICE_GET_REFRESH_PROFILE):
+                if hass.services.has_service(DOMAIN, service):
+                    hass.services.async_remove(DOMAIN, service)
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: RetroAchievementsConfigEntry
+) -> None:
+    """Delete the entry's persisted cache and snapshot when it is removed."""
+    await GameExtendedCache(
+        hass, game_extended_store_key(entry.entry_id)
+    ).async_remove()
+    await Store(
+        hass, STORAGE_VERSION, snapshot_store_key(entry.entry_id)
+    ).async_remove()
+
+
 async def update_listener(
     hass: HomeAssistant, entry: RetroAchievementsConfigEntry
 ) -> None:
@@ -2,13 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
+import random
 import socket
-from typing import Any
+import time
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
-
-from .const import BASE_URL
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
+
+from .const import (
+    API_CACHE_MAX_ENTRIES,
+    API_CACHE_TTLS,
+    API_JSON_EXECUTOR_THRESHOLD,
+    API_METRICS_SAMPLES,
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_BUDGET,
+    API_RETRY_MAX_DELAY,
+    BASE_URL,
+    COMPLETION_PROGRESS_CONCURRENCY,
+    COMPLETION_PROGRESS_PAGE_SIZE,
+    DATA_API_METRICS,
+    DATA_RATE_LIMITERS,
+    DATA_RESPONSE_CACHES,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    LOGGER,
+    USER_PROGRESS_CHUNK_SIZE,
+)
+from .models import (
+    parse_game_progress,
+    parse_unlocks,
+    parse_user_awards,
+    parse_user_summary,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from .models import Unlock, UserAwards, UserSummary
 
 
 class RetroAchievementsApiClientError(Exception):
@@ -21,32 +60,338 @@ class RetroAchievementsApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class RetroAchievementsApiClientRateLimitError(
+    RetroAchievementsApiClientCommunicationError,
+):
+    """Exception to indicate the API answered 429 Too Many Requests."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Store the server-requested delay, in seconds, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class RetroAchievementsApiClientAuthenticationError(
     RetroAchievementsApiClientError,
 ):
     """Exception to indicate an authentication error."""
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay of a Retry-After header (seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+async def _async_decode_json(body: bytes) -> Any:
+    """Decode a JSON response body, in the executor when it is large."""
+    if not body.strip():
+        return None
+    if len(body) < API_JSON_EXECUTOR_THRESHOLD:
+        return json_loads(body)
+    return await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+
+
+def _is_retryable(exception: RetroAchievementsApiClientError) -> bool:
+    """Return True for transient failures worth retrying."""
+    if not isinstance(exception, RetroAchievementsApiClientCommunicationError):
+        return False
+    cause = exception.__cause__
+    return not (isinstance(cause, aiohttp.ClientResponseError) and cause.status < 500)
+
+
+class ApiResponseCache:
+    """
+    Short-lived response cache that also coalesces identical requests.
+
+    Concurrent calls with the same endpoint and params share one in-flight
+    request. Successful responses from endpoints listed in API_CACHE_TTLS are
+    kept until their TTL expires; the cache holds at most max_entries and
+    evicts the least recently used response first.
+    """
+
+    def __init__(self, max_entries: int = API_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    async def async_fetch(
+        self,
+        endpoint: str,
+        params: dict | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a cached or in-flight response, or await fetch() once."""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._entries.get(key)
+        if cached is not None:
+            expires, data = cached
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                return data
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_fetch_and_store(key, endpoint, fetch)
+            )
+            # Mark the exception retrieved when every caller was cancelled.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[key] = task
+        # Shielded: a cancelled caller must not cancel the request the other
+        # callers are waiting on.
+        return await asyncio.shield(task)
+
+    async def _async_fetch_and_store(
+        self,
+        key: tuple,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Await fetch() for every caller of key and cache the response."""
+        try:
+            data = await fetch()
+        finally:
+            self._in_flight.pop(key, None)
+
+        ttl = API_CACHE_TTLS.get(endpoint, 0)
+        if ttl > 0:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+
+@callback
+def async_get_response_cache(hass: HomeAssistant, api_key: str) -> ApiResponseCache:
+    """Return the response cache shared by every client using api_key."""
+    caches: dict[str, ApiResponseCache] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_RESPONSE_CACHES, {}
+    )
+    if api_key not in caches:
+        caches[api_key] = ApiResponseCache()
+    return caches[api_key]
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for outgoing requests.
+
+    Up to burst requests go out back to back; after that callers queue in
+    FIFO order and are released at rate requests per second. Queue depth and
+    wait time counters are kept so the limits can be sized from diagnostics.
+    """
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE_LIMIT, burst: int = DEFAULT_RATE_BURST
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Change the refill rate and bucket size."""
+        self._refill()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, float(burst))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        start = time.monotonic()
+        # Only callers stuck behind another caller count as queued.
+        queued = self._lock.locked()
+        if queued:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            async with self._lock:
+                if queued:
+                    self.queue_depth -= 1
+                    queued = False
+                self._refill()
+                if self._tokens < 1:
+                    self.delayed += 1
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            if queued:
+                self.queue_depth -= 1
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the limiter settings and counters."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant, api_key: str) -> TokenBucket:
+    """Return the rate limiter shared by every client using api_key."""
+    limiters: dict[str, TokenBucket] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_RATE_LIMITERS, {}
+    )
+    if api_key not in limiters:
+        limiters[api_key] = TokenBucket()
+    return limiters[api_key]
+
+
+class EndpointMetrics:
+    """Request, error and retry counters plus recent latency and size samples."""
+
+    def __init__(self, samples: int = API_METRICS_SAMPLES) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_bytes = 0
+        self.last_bytes: int | None = None
+        self.latencies: deque[float] = deque(maxlen=samples)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank latency percentile in seconds, if sampled."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters, latency percentiles (ms) and response sizes."""
+        ok = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            **{
+                f"latency_p{percent}_ms": (
+                    round(value * 1000, 1)
+                    if (value := self.percentile(percent)) is not None
+                    else None
+                )
+                for percent in (50, 95, 99)
+            },
+            "last_bytes": self.last_bytes,
+            "mean_bytes": round(self.total_bytes / ok) if ok else None,
+        }
+
+
+class ApiMetrics:
+    """Per-endpoint request metrics for every client sharing an API key."""
+
+    def __init__(self, samples: int = API_METRICS_SAMPLES) -> None:
+        self._samples = samples
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of endpoint, creating them on first use."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(self._samples)
+        return metrics
+
+    def record_request(
+        self, endpoint: str, latency: float, size: int | None, *, error: bool
+    ) -> None:
+        """Record one HTTP request and its outcome."""
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.latencies.append(latency)
+        if error:
+            metrics.errors += 1
+        elif size is not None:
+            metrics.last_bytes = size
+            metrics.total_bytes += size
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record that a failed request to endpoint is being retried."""
+        self.endpoint(endpoint).retries += 1
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every endpoint requested so far."""
+        return {
+            endpoint: metrics.stats()
+            for endpoint, metrics in sorted(self.endpoints.items())
+        }
+
+
+@callback
+def async_get_api_metrics(hass: HomeAssistant, api_key: str) -> ApiMetrics:
+    """Return the request metrics shared by every client using api_key."""
+    metrics: dict[str, ApiMetrics] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_API_METRICS, {}
+    )
+    if api_key not in metrics:
+        metrics[api_key] = ApiMetrics()
+    return metrics[api_key]
+
+
 class RetroAchievementsApiClient:
     """RetroAchievements API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         username: str,
         api_key: str,
         session: aiohttp.ClientSession,
+        response_cache: ApiResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        metrics: ApiMetrics | None = None,
     ) -> None:
         """Initialize the API client."""
         self._username = username
         self._api_key = api_key
         self._session = session
+        self._response_cache = response_cache or ApiResponseCache()
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
 
     @property
     def username(self) -> str:
         """Return the configured RetroAchievements username."""
         return self._username
 
-    async def async_get_user_summary(self) -> dict[str, Any]:
+    async def async_get_user_summary(self) -> UserSummary:
         """Get user summary from the API."""
         response = await self._api_wrapper(
             endpoint="API_GetUserSummary.php",
@@ -67,11 +412,11 @@ class RetroAchievementsApiClient:
             # Try to fetch recent games separately
             try:
                 recent_games = await self.async_get_user_recent_games()
-                response["RecentlyPlayed"] = recent_games
+                response = {**response, "RecentlyPlayed": recent_games}
             except Exception:
-                response["RecentlyPlayed"] = []
+                response = {**response, "RecentlyPlayed": []}
 
-        return response
+        return parse_user_summary(response)
 
     async def async_get_user_recent_games(
         self, count: int = 10
@@ -97,6 +442,14 @@ class RetroAchievementsApiClient:
         )
         return response if isinstance(response, dict) else {}
 
+    async def async_get_user_profile(self) -> dict[str, Any]:
+        """Get the user's profile, a small payload carrying rich presence."""
+        response = await self._api_wrapper(
+            endpoint="API_GetUserProfile.php",
+            params={"u": self._username, "y": self._api_key},
+        )
+        return response if isinstance(response, dict) else {}
+
     async def async_get_user_points(self) -> dict[str, Any]:
         """Get the user's hardcore and softcore point totals."""
         response = await self._api_wrapper(
@@ -107,19 +460,70 @@ class RetroAchievementsApiClient:
 
     async def async_get_user_completion_progress(self) -> dict[str, Any]:
         """Get metadata about all the user's played games and their awards."""
+        pages = [page async for page in self.async_iter_user_completion_progress()]
+        results = [game for page in pages for game in page.get("Results") or []]
+        return {
+            "Count": len(results),
+            "Total": pages[0].get("Total", len(results)) if pages else 0,
+            "Results": results,
+        }
+
+    async def async_get_user_completion_progress_page(
+        self,
+        offset: int = 0,
+        count: int = COMPLETION_PROGRESS_PAGE_SIZE,
+    ) -> dict[str, Any]:
+        """Get one page of the user's played games, most recently awarded first."""
         response = await self._api_wrapper(
             endpoint="API_GetUserCompletionProgress.php",
-            params={"u": self._username, "c": 500, "o": 0, "y": self._api_key},
+            params={"u": self._username, "c": count, "o": offset, "y": self._api_key},
         )
-        return response if isinstance(response, dict) else {}
-
-    async def async_get_user_awards(self) -> dict[str, Any]:
+        if not isinstance(response, dict):
+            return {}
+        return {
+            **response,
+            "Results": [
+                parse_game_progress(game) for game in response.get("Results") or []
+            ],
+        }
+
+    async def async_iter_user_completion_progress(
+        self,
+        page_size: int = COMPLETION_PROGRESS_PAGE_SIZE,
+        concurrency: int = COMPLETION_PROGRESS_CONCURRENCY,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield every GetUserCompletionProgress page in order.
+
+        The first page reports the Total number of played games; the
+        remaining pages are then requested concurrency at a time. Stopping
+        the iteration early skips the pages not yet requested.
+        """
+        first = await self.async_get_user_completion_progress_page(0, page_size)
+        yield first
+        try:
+            total = int(first.get("Total") or 0)
+        except (TypeError, ValueError):
+            return
+        offsets = list(range(page_size, total, page_size))
+        step = max(concurrency, 1)
+        for start in range(0, len(offsets), step):
+            pages = await asyncio.gather(
+                *(
+                    self.async_get_user_completion_progress_page(offset, page_size)
+                    for offset in offsets[start : start + step]
+                )
+            )
+            for page in pages:
+                yield page
+
+    async def async_get_user_awards(self) -> UserAwards:
         """Get the user's site awards/badges."""
         response = await self._api_wrapper(
             endpoint="API_GetUserAwards.php",
             params={"u": self._username, "y": self._api_key},
         )
-        return response if isinstance(response, dict) else {}
+        return parse_user_awards(response)
 
     async def async_get_user_want_to_play_list(self) -> dict[str, Any]:
         """Get the user's 'Want to Play Games' backlog."""
@@ -150,16 +554,44 @@ class RetroAchievementsApiClient:
 
     async def async_get_user_progress(self, game_id: int) -> dict[str, Any]:
         """Get user's progress in a specific game."""
-        response = await self._api_wrapper(
-            endpoint="API_GetUserProgress.php",
-            params={
-                "u": self._username,
-                "g": game_id,
-                "y": self._api_key,
-            },
+        progress = await self.async_get_user_progress_batch([game_id])
+        return progress.get(str(game_id), {})
+
+    async def async_get_user_progress_batch(
+        self,
+        game_ids: Iterable[int],
+        chunk_size: int = USER_PROGRESS_CHUNK_SIZE,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get user's progress in several games, keyed by game ID string.
+
+        API_GetUserProgress accepts a comma-separated list of game IDs, so
+        the IDs are sent chunk_size at a time instead of one request each.
+        """
+        ids = sorted({int(game_id) for game_id in game_ids})
+        chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        responses = await asyncio.gather(
+            *(
+                self._api_wrapper(
+                    endpoint="API_GetUserProgress.php",
+                    params={
+                        "u": self._username,
+                        "i": ",".join(str(game_id) for game_id in chunk),
+                        "y": self._api_key,
+                    },
+                )
+                for chunk in chunks
+            )
         )
-        # Get the first item since the response is a dict with game_id as key
-        return list(response.values())[0] if response else {}
+        progress: dict[str, dict[str, Any]] = {}
+        for response in responses:
+            if isinstance(response, dict):
+                progress.update(
+                    (str(game_id), data)
+                    for game_id, data in response.items()
+                    if isinstance(data, dict)
+                )
+        return progress
 
     async def async_get_game_achievements(self, game_id: int) -> list[dict[str, Any]]:
         """Get achievements for a specific game."""
@@ -269,7 +701,7 @@ class RetroAchievementsApiClient:
 
     async def async_get_achievements_earned_between(
         self, from_date: str, to_date: str
-    ) -> list[dict[str, Any]]:
+    ) -> list[Unlock]:
         """Get achievements the user earned between two dates (YYYY-MM-DD)."""
         response = await self._api_wrapper(
             endpoint="API_GetAchievementsEarnedBetween.php",
@@ -280,16 +712,67 @@ class RetroAchievementsApiClient:
                 "y": self._api_key,
             },
         )
-        return response if isinstance(response, list) else []
+        return parse_unlocks(response)
 
     async def _api_wrapper(
         self,
         endpoint: str,
         params: dict = None,
     ) -> Any:
-        """Get information from the API."""
+        """Get information from the API, sharing identical requests."""
+        return await self._response_cache.async_fetch(
+            endpoint, params, lambda: self._async_request_with_retries(endpoint, params)
+        )
+
+    async def _async_request_with_retries(
+        self,
+        endpoint: str,
+        params: dict | None,
+    ) -> Any:
+        """Perform a request, retrying transient failures within a time budget."""
+        deadline = time.monotonic() + API_RETRY_BUDGET
+        attempt = 0
+        while True:
+            try:
+                return await self._async_request(endpoint, params)
+            except RetroAchievementsApiClientError as exception:
+                attempt += 1
+                if attempt > API_RETRY_ATTEMPTS or not _is_retryable(exception):
+                    raise
+                retry_after = getattr(exception, "retry_after", None)
+                if retry_after is None:
+                    backoff = min(
+                        API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                    )
+                    delay = random.uniform(backoff / 2, backoff)  # noqa: S311
+                else:
+                    delay = retry_after
+                if time.monotonic() + delay > deadline:
+                    raise
+                LOGGER.debug(
+                    "Retrying %s in %.1fs (attempt %d): %s",
+                    endpoint,
+                    delay,
+                    attempt,
+                    exception,
+                )
+                if self.metrics is not None:
+                    self.metrics.record_retry(endpoint)
+                await asyncio.sleep(delay)
+
+    async def _async_request(
+        self,
+        endpoint: str,
+        params: dict = None,
+    ) -> Any:
+        """Perform a single request against the API."""
         url = f"{BASE_URL}{endpoint}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
 
+        started = time.monotonic()
+        size: int | None = None
+        failed = True
         try:
             async with async_timeout.timeout(10):
                 response = await self._session.get(url=url, params=params)
@@ -298,17 +781,27 @@ class RetroAchievementsApiClient:
                     raise RetroAchievementsApiClientAuthenticationError(
                         "Invalid API key or username",
                     )
+                if response.status == 429:
+                    raise RetroAchievementsApiClientRateLimitError(
+                        "Rate limited by the RetroAchievements API",
+                        _parse_retry_after(response.headers.get("Retry-After")),
+                    )
                 response.raise_for_status()
 
-                data = await response.json()
+                body = await response.read()
+                size = len(body)
+                data = await _async_decode_json(body)
 
                 if isinstance(data, dict) and data.get("Success") is False:
                     raise RetroAchievementsApiClientError(
                         data.get("Error", "Unknown error"),
                     )
 
+                failed = False
                 return data
 
+        except RetroAchievementsApiClientError:
+            raise
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
             raise RetroAchievementsApiClientCommunicationError(
@@ -324,3 +817,8 @@ class RetroAchievementsApiClient:
             raise RetroAchievementsApiClientError(
                 msg,
             ) from exception
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_request(
+                    endpoint, time.monotonic() - started, size, error=failed
+                )
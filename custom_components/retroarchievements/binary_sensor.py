@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
 
 from .const import CONF_USERNAME, DOMAIN
 from .coordinator import RetroAchievementsDataUpdateCoordinator
+from .entity import RetroAchievementsCoordinatorEntity
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 PARALLEL_UPDATES = 0
 
@@ -45,8 +51,17 @@ async def async_setup_entry(
     )
 
 
-class RetroAchievementsIsGamingBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor that is ON while the user is actively gaming."""
+class RetroAchievementsIsGamingBinarySensor(
+    RetroAchievementsCoordinatorEntity, BinarySensorEntity
+):
+    """
+    Binary sensor that is ON while the user is actively gaming.
+
+    The idle threshold is enforced by a timer scheduled for the moment the
+    session goes stale, so the sensor turns off on time between polls.
+    """
+
+    _data_sections = frozenset({"user_summary"})
 
     _attr_has_entity_name = True
     _attr_translation_key = "is_gaming"
@@ -61,33 +76,57 @@ class RetroAchievementsIsGamingBinarySensor(CoordinatorEntity, BinarySensorEntit
         self.username = username
         self._attr_unique_id = f"{DOMAIN}_{username}_is_gaming"
         self._attr_device_info = _user_device_info(username)
+        self._idle_at: datetime | None = None
+        self._unsub_idle: CALLBACK_TYPE | None = None
 
     @property
     def is_on(self) -> bool:
-        data = (self.coordinator.data or {}).get("user_summary") or {}
-        rich = (data.get("RichPresenceMsg") or "").strip()
-        status = data.get("Status", "")
-        if not rich or status != "Online":
-            return False
-        last_activity = data.get("LastActivity") or {}
-        ts = last_activity.get("timestamp") or last_activity.get("lastupdate")
-        if not ts:
-            return False
-        try:
-            normalized = ts.replace("Z", "+00:00").replace(" ", "T")
-            last = datetime.fromisoformat(normalized)
-            if last.tzinfo is None:
-                last = last.replace(tzinfo=UTC)
-        except (ValueError, AttributeError):
-            return False
-        threshold_seconds = self.coordinator._idle_threshold_minutes * 60  # noqa: SLF001
-        now = datetime.now(UTC)
-        return (now - last).total_seconds() <= threshold_seconds
-
-
-class RetroAchievementsAOTWUnlockedBinarySensor(CoordinatorEntity, BinarySensorEntity):
+        return self.coordinator.is_gaming()
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the idle transition for the restored or fetched data."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_idle_transition)
+        self._schedule_idle_transition()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reschedule the idle transition, then write state if data changed."""
+        self._schedule_idle_transition()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _schedule_idle_transition(self) -> None:
+        """Arm a timer for when the current session exceeds the idle threshold."""
+        idle_at = self.coordinator.gaming_until
+        if idle_at == self._idle_at:
+            return
+        self._cancel_idle_transition()
+        self._idle_at = idle_at
+        if idle_at is not None and idle_at > dt_util.utcnow():
+            self._unsub_idle = async_track_point_in_time(
+                self.hass, self._async_went_idle, idle_at
+            )
+
+    @callback
+    def _cancel_idle_transition(self) -> None:
+        if self._unsub_idle is not None:
+            self._unsub_idle()
+            self._unsub_idle = None
+
+    @callback
+    def _async_went_idle(self, _now: datetime) -> None:
+        self._unsub_idle = None
+        self.async_write_ha_state()
+
+
+class RetroAchievementsAOTWUnlockedBinarySensor(
+    RetroAchievementsCoordinatorEntity, BinarySensorEntity
+):
     """Binary sensor that is ON when the user has unlocked the current AOTW."""
 
+    _data_sections = frozenset({"aotw", "user_summary", "RecentAchievements"})
+
     _attr_has_entity_name = True
     _attr_translation_key = "aotw_unlocked"
 
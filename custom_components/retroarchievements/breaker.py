@@ -0,0 +1,82 @@
+"""Circuit breaker for optional RetroAchievements endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import CIRCUIT_BASE_DELAY, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_MAX_DELAY
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint that keeps failing, and probe it now and then.
+
+    The breaker opens after failure_threshold consecutive failures. While
+    open, allow() is False until the next probe is due; the breaker is then
+    half-open and lets one call through. A success closes it, a failure
+    reopens it with the probe delay doubled, up to max_delay.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_delay: float = CIRCUIT_BASE_DELAY,
+        max_delay: float = CIRCUIT_MAX_DELAY,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self.failures = 0
+        self.opened_at: datetime | None = None
+        self.next_probe: datetime | None = None
+        self.last_error: str | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self.next_probe is None:
+            return STATE_CLOSED
+        if dt_util.utcnow() >= self.next_probe:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now."""
+        return self.state != STATE_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.failures = 0
+        self.opened_at = None
+        self.next_probe = None
+        self.last_error = None
+
+    def record_failure(self, err: BaseException | None = None) -> None:
+        """Count a failed call and open the breaker once over the threshold."""
+        self.failures += 1
+        self.last_error = str(err) if err is not None else None
+        if self.failures < self._failure_threshold:
+            return
+        now = dt_util.utcnow()
+        if self.opened_at is None:
+            self.opened_at = now
+        exponent = self.failures - self._failure_threshold
+        delay = min(self._base_delay * 2 ** min(exponent, 32), self._max_delay)
+        self.next_probe = now + timedelta(seconds=delay)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "next_probe": self.next_probe.isoformat() if self.next_probe else None,
+            "last_error": self.last_error,
+        }
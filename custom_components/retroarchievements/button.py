@@ -7,11 +7,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_USERNAME, DOMAIN
 from .coordinator import RetroAchievementsDataUpdateCoordinator
-from .entity import user_device_info
+from .entity import RetroAchievementsCoordinatorEntity, user_device_info
 
 PARALLEL_UPDATES = 0
 
@@ -27,9 +26,11 @@ async def async_setup_entry(
     async_add_entities([RetroAchievementsRefreshButton(coordinator, username)])
 
 
-class RetroAchievementsRefreshButton(CoordinatorEntity, ButtonEntity):
+class RetroAchievementsRefreshButton(RetroAchievementsCoordinatorEntity, ButtonEntity):
     """Button that triggers an immediate data refresh."""
 
+    _data_sections = frozenset()
+
     _attr_has_entity_name = True
     _attr_translation_key = "refresh"
     _attr_icon = "mdi:refresh"
@@ -47,4 +48,4 @@ class RetroAchievementsRefreshButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Refresh the coordinator data."""
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_full_refresh()
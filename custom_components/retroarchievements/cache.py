@@ -0,0 +1,158 @@
+"""Persistent, bounded cache of GetGameExtended metadata."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    GAME_EXTENDED_CACHE_MAX_BYTES,
+    GAME_EXTENDED_CACHE_MAX_ENTRIES,
+    GAME_EXTENDED_CACHE_SAVE_DELAY,
+    LOGGER,
+    STORAGE_VERSION,
+)
+
+# Per-achievement fields read when enriching achievement_unlocked events.
+_ACHIEVEMENT_FIELDS = (
+    "NumAwarded",
+    "NumAwardedHardcore",
+    "TrueRatio",
+    "DisplayOrder",
+    "Author",
+)
+
+
+def game_extended_store_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's GetGameExtended cache."""
+    return f"{DOMAIN}.{entry_id}.game_extended"
+
+
+def _compact(payload: dict) -> dict:
+    """Keep only the GetGameExtended fields the integration reads."""
+    achievements = payload.get("Achievements") or {}
+    return {
+        "Title": payload.get("Title"),
+        "ConsoleName": payload.get("ConsoleName"),
+        "ConsoleID": payload.get("ConsoleID"),
+        "NumDistinctPlayers": payload.get("NumDistinctPlayers"),
+        "Achievements": {
+            str(ach_id): {
+                field: ach.get(field) for field in _ACHIEVEMENT_FIELDS if field in ach
+            }
+            for ach_id, ach in achievements.items()
+            if isinstance(ach, dict)
+        },
+    }
+
+
+class GameExtendedCache:
+    """
+    LRU cache of compacted GetGameExtended payloads backed by a Store.
+
+    Entries are bounded by count and by total serialized size. Each entry
+    records a revision marker (the achievement count of the set) so callers
+    can drop it when the set is revised upstream.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        max_entries: int = GAME_EXTENDED_CACHE_MAX_ENTRIES,
+        max_bytes: int = GAME_EXTENDED_CACHE_MAX_BYTES,
+    ) -> None:
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, key)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._total_bytes = 0
+
+    def __contains__(self, game_id: object) -> bool:
+        """Return True if game_id is cached."""
+        return str(game_id) in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached games."""
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the serialized size of all cached payloads."""
+        return self._total_bytes
+
+    async def async_load(self) -> None:
+        """Restore cached entries from disk, oldest first."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to load GetGameExtended cache: %s", err)
+            return
+        for game_id, entry in ((stored or {}).get("games") or {}).items():
+            if isinstance(entry, dict) and isinstance(entry.get("data"), dict):
+                self._insert(game_id, entry["data"], entry.get("revision"))
+        self._evict()
+
+    def get(self, game_id: int) -> dict | None:
+        """Return the cached payload for game_id and mark it recently used."""
+        entry = self._entries.get(str(game_id))
+        if entry is None:
+            return None
+        self._entries.move_to_end(str(game_id))
+        return entry["data"]
+
+    def revision(self, game_id: int) -> int | None:
+        """Return the revision marker stored with game_id, if cached."""
+        entry = self._entries.get(str(game_id))
+        return entry["revision"] if entry else None
+
+    def set(self, game_id: int, payload: dict) -> dict:
+        """Cache a compacted copy of payload and return it."""
+        data = _compact(payload)
+        self._insert(str(game_id), data, len(data["Achievements"]))
+        self._evict()
+        self._schedule_save()
+        return data
+
+    def invalidate(self, game_id: int) -> None:
+        """Drop the cached payload for game_id."""
+        entry = self._entries.pop(str(game_id), None)
+        if entry is not None:
+            self._total_bytes -= entry["size"]
+            self._schedule_save()
+
+    async def async_remove(self) -> None:
+        """Delete the on-disk cache."""
+        await self._store.async_remove()
+
+    def _insert(self, game_id: str, data: dict, revision: int | None) -> None:
+        previous = self._entries.pop(game_id, None)
+        if previous is not None:
+            self._total_bytes -= previous["size"]
+        size = len(json_bytes(data))
+        self._entries[game_id] = {"data": data, "revision": revision, "size": size}
+        self._total_bytes += size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds hold."""
+        while self._entries and (
+            len(self._entries) > self._max_entries
+            or self._total_bytes > self._max_bytes
+        ):
+            _game_id, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry["size"]
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, GAME_EXTENDED_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
+            "games": {
+                game_id: {"data": entry["data"], "revision": entry["revision"]}
+                for game_id, entry in self._entries.items()
+            }
+        }
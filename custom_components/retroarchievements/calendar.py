@@ -9,11 +9,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import CONF_USERNAME, DOMAIN
 from .coordinator import RetroAchievementsDataUpdateCoordinator
+from .entity import RetroAchievementsCoordinatorEntity
 
 # Coordinator already fetches everything; entity reads are local. No throttling.
 PARALLEL_UPDATES = 0
@@ -45,9 +45,13 @@ def _parse_award_dt(value: str | None) -> datetime | None:
     return parsed
 
 
-class RetroAchievementsAchievementsCalendar(CoordinatorEntity, CalendarEntity):
+class RetroAchievementsAchievementsCalendar(
+    RetroAchievementsCoordinatorEntity, CalendarEntity
+):
     """Calendar of recently unlocked achievements."""
 
+    _data_sections = frozenset({"earned_between"})
+
     _attr_has_entity_name = True
     _attr_translation_key = "achievements"
     _attr_icon = "mdi:calendar-check"
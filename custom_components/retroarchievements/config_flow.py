@@ -16,14 +16,36 @@ from .api import (
     RetroAchievementsApiClientAuthenticationError,
     RetroAchievementsApiClientCommunicationError,
     RetroAchievementsApiClientError,
+    async_get_api_metrics,
+    async_get_rate_limiter,
+    async_get_response_cache,
 )
 from .const import (
+    CONF_ACHIEVEMENT_BATCH_EVENT,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
+    CONF_GAME_FETCH_CONCURRENCY,
+    CONF_GAMES_PER_REFRESH,
     CONF_GAMING_IDLE_THRESHOLD,
+    CONF_MAX_POLL_INTERVAL,
     CONF_MONITORED_GAMES,
+    CONF_PRESENCE_PROBE_INTERVAL,
+    CONF_PROFILE_REFRESHES,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    DEFAULT_ACHIEVEMENT_BATCH_EVENT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_GAME_FETCH_CONCURRENCY,
+    DEFAULT_GAMES_PER_REFRESH,
     DEFAULT_GAMING_IDLE_THRESHOLD,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_PRESENCE_PROBE_INTERVAL,
+    DEFAULT_PROFILE_REFRESHES,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
     LOGGER,
+    MIN_PRESENCE_PROBE_INTERVAL,
 )
 
 CONF_CONSOLE = "console"
@@ -167,6 +189,33 @@ class RetroAchievementsOptionsFlowHandler(config_entries.OptionsFlow):
         self._idle_threshold: int = config_entry.options.get(
             CONF_GAMING_IDLE_THRESHOLD, DEFAULT_GAMING_IDLE_THRESHOLD
         )
+        self._adaptive_polling: bool = config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._max_poll_interval: int = config_entry.options.get(
+            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+        )
+        self._rate_limit: float = config_entry.options.get(
+            CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT
+        )
+        self._rate_burst: int = config_entry.options.get(
+            CONF_RATE_BURST, DEFAULT_RATE_BURST
+        )
+        self._game_fetch_concurrency: int = config_entry.options.get(
+            CONF_GAME_FETCH_CONCURRENCY, DEFAULT_GAME_FETCH_CONCURRENCY
+        )
+        self._games_per_refresh: int = config_entry.options.get(
+            CONF_GAMES_PER_REFRESH, DEFAULT_GAMES_PER_REFRESH
+        )
+        self._achievement_batch_event: bool = config_entry.options.get(
+            CONF_ACHIEVEMENT_BATCH_EVENT, DEFAULT_ACHIEVEMENT_BATCH_EVENT
+        )
+        self._presence_probe_interval: int = config_entry.options.get(
+            CONF_PRESENCE_PROBE_INTERVAL, DEFAULT_PRESENCE_PROBE_INTERVAL
+        )
+        self._profile_refreshes: bool = config_entry.options.get(
+            CONF_PROFILE_REFRESHES, DEFAULT_PROFILE_REFRESHES
+        )
         self._selected_console: str | None = None
         self._console_games: list[dict] = []
 
@@ -176,6 +225,15 @@ class RetroAchievementsOptionsFlowHandler(config_entries.OptionsFlow):
             username=self.config_entry.data[CONF_USERNAME],
             api_key=self.config_entry.data[CONF_API_KEY],
             session=async_get_clientsession(self.hass),
+            response_cache=async_get_response_cache(
+                self.hass, self.config_entry.data[CONF_API_KEY]
+            ),
+            rate_limiter=async_get_rate_limiter(
+                self.hass, self.config_entry.data[CONF_API_KEY]
+            ),
+            metrics=async_get_api_metrics(
+                self.hass, self.config_entry.data[CONF_API_KEY]
+            ),
         )
 
     def _serialize_monitored(self) -> str:
@@ -193,6 +251,15 @@ class RetroAchievementsOptionsFlowHandler(config_entries.OptionsFlow):
             data={
                 CONF_MONITORED_GAMES: self._serialize_monitored(),
                 CONF_GAMING_IDLE_THRESHOLD: self._idle_threshold,
+                CONF_ADAPTIVE_POLLING: self._adaptive_polling,
+                CONF_MAX_POLL_INTERVAL: self._max_poll_interval,
+                CONF_RATE_LIMIT: self._rate_limit,
+                CONF_RATE_BURST: self._rate_burst,
+                CONF_GAME_FETCH_CONCURRENCY: self._game_fetch_concurrency,
+                CONF_GAMES_PER_REFRESH: self._games_per_refresh,
+                CONF_ACHIEVEMENT_BATCH_EVENT: self._achievement_batch_event,
+                CONF_PRESENCE_PROBE_INTERVAL: self._presence_probe_interval,
+                CONF_PROFILE_REFRESHES: self._profile_refreshes,
             },
         )
 
@@ -308,6 +375,17 @@ class RetroAchievementsOptionsFlowHandler(config_entries.OptionsFlow):
                 line.strip() for line in raw.splitlines() if line.strip()
             }
             self._idle_threshold = user_input[CONF_GAMING_IDLE_THRESHOLD]
+            self._adaptive_polling = user_input[CONF_ADAPTIVE_POLLING]
+            self._max_poll_interval = user_input[CONF_MAX_POLL_INTERVAL]
+            self._rate_limit = user_input[CONF_RATE_LIMIT]
+            self._rate_burst = user_input[CONF_RATE_BURST]
+            self._game_fetch_concurrency = user_input[CONF_GAME_FETCH_CONCURRENCY]
+            self._games_per_refresh = user_input[CONF_GAMES_PER_REFRESH]
+            self._achievement_batch_event = user_input[CONF_ACHIEVEMENT_BATCH_EVENT]
+            self._presence_probe_interval = user_input[CONF_PRESENCE_PROBE_INTERVAL]
+            self._profile_refreshes = user_input[CONF_PROFILE_REFRESHES]
+            if 0 < self._presence_probe_interval < MIN_PRESENCE_PROBE_INTERVAL:
+                return await self.async_step_manage(error="probe_interval_too_short")
             return self._save()
 
         options = {
@@ -324,6 +402,42 @@ class RetroAchievementsOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_GAMING_IDLE_THRESHOLD,
                 default=self._idle_threshold,
             ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=self._adaptive_polling,
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_MAX_POLL_INTERVAL,
+                default=self._max_poll_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+            vol.Optional(
+                CONF_RATE_LIMIT,
+                default=self._rate_limit,
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=50)),
+            vol.Optional(
+                CONF_RATE_BURST,
+                default=self._rate_burst,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+            vol.Optional(
+                CONF_GAME_FETCH_CONCURRENCY,
+                default=self._game_fetch_concurrency,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+            vol.Optional(
+                CONF_GAMES_PER_REFRESH,
+                default=self._games_per_refresh,
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=500)),
+            vol.Optional(
+                CONF_ACHIEVEMENT_BATCH_EVENT,
+                default=self._achievement_batch_event,
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_PRESENCE_PROBE_INTERVAL,
+                default=self._presence_probe_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+            vol.Optional(
+                CONF_PROFILE_REFRESHES,
+                default=self._profile_refreshes,
+            ): selector.BooleanSelector(),
         }
         return self.async_show_form(
             step_id="manage",
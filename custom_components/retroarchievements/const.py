@@ -20,6 +20,66 @@ PLATFORMS = [
 # API
 BASE_URL = "https://retroachievements.org/API/"
 
+# Response cache lifetime per endpoint (seconds). Endpoints not listed are
+# never cached, but identical concurrent calls still share one request.
+# GetGameExtended is left out: GameExtendedCache owns it, and a cached response
+# would hand stale sets back when a revised game is invalidated.
+API_CACHE_TTLS = {
+    "API_GetConsoleIDs.php": 24 * 60 * 60,
+    "API_GetGameList.php": 6 * 60 * 60,
+    "API_GetAchievementOfTheWeek.php": 10 * 60,
+    "API_GetTopTenUsers.php": 10 * 60,
+    "API_GetRecentGameAwards.php": 5 * 60,
+    "API_GetGameInfoAndUserProgress.php": 30,
+}
+API_CACHE_MAX_ENTRIES = 256
+# Game IDs per API_GetUserProgress request; the ID list travels in the query
+# string, so chunks keep URLs well under common length limits.
+USER_PROGRESS_CHUNK_SIZE = 50
+# API_GetUserCompletionProgress paging: games per page (the API maximum) and
+# how many pages are requested at once during a full walk.
+COMPLETION_PROGRESS_PAGE_SIZE = 500
+COMPLETION_PROGRESS_CONCURRENCY = 4
+# Response bodies at least this large (bytes) are decoded in the executor so
+# big payloads do not stall the event loop.
+API_JSON_EXECUTOR_THRESHOLD = 256 * 1024
+# Retries for timeouts, connection errors, 5xx and 429 responses. Delays grow
+# exponentially from the base with random jitter; a 429 Retry-After header
+# takes precedence. A call gives up once the next wait would exceed the budget.
+API_RETRY_ATTEMPTS = 3
+API_RETRY_BASE_DELAY = 1.0
+API_RETRY_MAX_DELAY = 10.0
+API_RETRY_BUDGET = 20.0
+# Latency samples kept per endpoint for the p50/p95/p99 metrics.
+API_METRICS_SAMPLES = 200
+# Endpoints polled by the coordinators, each with a diagnostic metrics sensor.
+API_METRIC_ENDPOINTS = (
+    "API_GetUserSummary.php",
+    "API_GetUserProfile.php",
+    "API_GetUserPoints.php",
+    "API_GetUserCompletionProgress.php",
+    "API_GetUserAwards.php",
+    "API_GetUserWantToPlayList.php",
+    "API_GetUsersIFollow.php",
+    "API_GetUsersFollowingMe.php",
+    "API_GetUserSetRequests.php",
+    "API_GetAchievementsEarnedOnDay.php",
+    "API_GetAchievementsEarnedBetween.php",
+    "API_GetUserProgress.php",
+    "API_GetUserGameLeaderboards.php",
+    "API_GetUserGameRankAndScore.php",
+    "API_GetGameExtended.php",
+    "API_GetAchievementOfTheWeek.php",
+    "API_GetTopTenUsers.php",
+    "API_GetRecentGameAwards.php",
+)
+
+# hass.data[DOMAIN] keys
+DATA_RESPONSE_CACHES = "response_caches"
+DATA_RATE_LIMITERS = "rate_limiters"
+DATA_API_METRICS = "api_metrics"
+DATA_GLOBAL_COORDINATOR = "global_coordinator"
+
 # Configuration
 CONF_USERNAME = "username"
 CONF_API_KEY = "api_key"
@@ -30,6 +90,53 @@ DEFAULT_NAME = "RetroAchievements"
 DEFAULT_SCAN_INTERVAL = 1  # minutes
 UPDATE_INTERVAL = 60  # seconds (1 minute in seconds)
 
+# Polling tiers. Fast endpoints are fetched on every refresh; medium and slow
+# endpoints are only refetched once their interval (seconds) has elapsed and
+# otherwise keep their last fetched value.
+TIER_FAST = "fast"
+TIER_MEDIUM = "medium"
+TIER_SLOW = "slow"
+TIER_INTERVALS = {
+    TIER_FAST: 0,
+    TIER_MEDIUM: 15 * 60,
+    TIER_SLOW: 60 * 60,
+}
+
+# Tier of every coordinator data key. "game_data" covers the per-game
+# Awarded / Leaderboards / RankScore sections.
+ENDPOINT_TIERS = {
+    "user_summary": TIER_FAST,
+    "game_data": TIER_FAST,
+    "earned_on_day": TIER_FAST,
+    "earned_between": TIER_FAST,
+    "user_points": TIER_MEDIUM,
+    "completion_progress": TIER_MEDIUM,
+    "awards": TIER_MEDIUM,
+    "want_to_play": TIER_MEDIUM,
+    "following": TIER_MEDIUM,
+    "followers": TIER_MEDIUM,
+    "aotw": TIER_SLOW,
+    "top_ten": TIER_SLOW,
+    "set_requests": TIER_SLOW,
+    "recent_game_awards": TIER_SLOW,
+}
+
+# Circuit breakers for optional endpoints (and per-game requests): after
+# this many consecutive failures the endpoint is skipped, then probed again
+# after a delay (seconds) that doubles on every failed probe up to the max.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BASE_DELAY = 120
+CIRCUIT_MAX_DELAY = 60 * 60
+
+# Completion progress is normally refreshed from its newest pages only; every
+# played game is walked again after this long (seconds) to pick up set
+# revisions that do not change a game's MostRecentAwardedDate.
+COMPLETION_PROGRESS_FULL_SYNC = 24 * 60 * 60
+
+# Site-wide (not per-user) data keys, fetched once for all config entries by
+# the global coordinator every slow-tier interval.
+GLOBAL_DATA_KEYS = ("aotw", "top_ten", "recent_game_awards")
+
 # Entity attributes
 ATTR_GAME_ID = "game_id"
 ATTR_GAME_TITLE = "game_title"
@@ -48,14 +155,49 @@ ATTRIBUTION = "Data provided by RetroAchievements"
 # Options
 CONF_GAMING_IDLE_THRESHOLD = "gaming_idle_threshold"
 DEFAULT_GAMING_IDLE_THRESHOLD = 5  # minutes
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MAX_POLL_INTERVAL = 15  # minutes
+CONF_RATE_LIMIT = "rate_limit"
+DEFAULT_RATE_LIMIT = 5.0  # requests per second, shared per API key
+CONF_RATE_BURST = "rate_burst"
+DEFAULT_RATE_BURST = 10  # requests allowed back to back before pacing
+CONF_GAME_FETCH_CONCURRENCY = "game_fetch_concurrency"
+DEFAULT_GAME_FETCH_CONCURRENCY = 8  # per-game requests in flight at once
+CONF_GAMES_PER_REFRESH = "games_per_refresh"
+DEFAULT_GAMES_PER_REFRESH = 0  # monitored games refreshed per cycle; 0 = all
+CONF_PRESENCE_PROBE_INTERVAL = "presence_probe_interval"
+DEFAULT_PRESENCE_PROBE_INTERVAL = 0  # seconds between presence probes; 0 = off
+MIN_PRESENCE_PROBE_INTERVAL = 30  # shortest probe interval when enabled
+CONF_ACHIEVEMENT_BATCH_EVENT = "achievement_batch_event"
+DEFAULT_ACHIEVEMENT_BATCH_EVENT = False
+CONF_PROFILE_REFRESHES = "profile_refreshes"
+DEFAULT_PROFILE_REFRESHES = False
 
 # Number of trailing days of unlock history exposed via the calendar entity.
 EARNED_HISTORY_DAYS = 14
 
+# Storage
+STORAGE_VERSION = 1
+
+# GetGameExtended cache bounds and how long to batch writes to disk (seconds).
+GAME_EXTENDED_CACHE_MAX_ENTRIES = 200
+GAME_EXTENDED_CACHE_MAX_BYTES = 2 * 1024 * 1024
+GAME_EXTENDED_CACHE_SAVE_DELAY = 30
+
+# How long to batch coordinator snapshot writes to disk (seconds).
+SNAPSHOT_SAVE_DELAY = 60
+
 # Services
 SERVICE_REFRESH = "refresh"
+SERVICE_GET_REFRESH_PROFILE = "get_refresh_profile"
+
+# Refreshes kept by the refresh profiler when profile_refreshes is enabled.
+REFRESH_PROFILE_HISTORY = 20
 
 # Events
 EVENT_ACHIEVEMENT_UNLOCKED = f"{DOMAIN}_achievement_unlocked"
+EVENT_ACHIEVEMENT_BATCH = f"{DOMAIN}_achievement_batch"
 EVENT_AOTW_CHANGED = f"{DOMAIN}_aotw_changed"
 EVENT_AWARD_EARNED = f"{DOMAIN}_award_earned"
@@ -3,28 +3,251 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .api import RetroAchievementsApiClient
+from .breaker import CircuitBreaker
+from .cache import GameExtendedCache, game_extended_store_key
 from .const import (
+    COMPLETION_PROGRESS_CONCURRENCY,
+    COMPLETION_PROGRESS_FULL_SYNC,
+    CONF_ACHIEVEMENT_BATCH_EVENT,
+    CONF_ADAPTIVE_POLLING,
+    CONF_GAME_FETCH_CONCURRENCY,
+    CONF_GAMES_PER_REFRESH,
     CONF_GAMING_IDLE_THRESHOLD,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_PRESENCE_PROBE_INTERVAL,
+    CONF_PROFILE_REFRESHES,
+    DEFAULT_ACHIEVEMENT_BATCH_EVENT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_GAME_FETCH_CONCURRENCY,
+    DEFAULT_GAMES_PER_REFRESH,
     DEFAULT_GAMING_IDLE_THRESHOLD,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_PRESENCE_PROBE_INTERVAL,
+    DEFAULT_PROFILE_REFRESHES,
     DOMAIN,
     EARNED_HISTORY_DAYS,
+    ENDPOINT_TIERS,
+    EVENT_ACHIEVEMENT_BATCH,
     EVENT_ACHIEVEMENT_UNLOCKED,
     EVENT_AOTW_CHANGED,
     EVENT_AWARD_EARNED,
+    GLOBAL_DATA_KEYS,
     LOGGER,
+    MIN_PRESENCE_PROBE_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    TIER_INTERVALS,
+    TIER_MEDIUM,
+    TIER_SLOW,
     UPDATE_INTERVAL,
+    USER_PROGRESS_CHUNK_SIZE,
 )
+from .profiler import RefreshProfiler
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
 
-class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
+
+def snapshot_store_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's coordinator snapshot."""
+    return f"{DOMAIN}.{entry_id}.snapshot"
+
+
+@dataclass(slots=True)
+class RecentAchievementsIndex:
+    """
+    Flattened view of a RecentAchievements payload, built once per refresh.
+
+    unlocks is newest first; by_id maps an achievement ID to its payload and
+    game ID; by_game holds each game's unlocks in payload order.
+    """
+
+    source: dict = field(default_factory=dict)
+    unlocks: list[dict] = field(default_factory=list)
+    by_id: dict[int, tuple[dict, int | None]] = field(default_factory=dict)
+    by_game: dict[str, list[dict]] = field(default_factory=dict)
+
+    @property
+    def latest(self) -> dict | None:
+        """Return the most recent unlock, or None."""
+        return self.unlocks[0] if self.unlocks else None
+
+    @classmethod
+    def build(cls, recent: dict) -> RecentAchievementsIndex:
+        """Index a RecentAchievements map of game ID -> achievement ID -> payload."""
+        index = cls(source=recent)
+        for game_id, achievements in (recent or {}).items():
+            if not isinstance(achievements, dict):
+                continue
+            try:
+                game_id_int: int | None = int(game_id)
+            except (TypeError, ValueError):
+                game_id_int = None
+            bucket = index.by_game.setdefault(str(game_id), [])
+            for ach_id, achievement in achievements.items():
+                if not isinstance(achievement, dict):
+                    continue
+                bucket.append(achievement)
+                index.unlocks.append(achievement)
+                try:
+                    index.by_id[int(ach_id)] = (achievement, game_id_int)
+                except (TypeError, ValueError):
+                    continue
+        # Stable sort: unlocks sharing a timestamp keep payload order.
+        index.unlocks.sort(key=lambda a: str(a.get("DateAwarded", "")), reverse=True)
+        return index
+
+
+# Circuit breaker label of each optional endpoint, by coordinator data key.
+_ENDPOINT_BREAKERS = {
+    "aotw": "Achievement of the Week",
+    "user_points": "user points",
+    "completion_progress": "completion progress",
+    "awards": "user awards",
+    "want_to_play": "want to play list",
+    "top_ten": "top ten users",
+    "following": "users i follow",
+    "followers": "users following me",
+    "set_requests": "set requests",
+    "earned_on_day": "achievements earned on day",
+    "recent_game_awards": "recent game awards",
+}
+
+
+def _fingerprint(value: Any) -> int:
+    """Return a cheap fingerprint of a JSON-like coordinator data section."""
+    return hash(json_bytes(value))
+
+
+class RetroAchievementsBaseCoordinator(DataUpdateCoordinator):
+    """Shared fetch and event helpers for the RetroAchievements coordinators."""
+
+    breakers: dict[str, CircuitBreaker]
+
+    def _breaker(self, key: str) -> CircuitBreaker:
+        """Return the circuit breaker for key, creating it on first use."""
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = self.breakers[key] = CircuitBreaker()
+        return breaker
+
+    async def _safe_get_aotw(self) -> dict:
+        """Fetch AOTW; return empty dict on error so refresh continues."""
+        return await self._safe_get(
+            self.api_client.async_get_achievement_of_the_week,
+            _ENDPOINT_BREAKERS["aotw"],
+        )
+
+    async def _safe_get(self, coro_factory, label: str) -> dict:
+        """Await coro_factory(); return {} on error so refresh continues."""
+        return await self._guarded_get(coro_factory, label, dict)
+
+    async def _safe_get_list(self, coro_factory, label: str) -> list:
+        """Await coro_factory(); return [] on error so refresh continues."""
+        return await self._guarded_get(coro_factory, label, list)
+
+    async def _guarded_get(self, coro_factory, label: str, kind: type) -> Any:
+        """
+        Await coro_factory() behind the label's circuit breaker.
+
+        Returns an empty kind() on error, on a payload of the wrong type, or
+        without calling the endpoint at all while its breaker is open.
+        """
+        breaker = self._breaker(label)
+        if not breaker.allow():
+            LOGGER.debug("Skipping %s until %s", label, breaker.next_probe)
+            return kind()
+        try:
+            data = await coro_factory()
+        except Exception as err:  # pylint: disable=broad-except
+            self._record_failure(breaker, label, err)
+            return kind()
+        breaker.record_success()
+        return data if isinstance(data, kind) else kind()
+
+    def _keeps_last(self, key: str, last: dict) -> bool:
+        """Return True if key is an optional endpoint with a last value."""
+        return key in _ENDPOINT_BREAKERS and key in last
+
+    async def _gather_optional(
+        self, fetchers: dict[str, Callable[[], Awaitable]], last: dict
+    ) -> dict:
+        """
+        Await fetchers concurrently and return their results by key.
+
+        An optional endpoint that already has a value in last is not called
+        while its circuit breaker is open, and is left out of the result when
+        it fails, so it keeps its last value instead of going empty.
+        """
+        keys = [
+            key
+            for key in fetchers
+            if not self._keeps_last(key, last)
+            or self._breaker(_ENDPOINT_BREAKERS[key]).allow()
+        ]
+        results = await asyncio.gather(*(fetchers[key]() for key in keys))
+        return {
+            key: result
+            for key, result in zip(keys, results, strict=True)
+            if not self._keeps_last(key, last)
+            or not self.breakers[_ENDPOINT_BREAKERS[key]].failures
+        }
+
+    @staticmethod
+    def _record_failure(breaker: CircuitBreaker, label: str, err: Exception) -> None:
+        """Count a failed call and log it, noting when the breaker opens."""
+        breaker.record_failure(err)
+        if breaker.next_probe is None:
+            LOGGER.warning("Failed to fetch %s: %s", label, err)
+        else:
+            LOGGER.warning(
+                "Failed to fetch %s %s times in a row, next try at %s: %s",
+                label,
+                breaker.failures,
+                breaker.next_probe,
+                err,
+            )
+
+    def _fire_aotw_changed(self, aotw: dict) -> None:
+        """Fire the aotw_changed event."""
+        ach = aotw.get("Achievement", {}) or {}
+        game = aotw.get("Game", {}) or {}
+        badge = ach.get("BadgeName")
+        self.hass.bus.async_fire(
+            EVENT_AOTW_CHANGED,
+            {
+                "achievement_id": ach.get("ID"),
+                "title": ach.get("Title"),
+                "description": ach.get("Description"),
+                "points": ach.get("Points"),
+                "badge_url": (
+                    f"https://retroachievements.org/Badge/{badge}.png"
+                    if badge
+                    else None
+                ),
+                "game_id": game.get("ID"),
+                "game_title": game.get("Title"),
+                "console_name": game.get("ConsoleName"),
+                "week_start": aotw.get("StartAt"),
+                "author": ach.get("Author"),
+            },
+        )
+
+
+class RetroAchievementsDataUpdateCoordinator(RetroAchievementsBaseCoordinator):
     """Class to manage fetching RetroAchievements data."""
 
     def __init__(
@@ -33,19 +256,76 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
         api_client: RetroAchievementsApiClient,
         entry: ConfigEntry,
         update_interval: int = UPDATE_INTERVAL,
+        global_coordinator: RetroAchievementsGlobalDataUpdateCoordinator | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self.api_client = api_client
         self.entry = entry
+        self.global_coordinator = global_coordinator
         self.monitored_games: set[int] = set()
         self._previous_achievement_ids: set[int] = set()
         self._previous_aotw_id: int | None = None
         self._previous_award_keys: set[str] = set()
-        self._game_extended_cache: dict[int, dict] = {}
+        self._award_index: dict[str, dict] = {}
+        self._award_index_source: dict | None = None
+        self.breakers = {}
+        self._game_extended_cache = GameExtendedCache(
+            hass, game_extended_store_key(entry.entry_id)
+        )
+        self._snapshot_store: Store[dict] = Store(
+            hass, STORAGE_VERSION, snapshot_store_key(entry.entry_id)
+        )
         self._first_run: bool = True
-        self._idle_threshold_minutes: int = (entry.options or {}).get(
+        self._endpoint_data: dict = {}
+        self._tier_last_refresh: dict[str, datetime] = {}
+        self._unlock_log: dict[str, dict] = {}
+        self._unlock_log_synced_on: date | None = None
+        self._completion_games: dict[str, dict] = {}
+        self._completion_total: int | None = None
+        self._completion_synced_at: datetime | None = None
+        options = entry.options or {}
+        self._idle_threshold_minutes: int = options.get(
             CONF_GAMING_IDLE_THRESHOLD, DEFAULT_GAMING_IDLE_THRESHOLD
         )
+        self._adaptive_polling: bool = options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._achievement_batch_event: bool = options.get(
+            CONF_ACHIEVEMENT_BATCH_EVENT, DEFAULT_ACHIEVEMENT_BATCH_EVENT
+        )
+        self._activity_source: dict | None = None
+        self._activity_at: datetime | None = None
+        self._presence_probe_interval: int = options.get(
+            CONF_PRESENCE_PROBE_INTERVAL, DEFAULT_PRESENCE_PROBE_INTERVAL
+        )
+        self._last_presence: tuple | None = None
+        self.profiler = RefreshProfiler(
+            enabled=options.get(CONF_PROFILE_REFRESHES, DEFAULT_PROFILE_REFRESHES)
+        )
+        self._base_update_interval = timedelta(seconds=update_interval)
+        self._max_update_interval = max(
+            timedelta(
+                minutes=options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+            ),
+            self._base_update_interval,
+        )
+        self._previous_last_activity: datetime | None = None
+        self._game_fetch_semaphore = asyncio.Semaphore(
+            options.get(CONF_GAME_FETCH_CONCURRENCY, DEFAULT_GAME_FETCH_CONCURRENCY)
+        )
+        self._games_per_refresh: int = options.get(
+            CONF_GAMES_PER_REFRESH, DEFAULT_GAMES_PER_REFRESH
+        )
+        self._game_cursor = 0
+        self._fetched_games: set[int] = set()
+        self._priority_games: set[int] = set()
+        self._recent_game_stamps: dict[int, str] = {}
+        self._section_fingerprints: dict[str, int] = {}
+        self._prefetched_game_id: int | None = None
+        self._recent_index = RecentAchievementsIndex()
+        # Top-level data keys that changed in the last update; None means
+        # unknown, so every entity writes its state.
+        self.changed_sections: frozenset[str] | None = None
 
         super().__init__(
             hass,
@@ -54,41 +334,140 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval),
         )
 
-    @staticmethod
-    def _extract_achievement_ids(user_summary: dict) -> set[int]:
-        """Return set of achievement IDs across all games in RecentAchievements."""
-        ids: set[int] = set()
-        for _game_id, achievements in (
-            (user_summary or {}).get("RecentAchievements") or {}
-        ).items():
-            for ach_id in achievements or {}:
-                try:
-                    ids.add(int(ach_id))
-                except (TypeError, ValueError):
-                    continue
-        return ids
+    @property
+    def recent_index(self) -> RecentAchievementsIndex:
+        """Return the index of data["RecentAchievements"], rebuilt on change."""
+        return self._index_recent((self.data or {}).get("RecentAchievements") or {})
+
+    def _index_recent(self, recent: dict) -> RecentAchievementsIndex:
+        """Return the index of recent, reusing the last one for the same payload."""
+        if self._recent_index.source is not recent:
+            self._recent_index = RecentAchievementsIndex.build(recent)
+        return self._recent_index
 
     @staticmethod
-    def _find_achievement(
-        ach_id: int, user_summary: dict
-    ) -> tuple[dict | None, int | None]:
-        """Locate achievement payload and its game_id in RecentAchievements."""
-        for game_id, achievements in (
-            (user_summary or {}).get("RecentAchievements") or {}
-        ).items():
-            if not isinstance(achievements, dict):
-                continue
-            if str(ach_id) in achievements:
-                try:
-                    return achievements[str(ach_id)], int(game_id)
-                except (TypeError, ValueError):
-                    return achievements[str(ach_id)], None
-            if ach_id in achievements:
-                try:
-                    return achievements[ach_id], int(game_id)
-                except (TypeError, ValueError):
-                    return achievements[ach_id], None
-        return None, None
+    def _parse_last_activity(user_summary: dict) -> datetime | None:
+        """Parse the user summary's LastActivity timestamp as an aware datetime."""
+        last_activity = (user_summary or {}).get("LastActivity") or {}
+        ts = last_activity.get("timestamp") or last_activity.get("lastupdate")
+        if not ts:
+            return None
+        try:
+            normalized = ts.replace("Z", "+00:00").replace(" ", "T")
+            last = datetime.fromisoformat(normalized)
+        except (ValueError, AttributeError):
+            return None
+        if last.tzinfo is None:
+            last = last.replace(tzinfo=UTC)
+        return last
+
+    def _last_activity(self, user_summary: dict) -> datetime | None:
+        """Return the summary's parsed LastActivity, parsing each summary once."""
+        if user_summary is not self._activity_source:
+            self._activity_source = user_summary
+            self._activity_at = self._parse_last_activity(user_summary)
+        return self._activity_at
+
+    def _gaming_until(self, user_summary: dict) -> datetime | None:
+        """Return when the summary's gaming session goes idle, None if not gaming."""
+        rich = ((user_summary or {}).get("RichPresenceMsg") or "").strip()
+        status = (user_summary or {}).get("Status", "")
+        if not rich or status != "Online":
+            return None
+        last = self._last_activity(user_summary)
+        if last is None:
+            return None
+        return last + timedelta(minutes=self._idle_threshold_minutes)
+
+    def _is_gaming(self, user_summary: dict) -> bool:
+        """Return True if the summary shows fresh rich presence while Online."""
+        until = self._gaming_until(user_summary)
+        return until is not None and datetime.now(UTC) < until
+
+    @property
+    def gaming_until(self) -> datetime | None:
+        """Return when the current gaming session goes idle, None if not gaming."""
+        return self._gaming_until((self.data or {}).get("user_summary") or {})
+
+    def is_gaming(self) -> bool:
+        """Return True while the user is actively gaming."""
+        return self._is_gaming((self.data or {}).get("user_summary") or {})
+
+    @callback
+    def async_start_presence_probe(self) -> Callable[[], None] | None:
+        """Start the presence probe if enabled; return its unsubscribe callback."""
+        if self._presence_probe_interval <= 0:
+            return None
+        return async_track_time_interval(
+            self.hass,
+            self.async_probe_presence,
+            timedelta(
+                seconds=max(self._presence_probe_interval, MIN_PRESENCE_PROBE_INTERVAL)
+            ),
+            name=f"{DOMAIN} presence probe",
+        )
+
+    async def async_probe_presence(self, _now: datetime | None = None) -> None:
+        """
+        Poll the small user profile endpoint for presence changes.
+
+        A change in rich presence, current game or its timestamp is patched
+        into user_summary so is_gaming and rich_presence update at once, and
+        a regular refresh is requested to pick up everything else.
+        """
+        if not self.data:
+            return
+        try:
+            profile = await self.api_client.async_get_user_profile()
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.debug("Presence probe failed: %s", err)
+            return
+        presence = (
+            profile.get("RichPresenceMsg"),
+            profile.get("LastGameID"),
+            profile.get("RichPresenceMsgDate"),
+        )
+        previous, self._last_presence = self._last_presence, presence
+        if previous is None or presence == previous:
+            return
+
+        rich_presence, last_game_id, presence_date = presence
+        summary = dict(self.data.get("user_summary") or {})
+        summary["RichPresenceMsg"] = rich_presence
+        if last_game_id:
+            summary["LastGameID"] = last_game_id
+        if presence_date:
+            summary["Status"] = "Online"
+            summary["LastActivity"] = {
+                **(summary.get("LastActivity") or {}),
+                "timestamp": presence_date,
+                "lastupdate": presence_date,
+            }
+        self.data = {**self.data, "user_summary": summary}
+        self._track_changes(self.data)
+        self.async_update_listeners()
+        await self.async_request_refresh()
+
+    def _adapt_update_interval(self, user_summary: dict) -> None:
+        """
+        Poll fast while the user is active and back off while idle.
+
+        Activity is either an active gaming session or a LastActivity change
+        since the previous refresh. Each idle refresh doubles the interval up
+        to the configured ceiling; activity snaps it back to the base interval.
+        """
+        last_activity = self._last_activity(user_summary)
+        activity_changed = last_activity != self._previous_last_activity
+        self._previous_last_activity = last_activity
+        if not self._adaptive_polling:
+            return
+        if activity_changed or self._is_gaming(user_summary):
+            self.update_interval = self._base_update_interval
+            return
+        self.update_interval = min(
+            (self.update_interval or self._base_update_interval) * 2,
+            self._max_update_interval,
+        )
 
     def _build_enriched_payload(self, ach: dict, game_id: int, game_ext: dict) -> dict:
         """Build the enriched event payload for an unlocked achievement."""
@@ -127,80 +506,180 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
             "username": self.api_client.username,
         }
 
-    async def _get_cached_game_extended(self, game_id: int) -> dict:
+    async def async_load_cache(self) -> None:
+        """Restore the persisted GetGameExtended cache."""
+        await self._game_extended_cache.async_load()
+
+    async def async_restore_snapshot(self) -> bool:
         """
-        Return cached GetGameExtended response for game_id, fetching once.
+        Restore the last good data and event baselines saved to disk.
 
-        Cached for the coordinator's lifetime — GetGameExtended metadata
-        (game title, console, achievement definitions) is immutable per game_id.
-        Cleared only on HA restart / integration reload.
+        Returns True when a snapshot was restored, so setup can expose the
+        last-known state and run the live refresh in the background.
         """
-        if game_id in self._game_extended_cache:
-            return self._game_extended_cache[game_id]
+        try:
+            snapshot = await self._snapshot_store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to load coordinator snapshot: %s", err)
+            return False
+        if not isinstance(snapshot, dict) or not isinstance(snapshot.get("data"), dict):
+            return False
+        self.data = snapshot["data"]
+        self._track_changes(self.data)
+        self.changed_sections = None
+        self._previous_achievement_ids = {
+            int(ach_id) for ach_id in snapshot.get("achievement_ids") or []
+        }
+        self._previous_award_keys = set(snapshot.get("award_keys") or [])
+        self._previous_aotw_id = snapshot.get("aotw_id")
+        if self.global_coordinator is not None:
+            self.global_coordinator.seed_aotw_baseline(self._previous_aotw_id)
+        self._first_run = False
+        return True
+
+    def _event_baselines(self) -> tuple:
+        """Return the event baselines stored alongside the snapshot data."""
+        return (
+            frozenset(self._previous_achievement_ids),
+            frozenset(self._previous_award_keys),
+            self._previous_aotw_id,
+        )
+
+    def _schedule_snapshot_save(self, baselines: tuple) -> None:
+        """
+        Save the snapshot if the data or the event baselines changed.
+
+        An unchanged refresh skips the write, sparing SD-card hosts a full
+        rewrite every minute. The save runs after the returned data is
+        stored on the coordinator.
+        """
+        if self.changed_sections or self._event_baselines() != baselines:
+            self._snapshot_store.async_delay_save(
+                self._snapshot_to_save, SNAPSHOT_SAVE_DELAY
+            )
+
+    async def async_save_snapshot(self) -> None:
+        """
+        Write the snapshot now, replacing any pending delayed save.
+
+        Runs when the entry unloads: a reload within SNAPSHOT_SAVE_DELAY of an
+        unlock would otherwise restore the older baselines and fire the same
+        events again.
+        """
+        if self.data is not None:
+            await self._snapshot_store.async_save(self._snapshot_to_save())
+
+    def _snapshot_to_save(self) -> dict:
+        return {
+            "data": self.data,
+            "achievement_ids": sorted(self._previous_achievement_ids),
+            "award_keys": sorted(self._previous_award_keys),
+            "aotw_id": self._previous_aotw_id,
+        }
+
+    async def _get_cached_game_extended(self, game_id: int, *ach_ids: int) -> dict:
+        """
+        Return cached GetGameExtended metadata for game_id, fetching on a miss.
+
+        The cache survives restarts. An entry that does not know every one of
+        ach_ids is treated as a revised set and refetched.
+        """
+        cached = self._game_extended_cache.get(game_id)
+        if cached is not None and all(
+            str(ach_id) in (cached.get("Achievements") or {}) for ach_id in ach_ids
+        ):
+            return cached
         try:
             data = await self.api_client.async_get_game_extended(game_id)
-            if isinstance(data, dict):
-                self._game_extended_cache[game_id] = data
-                return data
+            if isinstance(data, dict) and data:
+                return self._game_extended_cache.set(game_id, data)
         except Exception as err:  # pylint: disable=broad-except
             LOGGER.warning(
                 "Failed to fetch GetGameExtended for game_id=%s: %s", game_id, err
             )
-        return {}
+        return cached or {}
 
-    async def _safe_get_aotw(self) -> dict:
-        """Fetch AOTW; return empty dict on error so refresh continues."""
+    @staticmethod
+    def _current_game_id(user_summary: dict) -> int | None:
+        """Return the game the user is playing or played last, if known."""
+        summary = user_summary or {}
+        game_id = summary.get("LastGameID")
+        if not game_id:
+            recently_played = summary.get("RecentlyPlayed") or []
+            if recently_played and isinstance(recently_played[0], dict):
+                game_id = recently_played[0].get("GameID")
         try:
-            data = await self.api_client.async_get_achievement_of_the_week()
-            return data if isinstance(data, dict) else {}
-        except Exception as err:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to fetch Achievement of the Week: %s", err)
-            return {}
+            return int(game_id) if game_id else None
+        except (TypeError, ValueError):
+            return None
 
-    async def _safe_get(self, coro_factory, label: str) -> dict:
-        """Await coro_factory(); return {} on error so refresh continues."""
-        try:
-            data = await coro_factory()
-            return data if isinstance(data, dict) else {}
-        except Exception as err:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to fetch %s: %s", label, err)
-            return {}
+    def _prefetch_current_game(self, user_summary: dict) -> None:
+        """
+        Warm the GetGameExtended cache when the user switches games.
 
-    async def _safe_get_list(self, coro_factory, label: str) -> list:
-        """Await coro_factory(); return [] on error so refresh continues."""
-        try:
-            data = await coro_factory()
-            return data if isinstance(data, list) else []
-        except Exception as err:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to fetch %s: %s", label, err)
-            return []
+        The fetch runs in the background so the first unlock in a new game is
+        enriched from the cache instead of waiting on a round trip.
+        """
+        game_id = self._current_game_id(user_summary)
+        if game_id is None or game_id == self._prefetched_game_id:
+            return
+        self._prefetched_game_id = game_id
+        if game_id in self._game_extended_cache:
+            return
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_prefetch_game(game_id),
+            f"{DOMAIN} prefetch game {game_id}",
+        )
 
-    @staticmethod
-    def _extract_award_keys(awards: dict) -> set[str]:
-        """Build a set of stable keys for the user's visible awards."""
-        keys: set[str] = set()
-        for award in (awards or {}).get("VisibleUserAwards") or []:
-            if not isinstance(award, dict):
+    async def _async_prefetch_game(self, game_id: int) -> None:
+        """Fetch game_id into the cache, allowing a retry if that failed."""
+        await self._get_cached_game_extended(game_id)
+        if (
+            game_id not in self._game_extended_cache
+            and game_id == self._prefetched_game_id
+        ):
+            self._prefetched_game_id = None
+
+    def _invalidate_revised_games(self, user_summary: dict) -> None:
+        """Drop cached sets whose achievement count no longer matches upstream."""
+        for game in (user_summary or {}).get("RecentlyPlayed") or []:
+            if not isinstance(game, dict):
                 continue
-            keys.add(
-                f"{award.get('AwardType')}:{award.get('AwardData')}:"
-                f"{award.get('AwardDataExtra')}"
-            )
-        return keys
+            game_id = game.get("GameID")
+            total = game.get("AchievementsTotal")
+            if game_id is None or total is None:
+                continue
+            revision = self._game_extended_cache.revision(game_id)
+            if revision is not None and revision != total:
+                self._game_extended_cache.invalidate(game_id)
+                if game_id == self._prefetched_game_id:
+                    self._prefetched_game_id = None  # warm the revised set again
 
     @staticmethod
-    def _find_award(award_key: str, awards: dict) -> dict | None:
-        """Locate the award payload matching award_key."""
-        for award in (awards or {}).get("VisibleUserAwards") or []:
-            if not isinstance(award, dict):
-                continue
-            key = (
-                f"{award.get('AwardType')}:{award.get('AwardData')}:"
-                f"{award.get('AwardDataExtra')}"
-            )
-            if key == award_key:
-                return award
-        return None
+    def _award_key(award: dict) -> str:
+        """Return the stable key identifying a visible award."""
+        return (
+            f"{award.get('AwardType')}:{award.get('AwardData')}:"
+            f"{award.get('AwardDataExtra')}"
+        )
+
+    @classmethod
+    def _index_awards(cls, awards: dict) -> dict[str, dict]:
+        """Map each visible award's stable key to its payload in one pass."""
+        return {
+            cls._award_key(award): award
+            for award in (awards or {}).get("VisibleUserAwards") or []
+            if isinstance(award, dict)
+        }
+
+    def _index_awards_cached(self, awards: dict) -> dict[str, dict]:
+        """Return the award index, reusing it while the payload is unchanged."""
+        # Awards are on the medium tier, so most cycles see the same object.
+        if awards is not self._award_index_source:
+            self._award_index = self._index_awards(awards)
+            self._award_index_source = awards
+        return self._award_index
 
     def _fire_award_earned(self, award: dict) -> None:
         """Fire the award_earned event for a newly earned award."""
@@ -220,163 +699,360 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
             },
         )
 
-    async def _async_update_data(self) -> dict:
+    def _endpoint_fetchers(self, now: datetime) -> dict[str, Callable[[], Awaitable]]:
+        """Return a coroutine factory for every coordinator data key."""
+        today = now.strftime("%Y-%m-%d")
+        client = self.api_client
+        labels = _ENDPOINT_BREAKERS
+        return {
+            "user_summary": client.async_get_user_summary,
+            "game_data": self._get_game_data,
+            "aotw": self._safe_get_aotw,
+            "user_points": lambda: self._safe_get(
+                client.async_get_user_points, labels["user_points"]
+            ),
+            "completion_progress": lambda: self._safe_get(
+                self._get_completion_progress, labels["completion_progress"]
+            ),
+            "awards": lambda: self._safe_get(
+                client.async_get_user_awards, labels["awards"]
+            ),
+            "want_to_play": lambda: self._safe_get(
+                client.async_get_user_want_to_play_list, labels["want_to_play"]
+            ),
+            "top_ten": lambda: self._safe_get_list(
+                client.async_get_top_ten_users, labels["top_ten"]
+            ),
+            "following": lambda: self._safe_get(
+                client.async_get_users_i_follow, labels["following"]
+            ),
+            "followers": lambda: self._safe_get(
+                client.async_get_users_following_me, labels["followers"]
+            ),
+            "set_requests": lambda: self._safe_get(
+                client.async_get_user_set_requests, labels["set_requests"]
+            ),
+            "earned_on_day": lambda: self._safe_get_list(
+                lambda: client.async_get_achievements_earned_on_day(today),
+                labels["earned_on_day"],
+            ),
+            "recent_game_awards": lambda: self._safe_get(
+                client.async_get_recent_game_awards, labels["recent_game_awards"]
+            ),
+            "earned_between": lambda: self._get_earned_between(now),
+        }
+
+    async def _get_completion_progress(self) -> dict:
+        """
+        Return the played-game Total and the progress of every played game.
+
+        Pages come most recently awarded first, so a game with new unlocks
+        sorts ahead of every unchanged one: pages are walked only until one
+        ends at or before the newest award already folded in. Every page is
+        walked again on startup, when Total changes (a game was started or
+        reset) and every COMPLETION_PROGRESS_FULL_SYNC seconds.
+        """
+        now = dt_util.utcnow()
+        synced_at = self._completion_synced_at
+        full = (
+            synced_at is None
+            or (now - synced_at).total_seconds() >= COMPLETION_PROGRESS_FULL_SYNC
+        )
+        games = {} if full else dict(self._completion_games)
+        watermark = max(
+            (str(game.get("MostRecentAwardedDate") or "") for game in games.values()),
+            default="",
+        )
+        total = self._completion_total
+        pages = self.api_client.async_iter_user_completion_progress(
+            concurrency=COMPLETION_PROGRESS_CONCURRENCY if full else 1
+        )
+        async for page in pages:
+            if not full and page.get("Total") != self._completion_total:
+                await pages.aclose()
+                self._completion_synced_at = None
+                return await self._get_completion_progress()
+            total = page.get("Total")
+            results = [
+                game for game in page.get("Results") or [] if isinstance(game, dict)
+            ]
+            for game in results:
+                games[str(game.get("GameID"))] = game
+            if (
+                not full
+                and results
+                and str(results[-1].get("MostRecentAwardedDate") or "") <= watermark
+            ):
+                await pages.aclose()
+                break
+        self._completion_games = games
+        self._completion_total = total
+        if full:
+            self._completion_synced_at = now
+        return {"Total": total if total is not None else len(games), "Games": games}
+
+    @staticmethod
+    def _unlock_date(unlock: dict) -> str:
+        """Return the unlock timestamp string used for ordering and eviction."""
+        return str(unlock.get("Date") or unlock.get("DateAwarded") or "")
+
+    async def _get_earned_between(self, now: datetime) -> list:
+        """
+        Return the rolling unlock log for the last EARNED_HISTORY_DAYS.
+
+        Only unlocks since the previous sync are requested (starting a day
+        early to absorb timezone skew) and merged into the log; entries older
+        than the window are evicted. The whole window is resynced on startup,
+        after a failed sync, or when the last sync is older than the window.
+        """
+        today = now.date()
+        history_start = today - timedelta(days=EARNED_HISTORY_DAYS)
+        synced_on = self._unlock_log_synced_on
+        full_resync = synced_on is None or synced_on < history_start
+        from_date = history_start if full_resync else synced_on - timedelta(days=1)
         try:
-            now = dt_util.now()
-            today = now.strftime("%Y-%m-%d")
-            history_start = (now - timedelta(days=EARNED_HISTORY_DAYS)).strftime(
-                "%Y-%m-%d"
+            unlocks = await self.api_client.async_get_achievements_earned_between(
+                from_date.isoformat(), today.isoformat()
             )
-            (
-                user_summary,
-                game_data,
-                aotw,
-                user_points,
-                completion_progress,
-                awards,
-                want_to_play,
-                top_ten,
-                following,
-                followers,
-                set_requests,
-                earned_on_day,
-                recent_game_awards,
-                earned_between,
-            ) = await asyncio.gather(
-                self.api_client.async_get_user_summary(),
-                self._get_game_data(),
-                self._safe_get_aotw(),
-                self._safe_get(self.api_client.async_get_user_points, "user points"),
-                self._safe_get(
-                    self.api_client.async_get_user_completion_progress,
-                    "completion progress",
-                ),
-                self._safe_get(self.api_client.async_get_user_awards, "user awards"),
-                self._safe_get(
-                    self.api_client.async_get_user_want_to_play_list,
-                    "want to play list",
-                ),
-                self._safe_get_list(
-                    self.api_client.async_get_top_ten_users, "top ten users"
-                ),
-                self._safe_get(
-                    self.api_client.async_get_users_i_follow, "users i follow"
-                ),
-                self._safe_get(
-                    self.api_client.async_get_users_following_me, "users following me"
-                ),
-                self._safe_get(
-                    self.api_client.async_get_user_set_requests, "set requests"
-                ),
-                self._safe_get_list(
-                    lambda: self.api_client.async_get_achievements_earned_on_day(today),
-                    "achievements earned on day",
-                ),
-                self._safe_get(
-                    self.api_client.async_get_recent_game_awards, "recent game awards"
-                ),
-                self._safe_get_list(
-                    lambda: self.api_client.async_get_achievements_earned_between(
-                        history_start, today
-                    ),
-                    "achievements earned between",
-                ),
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to fetch achievements earned between: %s", err)
+            self._unlock_log_synced_on = None
+            return sorted(self._unlock_log.values(), key=self._unlock_date)
+
+        if full_resync:
+            self._unlock_log = {}
+        for unlock in unlocks if isinstance(unlocks, list) else []:
+            if isinstance(unlock, dict):
+                key = f"{unlock.get('ID')}:{unlock.get('HardcoreMode')}"
+                self._unlock_log[key] = unlock
+        if not full_resync:
+            # A full resync is already bounded to the window by the API.
+            cutoff = history_start.isoformat()
+            self._unlock_log = {
+                key: unlock
+                for key, unlock in self._unlock_log.items()
+                if not self._unlock_date(unlock) or self._unlock_date(unlock) >= cutoff
+            }
+        self._unlock_log_synced_on = today
+        return sorted(self._unlock_log.values(), key=self._unlock_date)
+
+    def _due_tiers(self, now: datetime) -> set[str]:
+        """Return the polling tiers whose interval has elapsed."""
+        due: set[str] = set()
+        for tier, interval in TIER_INTERVALS.items():
+            last = self._tier_last_refresh.get(tier)
+            if last is None or (now - last).total_seconds() >= interval:
+                due.add(tier)
+        return due
+
+    async def async_request_full_refresh(self) -> None:
+        """Request a refresh that refetches every tier, not only the due ones."""
+        self._tier_last_refresh.clear()
+        if self.global_coordinator is not None:
+            await self.global_coordinator.async_request_refresh()
+        await self.async_request_refresh()
+
+    def _track_changes(self, data: dict) -> None:
+        """Record which top-level sections of data differ from the last update."""
+        fingerprints = {key: _fingerprint(value) for key, value in data.items()}
+        previous = self._section_fingerprints
+        self.changed_sections = frozenset(
+            key
+            for key in fingerprints.keys() | previous.keys()
+            if fingerprints.get(key) != previous.get(key)
+        )
+        self._section_fingerprints = fingerprints
+
+    def _global_data(self) -> dict:
+        """Return site-wide data from the global coordinator or the last known."""
+        shared = self.global_coordinator.data or {}
+        previous = self.data or {}
+        return {
+            key: shared.get(key, previous.get(key, [] if key == "top_ten" else {}))
+            for key in GLOBAL_DATA_KEYS
+        }
+
+    @callback
+    def async_handle_global_update(self) -> None:
+        """Fan fresh site-wide data out to this entry's entities."""
+        if self.data is None or not self.global_coordinator.data:
+            return
+        self._endpoint_data.update(self._global_data())
+        self.data = {**self.data, **self._global_data()}
+        self._track_changes(self.data)
+        self.async_update_listeners()
+
+    async def _async_update_data(self) -> dict:
+        self.profiler.start()
+        try:
+            data = await self._async_build_data()
+        except Exception:
+            self.profiler.finish(success=False)
+            raise
+        self.profiler.lap("assemble")
+        self.profiler.finish(success=True)
+        return data
+
+    async def _async_fetch_due(self, now: datetime) -> None:
+        """Fetch every due endpoint into _endpoint_data."""
+        due = self._due_tiers(now)
+        fetchers = self._endpoint_fetchers(now)
+        self._endpoint_data.update(
+            await self._gather_optional(
+                {
+                    key: fetchers[key]
+                    for key, tier in ENDPOINT_TIERS.items()
+                    if tier in due
+                    and not (self.global_coordinator and key in GLOBAL_DATA_KEYS)
+                },
+                self._endpoint_data,
             )
+        )
+        for tier in due:
+            self._tier_last_refresh[tier] = now
+        if self.global_coordinator is not None:
+            self._endpoint_data.update(self._global_data())
 
-            current_ids = self._extract_achievement_ids(user_summary)
+    async def _async_build_data(self) -> dict:
+        """Fetch the due endpoints, fire events and assemble coordinator data."""
+        baselines = self._event_baselines()
+        try:
+            now = dt_util.now()
+            await self._async_fetch_due(now)
+            self.profiler.lap("fetch")
+
+            user_summary = self._endpoint_data["user_summary"]
+            aotw = self._endpoint_data["aotw"]
+            awards = self._endpoint_data["awards"]
+
+            self._invalidate_revised_games(user_summary)
+            self._prefetch_current_game(user_summary)
+            recent_index = self._index_recent(
+                user_summary.get("RecentAchievements") or {}
+            )
+            current_ids = set(recent_index.by_id)
             aotw_id = ((aotw or {}).get("Achievement") or {}).get("ID")
-            current_award_keys = self._extract_award_keys(awards)
+            award_index = self._index_awards_cached(awards)
+            current_award_keys = set(award_index)
+            self.profiler.lap("diff")
 
             if not self._first_run:
-                new_ids = current_ids - self._previous_achievement_ids
-                for ach_id in new_ids:
-                    try:
-                        await self._fire_achievement_unlocked(ach_id, user_summary)
-                    except Exception as fire_err:  # pylint: disable=broad-except
-                        LOGGER.warning(
-                            "Failed to fire achievement_unlocked for %s: %s",
-                            ach_id,
-                            fire_err,
-                        )
-                if aotw_id and aotw_id != self._previous_aotw_id:
+                await self._fire_new_unlocks(
+                    current_ids - self._previous_achievement_ids, recent_index
+                )
+                # With a shared global coordinator, it fires aotw_changed once.
+                if (
+                    self.global_coordinator is None
+                    and aotw_id
+                    and aotw_id != self._previous_aotw_id
+                ):
                     try:
                         self._fire_aotw_changed(aotw)
                     except Exception as fire_err:  # pylint: disable=broad-except
                         LOGGER.warning("Failed to fire aotw_changed: %s", fire_err)
                 for award_key in current_award_keys - self._previous_award_keys:
-                    award = self._find_award(award_key, awards)
-                    if award is None:
-                        continue
+                    award = award_index[award_key]
                     try:
                         self._fire_award_earned(award)
                     except Exception as fire_err:  # pylint: disable=broad-except
                         LOGGER.warning("Failed to fire award_earned: %s", fire_err)
+            self.profiler.lap("events")
 
+            new_ids = current_ids - self._previous_achievement_ids
+            self._update_game_priorities(user_summary, new_ids)
+            if new_ids and not self._first_run:
+                # Points, awards and completion move with an unlock: refetch
+                # them next cycle instead of up to a medium interval later.
+                self._tier_last_refresh.pop(TIER_MEDIUM, None)
             self._previous_achievement_ids = current_ids
             self._previous_aotw_id = aotw_id
             self._previous_award_keys = current_award_keys
             self._first_run = False
+            self._adapt_update_interval(user_summary)
 
-            return {
-                "user_summary": user_summary,
+            endpoint_data = dict(self._endpoint_data)
+            game_data = endpoint_data.pop("game_data")
+            data = {
+                **endpoint_data,
                 "recent_games": user_summary.get("RecentlyPlayed", []),
                 "RecentAchievements": user_summary.get("RecentAchievements", {}),
                 "aotw": aotw or {},
-                "user_points": user_points,
-                "completion_progress": completion_progress,
-                "awards": awards,
-                "want_to_play": want_to_play,
-                "top_ten": top_ten,
-                "following": following,
-                "followers": followers,
-                "set_requests": set_requests,
-                "earned_on_day": earned_on_day,
-                "recent_game_awards": recent_game_awards,
-                "earned_between": earned_between,
                 **game_data,
             }
         except Exception as error:
             LOGGER.error("Unexpected error fetching retroachievements data: %s", error)
             raise
+        self._track_changes(data)
+        self._schedule_snapshot_save(baselines)
+        return data
 
-    async def _fire_achievement_unlocked(self, ach_id: int, user_summary: dict) -> None:
-        """Look up, enrich, and fire the achievement_unlocked event."""
-        ach, game_id = self._find_achievement(ach_id, user_summary)
-        if ach is None or game_id is None:
-            LOGGER.debug(
-                "Achievement %s detected but payload not found in user summary",
-                ach_id,
-            )
+    async def _fire_new_unlocks(
+        self, ach_ids: set[int], recent_index: RecentAchievementsIndex
+    ) -> None:
+        """
+        Enrich new unlocks concurrently and fire their events in unlock order.
+
+        Each distinct game is looked up once, so a burst of unlocks in
+        uncached games costs one GetGameExtended round trip in total.
+        """
+        unlocks: list[tuple[int, dict, int]] = []
+        for ach_id in ach_ids:
+            ach, game_id = recent_index.by_id.get(ach_id, (None, None))
+            if ach is None or game_id is None:
+                LOGGER.debug(
+                    "Achievement %s detected but payload not found in user summary",
+                    ach_id,
+                )
+                continue
+            unlocks.append((ach_id, ach, game_id))
+        if not unlocks:
             return
-        game_ext = await self._get_cached_game_extended(game_id)
-        payload = self._build_enriched_payload(ach, game_id, game_ext)
-        self.hass.bus.async_fire(EVENT_ACHIEVEMENT_UNLOCKED, payload)
 
-    def _fire_aotw_changed(self, aotw: dict) -> None:
-        """Fire the aotw_changed event."""
-        ach = aotw.get("Achievement", {}) or {}
-        game = aotw.get("Game", {}) or {}
-        badge = ach.get("BadgeName")
-        self.hass.bus.async_fire(
-            EVENT_AOTW_CHANGED,
-            {
-                "achievement_id": ach.get("ID"),
-                "title": ach.get("Title"),
-                "description": ach.get("Description"),
-                "points": ach.get("Points"),
-                "badge_url": (
-                    f"https://retroachievements.org/Badge/{badge}.png"
-                    if badge
-                    else None
+        by_game: dict[int, list[int]] = {}
+        for ach_id, _ach, game_id in unlocks:
+            by_game.setdefault(game_id, []).append(ach_id)
+        game_exts = dict(
+            zip(
+                by_game,
+                await asyncio.gather(
+                    *(
+                        self._get_cached_game_extended(game_id, *game_ach_ids)
+                        for game_id, game_ach_ids in by_game.items()
+                    )
                 ),
-                "game_id": game.get("ID"),
-                "game_title": game.get("Title"),
-                "console_name": game.get("ConsoleName"),
-                "week_start": aotw.get("StartAt"),
-                "author": ach.get("Author"),
-            },
+                strict=True,
+            )
         )
 
+        unlocks.sort(
+            key=lambda unlock: (str(unlock[1].get("DateAwarded", "")), unlock[0])
+        )
+        payloads: list[dict] = []
+        for ach_id, ach, game_id in unlocks:
+            try:
+                payload = self._build_enriched_payload(ach, game_id, game_exts[game_id])
+                self.hass.bus.async_fire(EVENT_ACHIEVEMENT_UNLOCKED, payload)
+            except Exception as fire_err:  # pylint: disable=broad-except
+                LOGGER.warning(
+                    "Failed to fire achievement_unlocked for %s: %s",
+                    ach_id,
+                    fire_err,
+                )
+                continue
+            payloads.append(payload)
+
+        if self._achievement_batch_event and payloads:
+            self.hass.bus.async_fire(
+                EVENT_ACHIEVEMENT_BATCH,
+                {
+                    "count": len(payloads),
+                    "points": sum(p.get("points") or 0 for p in payloads),
+                    "game_ids": sorted({p["game_id"] for p in payloads}),
+                    "achievements": payloads,
+                    "username": self.api_client.username,
+                },
+            )
+
     def is_aotw_unlocked(self) -> bool:
         """Return True if the user already unlocked the current AOTW."""
         if not self.data:
@@ -389,15 +1065,91 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
             ach_id_int = int(ach_id)
         except (TypeError, ValueError):
             return False
-        if ach_id_int in self._previous_achievement_ids:
-            return True
-        recent = (self.data.get("user_summary") or {}).get("RecentAchievements") or {}
-        for _game_id, achievements in recent.items():
-            if not isinstance(achievements, dict):
+        return (
+            ach_id_int in self._previous_achievement_ids
+            or ach_id_int in self.recent_index.by_id
+        )
+
+    def _select_games(self, game_ids: list[int]) -> list[int]:
+        """
+        Return the monitored games to refresh this cycle.
+
+        With games_per_refresh set, games flagged by _update_game_priorities
+        come first, then games never fetched, and the remaining slots walk the
+        sorted game IDs round-robin, so the per-cycle cost stays flat. Urgent
+        games beyond games_per_refresh wait for the next cycles, so even the
+        first refresh after setup stays within the limit.
+        """
+        per_refresh = self._games_per_refresh
+        if per_refresh <= 0 or per_refresh >= len(game_ids):
+            return game_ids
+        urgent = [
+            game_id for game_id in game_ids if game_id in self._priority_games
+        ] + [
+            game_id
+            for game_id in game_ids
+            if game_id not in self._priority_games
+            and game_id not in self._fetched_games
+        ]
+        urgent = urgent[:per_refresh]
+        rest = [game_id for game_id in game_ids if game_id not in urgent]
+        rotation = [game_id for game_id in rest if game_id > self._game_cursor] + [
+            game_id for game_id in rest if game_id <= self._game_cursor
+        ]
+        picked = rotation[: max(0, per_refresh - len(urgent))]
+        if picked:
+            self._game_cursor = picked[-1]
+        self._priority_games.difference_update(urgent)
+        return urgent + picked
+
+    def _update_game_priorities(self, user_summary: dict, new_ids: set[int]) -> None:
+        """Flag games that were just played or unlocked to refresh next cycle."""
+        new = {str(ach_id) for ach_id in new_ids}
+        for game_id, achievements in (
+            (user_summary or {}).get("RecentAchievements") or {}
+        ).items():
+            if new.intersection(str(ach_id) for ach_id in achievements or {}):
+                self._priority_games.add(int(game_id))
+        stamps: dict[int, str] = {}
+        for game in (user_summary or {}).get("RecentlyPlayed") or []:
+            try:
+                game_id = int(game.get("GameID"))
+            except (TypeError, ValueError):
                 continue
-            if str(ach_id) in achievements or ach_id in achievements:
-                return True
-        return False
+            stamps[game_id] = str(game.get("LastPlayed") or "")
+            if self._recent_game_stamps.get(game_id) != stamps[game_id]:
+                self._priority_games.add(game_id)
+        self._recent_game_stamps = stamps
+
+    def _last_game_data(self) -> dict:
+        """Return the last-known per-game sections, e.g. from a snapshot."""
+        previous = self._endpoint_data.get("game_data") or self.data or {}
+        return {
+            section: dict(previous.get(section) or {})
+            for section in ("Awarded", "Leaderboards", "RankScore")
+        }
+
+    def _per_game_requests(
+        self, game_ids: list[int], monitored: set[str]
+    ) -> list[tuple[int, str, Callable[[int], Awaitable]]]:
+        """
+        Return the (game_id, section, fetch) requests to make this refresh.
+
+        Requests whose circuit breaker is open are left out so they keep
+        their last-known data; breakers of unmonitored games are dropped.
+        """
+        for key in [key for key in self.breakers if ":" in key]:
+            if key.split(":", 1)[1] not in monitored:
+                del self.breakers[key]
+        return [
+            (game_id, section, fetch)
+            for game_id in game_ids
+            for section, fetch in (
+                ("Leaderboards", self.api_client.async_get_user_game_leaderboards),
+                ("RankScore", self.api_client.async_get_user_game_rank_and_score),
+            )
+            if self._breaker(f"{section}:{game_id}").allow()
+        ]
 
     async def _get_game_data(self):
         monitored_game_ids: set[int] = set()
@@ -412,55 +1164,151 @@ class RetroAchievementsDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.monitored_games = monitored_game_ids
 
-        game_data = {"Awarded": {}, "Leaderboards": {}, "RankScore": {}}
+        monitored = {str(game_id) for game_id in monitored_game_ids}
+        game_data = {
+            section: {
+                game_id: value
+                for game_id, value in known.items()
+                if game_id in monitored
+            }
+            for section, known in self._last_game_data().items()
+        }
         if not monitored_game_ids:
             return game_data
 
-        game_ids = list(monitored_game_ids)
+        # Games with last-known data, e.g. from a snapshot, count as fetched.
+        self._fetched_games.update(
+            int(game_id) for known in game_data.values() for game_id in known
+        )
+        game_ids = self._select_games(sorted(monitored_game_ids))
+        self._fetched_games.update(game_ids)
 
-        progress_tasks = [
-            self.api_client.async_get_user_progress(game_id) for game_id in game_ids
-        ]
-        leaderboard_tasks = [
-            self.api_client.async_get_user_game_leaderboards(game_id)
-            for game_id in game_ids
-        ]
-        rank_score_tasks = [
-            self.api_client.async_get_user_game_rank_and_score(game_id)
-            for game_id in game_ids
-        ]
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with self._game_fetch_semaphore:
+                return await coro
 
-        game_progresses = await asyncio.gather(*progress_tasks, return_exceptions=True)
-        leaderboards = await asyncio.gather(*leaderboard_tasks, return_exceptions=True)
-        rank_scores = await asyncio.gather(*rank_score_tasks, return_exceptions=True)
+        requests = self._per_game_requests(game_ids, monitored)
+        # Chunked here rather than in the client so every progress request
+        # also takes a slot of the semaphore.
+        chunks = [
+            game_ids[i : i + USER_PROGRESS_CHUNK_SIZE]
+            for i in range(0, len(game_ids), USER_PROGRESS_CHUNK_SIZE)
+        ]
 
-        for i, game_id in enumerate(game_ids):
-            game_id_str = str(game_id)
+        # One pipeline for every per-game request: latency is roughly one
+        # round trip and at most game_fetch_concurrency requests are in flight.
+        results = await asyncio.gather(
+            *(
+                bounded(self.api_client.async_get_user_progress_batch(chunk))
+                for chunk in chunks
+            ),
+            *(bounded(fetch(game_id)) for game_id, _section, fetch in requests),
+            return_exceptions=True,
+        )
+        per_game = results[len(chunks) :]
 
-            game_progress = game_progresses[i]
-            if isinstance(game_progress, Exception):
-                LOGGER.error("Error fetching game progress: %s", game_progress)
+        for progress in results[: len(chunks)]:
+            if isinstance(progress, Exception):
+                LOGGER.error("Error fetching game progress: %s", progress)
             else:
-                game_data["Awarded"][game_id_str] = game_progress
-
-            leaderboard = leaderboards[i]
-            if isinstance(leaderboard, Exception):
-                LOGGER.warning(
-                    "Error fetching leaderboards for game_id=%s: %s",
-                    game_id,
-                    leaderboard,
-                )
-            elif isinstance(leaderboard, dict):
-                game_data["Leaderboards"][game_id_str] = leaderboard
+                game_data["Awarded"].update(progress)
 
-            rank_score = rank_scores[i]
-            if isinstance(rank_score, Exception):
-                LOGGER.warning(
-                    "Error fetching rank/score for game_id=%s: %s",
-                    game_id,
-                    rank_score,
-                )
-            elif isinstance(rank_score, list) and rank_score:
-                game_data["RankScore"][game_id_str] = rank_score[0]
+        for (game_id, section, _fetch), result in zip(requests, per_game, strict=True):
+            breaker = self._breaker(f"{section}:{game_id}")
+            if isinstance(result, Exception):
+                label = "leaderboards" if section == "Leaderboards" else "rank/score"
+                self._record_failure(breaker, f"{label} for game_id={game_id}", result)
+                continue
+            breaker.record_success()
+            if section == "Leaderboards" and isinstance(result, dict):
+                game_data["Leaderboards"][str(game_id)] = result
+            elif section == "RankScore" and isinstance(result, list) and result:
+                game_data["RankScore"][str(game_id)] = result[0]
 
         return game_data
+
+
+class RetroAchievementsGlobalDataUpdateCoordinator(RetroAchievementsBaseCoordinator):
+    """
+    Fetch site-wide data once for every config entry.
+
+    AOTW, top ten users and recent game awards are the same for every
+    account, so one coordinator stored in hass.data[DOMAIN] polls them on the
+    slow tier and each entry's coordinator fans the result out to its
+    entities. It uses the API client of the most recently set up entry, and
+    moves to a remaining entry's client when that entry is unloaded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: RetroAchievementsApiClient,
+    ) -> None:
+        """Initialize the global coordinator."""
+        self.api_client = api_client
+        self.entry_ids: set[str] = set()
+        self.breakers = {}
+        self._previous_aotw_id: int | None = None
+        self._first_run: bool = True
+
+        super().__init__(
+            hass,
+            LOGGER,
+            # Shared by every entry, so it must not shut down with whichever
+            # entry happened to create it; _async_release and HA stop do that.
+            config_entry=None,
+            name=f"{DOMAIN}_global",
+            update_interval=timedelta(seconds=TIER_INTERVALS[TIER_SLOW]),
+        )
+
+    def seed_aotw_baseline(self, aotw_id: int | None) -> None:
+        """
+        Adopt an AOTW ID restored from an entry snapshot before the first refresh.
+
+        An AOTW that changed while Home Assistant was down then still fires
+        aotw_changed on the first refresh.
+        """
+        if self._first_run and aotw_id is not None:
+            self._previous_aotw_id = aotw_id
+            self._first_run = False
+
+    def use_api_client(self, api_client: RetroAchievementsApiClient) -> None:
+        """Poll with api_client from now on, forgetting the old one's failures."""
+        self.api_client = api_client
+        self.breakers.clear()
+
+    async def _async_update_data(self) -> dict:
+        client = self.api_client
+        last = self.data or {}
+        data = {
+            **last,
+            **await self._gather_optional(
+                {
+                    "aotw": self._safe_get_aotw,
+                    "top_ten": lambda: self._safe_get_list(
+                        client.async_get_top_ten_users, _ENDPOINT_BREAKERS["top_ten"]
+                    ),
+                    "recent_game_awards": lambda: self._safe_get(
+                        client.async_get_recent_game_awards,
+                        _ENDPOINT_BREAKERS["recent_game_awards"],
+                    ),
+                },
+                last,
+            ),
+        }
+        aotw = data["aotw"]
+
+        aotw_id = ((aotw or {}).get("Achievement") or {}).get("ID")
+        if not self._first_run and aotw_id and aotw_id != self._previous_aotw_id:
+            try:
+                self._fire_aotw_changed(aotw)
+            except Exception as fire_err:  # pylint: disable=broad-except
+                LOGGER.warning("Failed to fire aotw_changed: %s", fire_err)
+        self._previous_aotw_id = aotw_id
+        self._first_run = False
+
+        return {
+            "aotw": aotw or {},
+            "top_ten": data["top_ten"],
+            "recent_game_awards": data["recent_game_awards"],
+        }
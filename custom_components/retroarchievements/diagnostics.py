@@ -8,21 +8,40 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_API_KEY
 from homeassistant.core import HomeAssistant
 
+from .const import DATA_API_METRICS, DATA_RATE_LIMITERS, DOMAIN
+
 if TYPE_CHECKING:
     from . import RetroAchievementsConfigEntry
 
 TO_REDACT = {CONF_API_KEY}
 
 
+def _breakers(coordinator: Any) -> dict[str, dict[str, Any]]:
+    """Return the state of the entry's and the shared coordinator's breakers."""
+    breakers = dict(getattr(coordinator, "breakers", None) or {})
+    shared = getattr(coordinator, "global_coordinator", None)
+    breakers.update(getattr(shared, "breakers", None) or {})
+    return {key: breaker.as_dict() for key, breaker in sorted(breakers.items())}
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: RetroAchievementsConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = getattr(entry, "runtime_data", None)
+    domain_data = hass.data.get(DOMAIN, {})
+    api_key = entry.data.get(CONF_API_KEY)
+    limiter = domain_data.get(DATA_RATE_LIMITERS, {}).get(api_key)
+    metrics = domain_data.get(DATA_API_METRICS, {}).get(api_key)
+    profiler = getattr(coordinator, "profiler", None)
     return {
         "entry": {
             "data": async_redact_data(dict(entry.data), TO_REDACT),
             "options": dict(entry.options),
         },
         "coordinator_data": coordinator.data if coordinator else None,
+        "rate_limiter": limiter.stats() if limiter else None,
+        "circuit_breakers": _breakers(coordinator),
+        "api_metrics": metrics.stats() if metrics else None,
+        "refresh_profile": profiler.as_list() if profiler else None,
     }
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 
@@ -17,3 +19,32 @@ def user_device_info(username: str) -> DeviceInfo:
         configuration_url=f"https://retroachievements.org/user/{username}",
         model="User Profile",
     )
+
+
+class RetroAchievementsCoordinatorEntity(CoordinatorEntity):
+    """
+    Coordinator entity that skips state writes when its data is unchanged.
+
+    Subclasses list the top-level coordinator data keys they read in
+    _data_sections. After a refresh the entity writes its state only if one
+    of those sections changed or availability flipped. None (the default)
+    writes on every update, for entities that also depend on the clock.
+    """
+
+    _data_sections: frozenset[str] | None = None
+    _written_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a section this entity reads has changed."""
+        changed = getattr(self.coordinator, "changed_sections", None)
+        available = self.available
+        if (
+            self._data_sections is not None
+            and changed is not None
+            and available == self._written_available
+            and self._data_sections.isdisjoint(changed)
+        ):
+            return
+        self._written_available = available
+        super()._handle_coordinator_update()
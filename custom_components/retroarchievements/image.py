@@ -6,12 +6,11 @@ from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import CONF_USERNAME, DOMAIN
 from .coordinator import RetroAchievementsDataUpdateCoordinator
-from .entity import user_device_info
+from .entity import RetroAchievementsCoordinatorEntity, user_device_info
 
 PARALLEL_UPDATES = 0
 BASE_SITE_URL = "https://retroachievements.org"
@@ -33,7 +32,7 @@ async def async_setup_entry(
     )
 
 
-class _RetroAchievementsBaseImage(CoordinatorEntity, ImageEntity):
+class _RetroAchievementsBaseImage(RetroAchievementsCoordinatorEntity, ImageEntity):
     """Base image entity that serves a coordinator-derived remote URL."""
 
     _attr_has_entity_name = True
@@ -45,7 +44,7 @@ class _RetroAchievementsBaseImage(CoordinatorEntity, ImageEntity):
         username: str,
         key: str,
     ) -> None:
-        CoordinatorEntity.__init__(self, coordinator)
+        RetroAchievementsCoordinatorEntity.__init__(self, coordinator)
         ImageEntity.__init__(self, hass)
         self.username = username
         self._attr_unique_id = f"{DOMAIN}_{username}_{key}"
@@ -75,6 +74,7 @@ class RetroAchievementsBoxArtImage(_RetroAchievementsBaseImage):
     """Box art of the most recently played game."""
 
     _attr_translation_key = "box_art"
+    _data_sections = frozenset({"user_summary"})
 
     def __init__(self, hass, coordinator, username) -> None:
         super().__init__(hass, coordinator, username, "box_art")
@@ -92,22 +92,13 @@ class RetroAchievementsLastBadgeImage(_RetroAchievementsBaseImage):
     """Badge of the most recently earned achievement."""
 
     _attr_translation_key = "last_badge"
+    _data_sections = frozenset({"RecentAchievements"})
 
     def __init__(self, hass, coordinator, username) -> None:
         super().__init__(hass, coordinator, username, "last_badge")
 
     def _compute_url(self) -> str | None:
-        recent = (self.coordinator.data or {}).get("RecentAchievements") or {}
-        latest: dict | None = None
-        latest_date = ""
-        for achievements in recent.values():
-            if not isinstance(achievements, dict):
-                continue
-            for achievement in achievements.values():
-                date = achievement.get("DateAwarded") or ""
-                if latest is None or date >= latest_date:
-                    latest = achievement
-                    latest_date = date
+        latest = self.coordinator.recent_index.latest
         if not latest:
             return None
         badge = latest.get("BadgeName")
@@ -0,0 +1,166 @@
+"""Compact typed models of the RetroAchievements payloads the integration keeps."""
+
+from __future__ import annotations
+
+from typing import Any, TypedDict
+
+
+class Achievement(TypedDict, total=False):
+    """An unlocked achievement from GetUserSummary's RecentAchievements."""
+
+    ID: int
+    GameID: int
+    GameTitle: str
+    ConsoleName: str
+    Title: str
+    Description: str
+    Points: int
+    BadgeName: str
+    DateAwarded: str
+    HardcoreMode: int
+    HardcoreAchieved: int
+    Author: str
+
+
+class RecentGame(TypedDict, total=False):
+    """A game from GetUserSummary's RecentlyPlayed list."""
+
+    GameID: int
+    ConsoleID: int
+    ConsoleName: str
+    Title: str
+    ImageIcon: str
+    ImageTitle: str
+    ImageIngame: str
+    ImageBoxArt: str
+    LastPlayed: str
+    AchievementsTotal: int
+
+
+class UserSummary(TypedDict, total=False):
+    """GetUserSummary without the per-game Awarded map and other unused fields."""
+
+    ID: int
+    User: str
+    UserPic: str
+    MemberSince: str
+    TotalPoints: int
+    TotalSoftcorePoints: int
+    TotalTruePoints: int
+    Rank: int
+    Status: str
+    RichPresenceMsg: str
+    RichPresenceMsgDate: str
+    LastGameID: int
+    LastActivity: dict[str, Any]
+    RecentlyPlayed: list[RecentGame]
+    RecentAchievements: dict[str, dict[str, Achievement]]
+
+
+class Award(TypedDict, total=False):
+    """A visible site award from GetUserAwards."""
+
+    AwardedAt: str
+    AwardType: str
+    AwardData: int
+    AwardDataExtra: int
+    Title: str
+    ConsoleID: int
+    ConsoleName: str
+    ImageIcon: str
+
+
+class UserAwards(TypedDict, total=False):
+    """GetUserAwards counts and visible awards."""
+
+    TotalAwardsCount: int
+    HiddenAwardsCount: int
+    MasteryAwardsCount: int
+    CompletionAwardsCount: int
+    BeatenHardcoreAwardsCount: int
+    BeatenSoftcoreAwardsCount: int
+    EventAwardsCount: int
+    SiteAwardsCount: int
+    VisibleUserAwards: list[Award]
+
+
+class Unlock(TypedDict, total=False):
+    """An unlock from GetAchievementsEarnedBetween."""
+
+    ID: int
+    Title: str
+    Description: str
+    GameID: int
+    GameTitle: str
+    ConsoleName: str
+    Points: int
+    BadgeName: str
+    HardcoreMode: int
+    Date: str
+
+
+class GameProgress(TypedDict, total=False):
+    """A played game from GetUserCompletionProgress."""
+
+    GameID: int
+    Title: str
+    ConsoleName: str
+    MaxPossible: int
+    NumAwarded: int
+    NumAwardedHardcore: int
+    MostRecentAwardedDate: str
+    HighestAwardKind: str
+    HighestAwardDate: str
+
+
+def _keep(record: Any, model: type) -> dict:
+    """Return the fields of record that model declares, or {} for a non-dict."""
+    if not isinstance(record, dict):
+        return {}
+    return {key: record[key] for key in model.__annotations__ if key in record}
+
+
+def parse_user_summary(payload: Any) -> UserSummary:
+    """Compact a GetUserSummary payload."""
+    summary = _keep(payload, UserSummary)
+    if "RecentlyPlayed" in summary:
+        summary["RecentlyPlayed"] = [
+            _keep(game, RecentGame)
+            for game in summary["RecentlyPlayed"] or []
+            if isinstance(game, dict)
+        ]
+    if isinstance(summary.get("RecentAchievements"), dict):
+        summary["RecentAchievements"] = {
+            game_id: {
+                ach_id: _keep(achievement, Achievement)
+                for ach_id, achievement in achievements.items()
+                if isinstance(achievement, dict)
+            }
+            for game_id, achievements in summary["RecentAchievements"].items()
+            if isinstance(achievements, dict)
+        }
+    return summary
+
+
+def parse_user_awards(payload: Any) -> UserAwards:
+    """Compact a GetUserAwards payload."""
+    awards = _keep(payload, UserAwards)
+    if "VisibleUserAwards" in awards:
+        awards["VisibleUserAwards"] = [
+            _keep(award, Award)
+            for award in awards["VisibleUserAwards"] or []
+            if isinstance(award, dict)
+        ]
+    return awards
+
+
+def parse_unlocks(payload: Any) -> list[Unlock]:
+    """Compact a GetAchievementsEarnedBetween list."""
+    if not isinstance(payload, list):
+        return []
+    return [_keep(unlock, Unlock) for unlock in payload if isinstance(unlock, dict)]
+
+
+def parse_game_progress(payload: Any) -> GameProgress:
+    """Compact one GetUserCompletionProgress result."""
+    return _keep(payload, GameProgress)
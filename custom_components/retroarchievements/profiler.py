@@ -0,0 +1,70 @@
+"""Opt-in timing of coordinator refresh phases."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import REFRESH_PROFILE_HISTORY
+
+
+class RefreshProfiler:
+    """
+    Record wall and event-loop CPU time per refresh phase.
+
+    start() opens a refresh, each lap(phase) charges the time since the
+    previous lap to phase, and finish() files the refresh in a ring buffer of
+    the last history refreshes. CPU time is the event loop thread's, so a
+    phase that awaits also counts work other tasks did meanwhile. Every
+    method is a no-op unless enabled.
+    """
+
+    def __init__(
+        self, history: int = REFRESH_PROFILE_HISTORY, *, enabled: bool = False
+    ) -> None:
+        self.enabled = enabled
+        self.refreshes: deque[dict[str, Any]] = deque(maxlen=history)
+        self._current: dict[str, Any] | None = None
+        self._started = (0.0, 0.0)
+        self._last = (0.0, 0.0)
+
+    @staticmethod
+    def _clock() -> tuple[float, float]:
+        return time.perf_counter(), time.thread_time()
+
+    def start(self) -> None:
+        """Begin profiling a refresh."""
+        if not self.enabled:
+            return
+        self._current = {"started": dt_util.utcnow().isoformat(), "phases": {}}
+        self._started = self._last = self._clock()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap to phase."""
+        if self._current is None:
+            return
+        now = self._clock()
+        self._current["phases"][phase] = _timing(self._last, now)
+        self._last = now
+
+    def finish(self, *, success: bool) -> None:
+        """Close the refresh and add it to the history."""
+        if self._current is None:
+            return
+        self._current.update(_timing(self._started, self._clock()), success=success)
+        self.refreshes.append(self._current)
+        self._current = None
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the recorded refreshes, oldest first."""
+        return list(self.refreshes)
+
+
+def _timing(start: tuple[float, float], end: tuple[float, float]) -> dict[str, float]:
+    return {
+        "wall_ms": round((end[0] - start[0]) * 1000, 2),
+        "cpu_ms": round((end[1] - start[1]) * 1000, 2),
+    }
@@ -3,18 +3,21 @@
 from __future__ import annotations
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ApiMetrics, async_get_api_metrics
 from .const import (
+    API_METRIC_ENDPOINTS,
     ATTR_ACHIEVEMENTS_EARNED,
     ATTR_ACHIEVEMENTS_TOTAL,
     ATTR_COMPLETION_PERCENTAGE,
@@ -28,6 +31,7 @@ from .const import (
     LOGGER,
 )
 from .coordinator import RetroAchievementsDataUpdateCoordinator
+from .entity import RetroAchievementsCoordinatorEntity
 
 # Coordinator already fetches everything; entity reads are local. No throttling.
 PARALLEL_UPDATES = 0
@@ -62,21 +66,24 @@ _EXTRA_KEYS = frozenset(
 )
 
 
-def _latest_achievement(coordinator_data: dict) -> dict | None:
-    """Return the most recently unlocked achievement across all games, or None."""
-    recent = (coordinator_data or {}).get("RecentAchievements") or {}
-    latest: dict | None = None
-    for achievements in recent.values():
-        if not isinstance(achievements, dict):
-            continue
-        for achievement in achievements.values():
-            if not isinstance(achievement, dict):
-                continue
-            if latest is None or str(achievement.get("DateAwarded", "")) > str(
-                latest.get("DateAwarded", "")
-            ):
-                latest = achievement
-    return latest
+# Coordinator data sections read by user sensors other than user_summary ones.
+_KEY_SECTIONS = {
+    "recently_played_count": frozenset({"recent_games"}),
+    "hardcore_points": frozenset({"user_points"}),
+    "softcore_points": frozenset({"user_points"}),
+    "games_mastered": frozenset({"awards"}),
+    "games_beaten": frozenset({"awards"}),
+    "awards_total": frozenset({"awards"}),
+    "games_played": frozenset({"completion_progress"}),
+    "following_count": frozenset({"following"}),
+    "followers_count": frozenset({"followers"}),
+    "set_requests": frozenset({"set_requests"}),
+    "achievements_earned_today": frozenset({"earned_on_day"}),
+    "recent_game_awards": frozenset({"recent_game_awards"}),
+    "top_ten": frozenset({"top_ten"}),
+    "want_to_play_count": frozenset({"want_to_play"}),
+    "last_achievement": frozenset({"RecentAchievements"}),
+}
 
 
 USER_SENSORS = [
@@ -279,10 +286,16 @@ async def async_setup_entry(
         for game in coordinator.data["recent_games"]:
             entities.append(RetroAchievementsGameSensor(coordinator, username, game))
 
+    metrics = async_get_api_metrics(hass, entry.data[CONF_API_KEY])
+    entities.extend(
+        RetroAchievementsApiMetricsSensor(coordinator, username, metrics, endpoint)
+        for endpoint in API_METRIC_ENDPOINTS
+    )
+
     async_add_entities(entities, True)
 
 
-class RetroAchievementsBaseSensor(CoordinatorEntity, SensorEntity):
+class RetroAchievementsBaseSensor(RetroAchievementsCoordinatorEntity, SensorEntity):
     """Base class for RetroAchievements sensors."""
 
     def __init__(
@@ -328,6 +341,7 @@ class RetroAchievementsUserSensor(RetroAchievementsBaseSensor):
         """Initialize user sensor."""
         super().__init__(coordinator, username, description)
         self._key = description.key
+        self._data_sections = _KEY_SECTIONS.get(self._key, frozenset({"user_summary"}))
 
         if self._key != "username" and hasattr(description, "entity_category"):
             self._attr_entity_category = description.entity_category
@@ -373,7 +387,7 @@ class RetroAchievementsUserSensor(RetroAchievementsBaseSensor):
         if self._key == "want_to_play_count":
             return (data.get("want_to_play") or {}).get("Total", 0)
         if self._key == "last_achievement":
-            latest = _latest_achievement(data)
+            latest = self.coordinator.recent_index.latest
             return latest.get("Title") if latest else None
         return None
 
@@ -468,7 +482,7 @@ class RetroAchievementsUserSensor(RetroAchievementsBaseSensor):
         if self._key == "want_to_play_count":
             return {"games": (data.get("want_to_play") or {}).get("Results", [])}
         if self._key == "last_achievement":
-            latest = _latest_achievement(data)
+            latest = self.coordinator.recent_index.latest
             if not latest:
                 return {}
             badge = latest.get("BadgeName")
@@ -527,6 +541,8 @@ class RetroAchievementsUserSensor(RetroAchievementsBaseSensor):
 class RetroAchievementsRecentAchievementsSensor(RetroAchievementsBaseSensor):
     """Representation of a RetroAchievements recent achievements sensor."""
 
+    _data_sections = frozenset({"RecentAchievements"})
+
     def __init__(
         self,
         coordinator: RetroAchievementsDataUpdateCoordinator,
@@ -548,12 +564,7 @@ class RetroAchievementsRecentAchievementsSensor(RetroAchievementsBaseSensor):
             or "RecentAchievements" not in self.coordinator.data
         ):
             return 0
-        count = 0
-        for game_id, achievements in self.coordinator.data[
-            "RecentAchievements"
-        ].items():
-            count += len(achievements)
-        return count
+        return len(self.coordinator.recent_index.unlocks)
 
     @property
     def extra_state_attributes(self):
@@ -563,28 +574,29 @@ class RetroAchievementsRecentAchievementsSensor(RetroAchievementsBaseSensor):
             or "RecentAchievements" not in self.coordinator.data
         ):
             return {}
-        recent_achievements = []
-        for game_id, achievements in self.coordinator.data[
-            "RecentAchievements"
-        ].items():
-            for ach_id, achievement in achievements.items():
-                achievement_data = {
-                    "id": achievement.get("ID"),
-                    "title": achievement.get("Title"),
-                    "description": achievement.get("Description"),
-                    "points": achievement.get("Points"),
-                    "game": achievement.get("GameTitle"),
-                    "date_awarded": achievement.get("DateAwarded"),
-                    "image": f"https://retroachievements.org/Badge/{achievement.get('BadgeName')}.png",
-                    "url": f"https://retroachievements.org/achievement/{achievement.get('ID')}",
-                }
-                recent_achievements.append(achievement_data)
+        recent_achievements = [
+            {
+                "id": achievement.get("ID"),
+                "title": achievement.get("Title"),
+                "description": achievement.get("Description"),
+                "points": achievement.get("Points"),
+                "game": achievement.get("GameTitle"),
+                "date_awarded": achievement.get("DateAwarded"),
+                "image": f"https://retroachievements.org/Badge/{achievement.get('BadgeName')}.png",
+                "url": f"https://retroachievements.org/achievement/{achievement.get('ID')}",
+            }
+            for achievement in self.coordinator.recent_index.unlocks
+        ]
         return {"achievements": recent_achievements}
 
 
 class RetroAchievementsGameSensor(RetroAchievementsBaseSensor):
     """Representation of a RetroAchievements game sensor."""
 
+    _data_sections = frozenset(
+        {"Awarded", "RecentAchievements", "Leaderboards", "RankScore"}
+    )
+
     def __init__(self, coordinator, username, game_data):
         super().__init__(coordinator, username)
         self._game_data = game_data
@@ -632,26 +644,19 @@ class RetroAchievementsGameSensor(RetroAchievementsBaseSensor):
         if not self._game_data:
             return {}
         achievement_data = self._get_achievement_data()
-        game_achievements = []
-        if (
-            self.coordinator.data
-            and "RecentAchievements" in self.coordinator.data
-            and str(self._game_id) in self.coordinator.data["RecentAchievements"]
-        ):
-            achievements = self.coordinator.data["RecentAchievements"][
-                str(self._game_id)
-            ]
-            for ach_id, achievement in achievements.items():
-                game_achievements.append(
-                    {
-                        "id": achievement.get("ID"),
-                        "title": achievement.get("Title"),
-                        "description": achievement.get("Description"),
-                        "points": achievement.get("Points"),
-                        "date_awarded": achievement.get("DateAwarded"),
-                        "image": f"https://retroachievements.org/Badge/{achievement.get('BadgeName')}.png",
-                    }
-                )
+        game_achievements = [
+            {
+                "id": achievement.get("ID"),
+                "title": achievement.get("Title"),
+                "description": achievement.get("Description"),
+                "points": achievement.get("Points"),
+                "date_awarded": achievement.get("DateAwarded"),
+                "image": f"https://retroachievements.org/Badge/{achievement.get('BadgeName')}.png",
+            }
+            for achievement in self.coordinator.recent_index.by_game.get(
+                str(self._game_id), []
+            )
+        ]
         attrs = {
             ATTR_GAME_ID: self._game_id,
             ATTR_GAME_TITLE: self._game_title,
@@ -713,6 +718,9 @@ class RetroAchievementsGameSensor(RetroAchievementsBaseSensor):
 class RetroAchievementsRecentlyPlayedSensor(RetroAchievementsBaseSensor):
     """Representation of a RetroAchievements recently played game sensor."""
 
+    # State comes from the game payload captured at setup.
+    _data_sections = frozenset()
+
     def __init__(
         self,
         coordinator: RetroAchievementsDataUpdateCoordinator,
@@ -773,6 +781,8 @@ class RetroAchievementsRecentlyPlayedSensor(RetroAchievementsBaseSensor):
 class RetroAchievementsAOTWSensor(RetroAchievementsBaseSensor):
     """Representation of the Achievement of the Week sensor."""
 
+    _data_sections = frozenset({"aotw"})
+
     def __init__(
         self,
         coordinator: RetroAchievementsDataUpdateCoordinator,
@@ -811,3 +821,49 @@ class RetroAchievementsAOTWSensor(RetroAchievementsBaseSensor):
             "week_start": aotw.get("StartAt"),
             "author": ach.get("Author"),
         }
+
+
+class RetroAchievementsApiMetricsSensor(RetroAchievementsBaseSensor):
+    """
+    Diagnostic p95 latency of one API endpoint, with its other metrics.
+
+    Disabled by default. Metrics change with every request, so the state is
+    written on every coordinator update.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-outline"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_translation_key = "api_endpoint"
+
+    def __init__(
+        self,
+        coordinator: RetroAchievementsDataUpdateCoordinator,
+        username: str,
+        metrics: ApiMetrics,
+        endpoint: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, username)
+        self._metrics = metrics
+        self._endpoint = endpoint
+        name = endpoint.removeprefix("API_").removesuffix(".php")
+        self._attr_unique_id = f"{DOMAIN}_{username}_api_{name.lower()}"
+        self._attr_translation_placeholders = {"endpoint": name}
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the endpoint's p95 latency in milliseconds."""
+        return self._stats()["latency_p95_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return request, error and retry counts, percentiles and sizes."""
+        return self._stats()
+
+    def _stats(self) -> dict:
+        return self._metrics.endpoint(self._endpoint).stats()
@@ -6,11 +6,10 @@ from homeassistant.components.todo import TodoItem, TodoItemStatus, TodoListEnti
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_USERNAME, DOMAIN
 from .coordinator import RetroAchievementsDataUpdateCoordinator
-from .entity import user_device_info
+from .entity import RetroAchievementsCoordinatorEntity, user_device_info
 
 PARALLEL_UPDATES = 0
 
@@ -26,9 +25,13 @@ async def async_setup_entry(
     async_add_entities([RetroAchievementsWantToPlayTodoList(coordinator, username)])
 
 
-class RetroAchievementsWantToPlayTodoList(CoordinatorEntity, TodoListEntity):
+class RetroAchievementsWantToPlayTodoList(
+    RetroAchievementsCoordinatorEntity, TodoListEntity
+):
     """Read-only todo list mirroring the RetroAchievements backlog."""
 
+    _data_sections = frozenset({"want_to_play"})
+
     _attr_has_entity_name = True
     _attr_translation_key = "want_to_play"
     _attr_icon = "mdi:format-list-bulleted"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -11,6 +12,30 @@ import pytest
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip wall-clock benchmarks unless RA_BENCHMARK=1 asks for them."""
+    if os.environ.get("RA_BENCHMARK") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmark; set RA_BENCHMARK=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry transient API failures without waiting between attempts."""
+    monkeypatch.setattr(
+        "custom_components.retroarchievements.api.API_RETRY_BASE_DELAY", 0
+    )
+
+
+async def _aiter(items):
+    """Yield items as an async iterator, like the client's paged endpoints."""
+    for item in items:
+        yield item
+
+
 def load_fixture(name: str) -> dict | list:
     """
     Load a JSON fixture from tests/fixtures/.
@@ -56,6 +81,29 @@ def user_awards_fixture() -> dict:
     return load_fixture("user_awards.json")
 
 
+@pytest.fixture
+def large_user_awards_fixture() -> dict:
+    """
+    Return a GetUserAwards payload with 2,000 visible awards.
+
+    Built from the sample award so benchmarks exercise a realistic shape
+    without a multi-megabyte fixture file.
+    """
+    payload = load_fixture("user_awards.json")
+    template = payload["VisibleUserAwards"][0]
+    payload["VisibleUserAwards"] = [
+        {
+            **template,
+            "AwardData": 10_000 + i,
+            "AwardDataExtra": i % 2,
+            "Title": f"Game {i}",
+        }
+        for i in range(2_000)
+    ]
+    payload["TotalAwardsCount"] = len(payload["VisibleUserAwards"])
+    return payload
+
+
 @pytest.fixture
 def want_to_play_fixture() -> dict:
     """Return the sample GetUserWantToPlayList payload."""
@@ -161,8 +209,12 @@ def mock_api_client(
     client.async_get_achievement_of_the_week.return_value = aotw_fixture
     client.async_get_game_extended.return_value = game_extended_fixture
     client.async_get_user_progress.return_value = {}
+    client.async_get_user_progress_batch.return_value = {}
     client.async_get_user_points.return_value = user_points_fixture
     client.async_get_user_completion_progress.return_value = completion_progress_fixture
+    client.async_iter_user_completion_progress.side_effect = lambda **_kw: _aiter(
+        [completion_progress_fixture]
+    )
     client.async_get_user_awards.return_value = user_awards_fixture
     client.async_get_user_want_to_play_list.return_value = want_to_play_fixture
     client.async_get_top_ten_users.return_value = top_ten_fixture
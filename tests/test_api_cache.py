@@ -0,0 +1,123 @@
+"""Tests for request coalescing and the response cache in the API client."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from custom_components.retroarchievements.api import (
+    ApiResponseCache,
+    RetroAchievementsApiClient,
+    RetroAchievementsApiClientCommunicationError,
+    async_get_response_cache,
+)
+from custom_components.retroarchievements.const import BASE_URL
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def _url(endpoint: str) -> re.Pattern:
+    return re.compile(rf"^{re.escape(BASE_URL)}{re.escape(endpoint)}")
+
+
+async def test_concurrent_identical_calls_share_one_request(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        # Registered once: a second HTTP request would fail.
+        m.get(_url("API_GetGameInfoAndUserProgress.php"), payload={"Achievements": []})
+        info, achievements = await asyncio.gather(
+            client.async_get_game_info(678),
+            client.async_get_game_achievements(678),
+        )
+    assert info == {"Achievements": []}
+    assert achievements == []
+
+
+async def test_ttl_endpoint_served_from_cache(session, console_ids_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(_url("API_GetConsoleIDs.php"), payload=console_ids_fixture)
+        first = await client.async_get_console_ids()
+        second = await client.async_get_console_ids()
+    assert first == second == console_ids_fixture
+
+
+async def test_uncached_endpoint_requested_every_time(session, user_points_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(_url("API_GetUserPoints.php"), payload=user_points_fixture, repeat=True)
+        await client.async_get_user_points()
+        await client.async_get_user_points()
+        requests = sum(len(calls) for calls in m.requests.values())
+    assert requests == 2
+
+
+async def test_game_extended_is_not_response_cached(session):
+    # GameExtendedCache owns these payloads; a refetch after a set revision
+    # must reach the API instead of replaying the old response.
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(_url("API_GetGameExtended.php"), payload={"NumAchievements": 10})
+        m.get(_url("API_GetGameExtended.php"), payload={"NumAchievements": 12})
+        first = await client.async_get_game_extended(678)
+        second = await client.async_get_game_extended(678)
+    assert first["NumAchievements"] == 10
+    assert second["NumAchievements"] == 12
+
+
+async def test_errors_are_not_cached(session, console_ids_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(_url("API_GetConsoleIDs.php"), status=404)
+        m.get(_url("API_GetConsoleIDs.php"), payload=console_ids_fixture)
+        with pytest.raises(RetroAchievementsApiClientCommunicationError):
+            await client.async_get_console_ids()
+        assert await client.async_get_console_ids() == console_ids_fixture
+
+
+async def test_cancelled_caller_does_not_cancel_other_waiters():
+    cache = ApiResponseCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"Total": 1}
+
+    owner = asyncio.create_task(cache.async_fetch("API_GetUserPoints.php", {}, _fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.async_fetch("API_GetUserPoints.php", {}, _fetch))
+    await asyncio.sleep(0)
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await waiter == {"Total": 1}
+    assert owner.cancelled()
+    assert calls == 1
+
+
+async def test_cache_evicts_least_recently_used():
+    cache = ApiResponseCache(max_entries=2)
+
+    async def _fetch():
+        return []
+
+    for console_id in (1, 2, 3):
+        await cache.async_fetch("API_GetGameList.php", {"i": console_id}, _fetch)
+    assert len(cache) == 2
+
+
+async def test_shared_cache_per_api_key(hass):
+    first = async_get_response_cache(hass, "key")
+    assert async_get_response_cache(hass, "key") is first
+    assert async_get_response_cache(hass, "other") is not first
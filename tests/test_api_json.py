@@ -0,0 +1,97 @@
+"""Tests for decoding API response bodies."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from homeassistant.util.json import json_loads
+
+from custom_components.retroarchievements import api
+from custom_components.retroarchievements.api import (
+    RetroAchievementsApiClient,
+    RetroAchievementsApiClientError,
+)
+from custom_components.retroarchievements.const import BASE_URL
+
+from .conftest import FIXTURE_DIR
+
+SUMMARY_URL = re.compile(rf"^{re.escape(BASE_URL)}API_GetUserSummary\.php")
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+async def test_small_body_is_decoded_on_the_loop(session, user_summary_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, payload=user_summary_fixture)
+        assert await client.async_get_user_summary() == user_summary_fixture
+
+
+async def test_large_body_is_decoded_in_the_executor(
+    session, user_summary_fixture, monkeypatch
+):
+    threads = []
+
+    def recording_loads(body):
+        threads.append(threading.current_thread())
+        return json_loads(body)
+
+    monkeypatch.setattr(api, "API_JSON_EXECUTOR_THRESHOLD", 0)
+    monkeypatch.setattr(api, "json_loads", recording_loads)
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, payload=user_summary_fixture)
+        assert await client.async_get_user_summary() == user_summary_fixture
+    assert threads
+    assert threads[0] is not threading.main_thread()
+
+
+async def test_invalid_json_raises_client_error(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, body="<html>oops</html>")
+        with pytest.raises(RetroAchievementsApiClientError):
+            await client.async_get_user_summary()
+
+
+def _bodies(large_user_awards_fixture) -> list[bytes]:
+    bodies = [path.read_bytes() for path in sorted(FIXTURE_DIR.glob("*.json"))]
+    bodies.append(json.dumps(large_user_awards_fixture).encode())
+    return bodies
+
+
+def test_json_loads_matches_stdlib_on_fixtures(large_user_awards_fixture):
+    bodies = _bodies(large_user_awards_fixture)
+    assert all(json.loads(body) == json_loads(body) for body in bodies)
+
+
+@pytest.mark.benchmark
+def test_benchmark_decode_fixtures(large_user_awards_fixture):
+    """Time json against HA's loader; run with RA_BENCHMARK=1 pytest -s."""
+    bodies = _bodies(large_user_awards_fixture)
+    rounds = 50
+
+    def timed(loads) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for body in bodies:
+                loads(body)
+        return time.perf_counter() - start
+
+    stdlib = timed(json.loads)
+    fast = timed(json_loads)
+    print(  # noqa: T201
+        f"\ndecode {len(bodies)} bodies x{rounds}: json {stdlib * 1000:.1f} ms, "
+        f"json_loads {fast * 1000:.1f} ms"
+    )
+    assert fast < stdlib
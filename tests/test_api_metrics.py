@@ -0,0 +1,101 @@
+"""Tests for per-endpoint API request metrics."""
+
+from __future__ import annotations
+
+import re
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.api import (
+    ApiMetrics,
+    EndpointMetrics,
+    RetroAchievementsApiClient,
+    RetroAchievementsApiClientCommunicationError,
+    async_get_api_metrics,
+)
+from custom_components.retroarchievements.const import BASE_URL, DOMAIN
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+from custom_components.retroarchievements.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.retroarchievements.sensor import (
+    RetroAchievementsApiMetricsSensor,
+)
+
+SUMMARY = "API_GetUserSummary.php"
+SUMMARY_URL = re.compile(rf"^{re.escape(BASE_URL)}API_GetUserSummary\.php")
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def test_percentiles_use_nearest_rank():
+    metrics = EndpointMetrics()
+    assert metrics.percentile(50) is None
+    metrics.latencies.extend(i / 1000 for i in range(1, 101))
+    assert metrics.percentile(50) == 0.05
+    assert metrics.percentile(95) == 0.095
+    assert metrics.percentile(99) == 0.099
+    assert metrics.stats()["latency_p95_ms"] == 95.0
+
+
+def test_latency_samples_are_bounded():
+    metrics = ApiMetrics(samples=3)
+    for latency in (1.0, 2.0, 3.0, 4.0):
+        metrics.record_request(SUMMARY, latency, 10, error=False)
+    endpoint = metrics.endpoint(SUMMARY)
+    assert list(endpoint.latencies) == [2.0, 3.0, 4.0]
+    assert endpoint.requests == 4
+    assert endpoint.stats()["mean_bytes"] == 10
+
+
+async def test_client_records_requests_sizes_errors_and_retries(
+    session, user_summary_fixture
+):
+    metrics = ApiMetrics()
+    client = RetroAchievementsApiClient("TestUser", "key", session, metrics=metrics)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=503)
+        m.get(SUMMARY_URL, payload=user_summary_fixture)
+        await client.async_get_user_summary()
+        for _ in range(4):
+            m.get(SUMMARY_URL, status=500)
+        with pytest.raises(RetroAchievementsApiClientCommunicationError):
+            await client.async_get_user_summary()
+
+    stats = metrics.stats()[SUMMARY]
+    assert stats["requests"] == 6
+    assert stats["errors"] == 5
+    assert stats["retries"] == 4
+    assert stats["last_bytes"] > 0
+    assert stats["latency_p50_ms"] is not None
+
+
+async def test_metrics_in_diagnostics_and_sensor(hass, mock_api_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        entry_id="t",
+    )
+    metrics = async_get_api_metrics(hass, "key")
+    metrics.record_request(SUMMARY, 0.2, 512, error=False)
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+    await coord.async_refresh()
+    entry.runtime_data = coord
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+    assert result["api_metrics"][SUMMARY]["requests"] == 1
+
+    sensor = RetroAchievementsApiMetricsSensor(coord, "TestUser", metrics, SUMMARY)
+    assert sensor.unique_id == f"{DOMAIN}_TestUser_api_getusersummary"
+    assert sensor.native_value == 200.0
+    assert sensor.extra_state_attributes["last_bytes"] == 512
+    assert sensor.entity_registry_enabled_default is False
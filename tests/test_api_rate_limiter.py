@@ -0,0 +1,80 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from custom_components.retroarchievements.api import (
+    RetroAchievementsApiClient,
+    TokenBucket,
+    async_get_rate_limiter,
+)
+from custom_components.retroarchievements.const import BASE_URL
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def _url(endpoint: str) -> re.Pattern:
+    return re.compile(rf"^{re.escape(BASE_URL)}{re.escape(endpoint)}")
+
+
+async def test_burst_does_not_wait():
+    bucket = TokenBucket(rate=1, burst=3)
+    with patch("asyncio.sleep") as sleep:
+        for _ in range(3):
+            await bucket.acquire()
+    sleep.assert_not_called()
+    stats = bucket.stats()
+    assert stats["acquired"] == 3
+    assert stats["delayed"] == 0
+    assert stats["max_queue_depth"] == 0
+
+
+async def test_empty_bucket_waits_for_refill():
+    bucket = TokenBucket(rate=100, burst=1)
+    await bucket.acquire()
+    await asyncio.gather(bucket.acquire(), bucket.acquire())
+    stats = bucket.stats()
+    assert stats["acquired"] == 3
+    assert stats["delayed"] == 2
+    # The second caller queues behind the first, which waits for a token.
+    assert stats["max_queue_depth"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["total_wait"] > 0
+
+
+async def test_configure_caps_tokens_at_new_burst():
+    bucket = TokenBucket(rate=1, burst=10)
+    bucket.configure(2, 1)
+    assert bucket.rate == 2
+    assert bucket.burst == 1
+    await bucket.acquire()
+    with patch("custom_components.retroarchievements.api.asyncio.sleep") as sleep:
+        await bucket.acquire()
+    sleep.assert_called_once()
+
+
+async def test_limiter_shared_per_api_key(hass):
+    first = async_get_rate_limiter(hass, "key")
+    assert async_get_rate_limiter(hass, "key") is first
+    assert async_get_rate_limiter(hass, "other") is not first
+
+
+async def test_cached_responses_do_not_consume_tokens(session, console_ids_fixture):
+    bucket = TokenBucket(rate=1, burst=5)
+    client = RetroAchievementsApiClient("TestUser", "key", session, rate_limiter=bucket)
+    with aioresponses() as m:
+        m.get(_url("API_GetConsoleIDs.php"), payload=console_ids_fixture)
+        await client.async_get_console_ids()
+        await client.async_get_console_ids()
+    assert bucket.acquired == 1
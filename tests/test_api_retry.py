@@ -0,0 +1,99 @@
+"""Tests for retrying transient API failures."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from custom_components.retroarchievements.api import (
+    RetroAchievementsApiClient,
+    RetroAchievementsApiClientAuthenticationError,
+    RetroAchievementsApiClientCommunicationError,
+    RetroAchievementsApiClientRateLimitError,
+    _parse_retry_after,
+)
+from custom_components.retroarchievements.const import API_RETRY_ATTEMPTS, BASE_URL
+
+SUMMARY_URL = re.compile(rf"^{re.escape(BASE_URL)}API_GetUserSummary\.php")
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def _request_count(m: aioresponses) -> int:
+    return sum(len(calls) for calls in m.requests.values())
+
+
+async def test_server_error_is_retried(session, user_summary_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=502)
+        m.get(SUMMARY_URL, exception=TimeoutError())
+        m.get(SUMMARY_URL, payload=user_summary_fixture)
+        result = await client.async_get_user_summary()
+    assert result == user_summary_fixture
+
+
+async def test_gives_up_after_max_attempts(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=503, repeat=True)
+        with pytest.raises(RetroAchievementsApiClientCommunicationError):
+            await client.async_get_user_summary()
+        assert _request_count(m) == API_RETRY_ATTEMPTS + 1
+
+
+async def test_client_errors_are_not_retried(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=404, repeat=True)
+        with pytest.raises(RetroAchievementsApiClientCommunicationError):
+            await client.async_get_user_summary()
+        assert _request_count(m) == 1
+
+
+async def test_authentication_error_is_not_retried(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=401, repeat=True)
+        with pytest.raises(RetroAchievementsApiClientAuthenticationError):
+            await client.async_get_user_summary()
+        assert _request_count(m) == 1
+
+
+async def test_rate_limit_waits_for_retry_after(session, user_summary_fixture):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with (
+        aioresponses() as m,
+        patch(
+            "custom_components.retroarchievements.api.asyncio.sleep", AsyncMock()
+        ) as sleep,
+    ):
+        m.get(SUMMARY_URL, status=429, headers={"Retry-After": "3"})
+        m.get(SUMMARY_URL, payload=user_summary_fixture)
+        assert await client.async_get_user_summary() == user_summary_fixture
+    sleep.assert_awaited_once_with(3.0)
+
+
+async def test_retry_after_beyond_budget_raises(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(SUMMARY_URL, status=429, headers={"Retry-After": "3600"}, repeat=True)
+        with pytest.raises(RetroAchievementsApiClientRateLimitError) as exc_info:
+            await client.async_get_user_summary()
+        assert _request_count(m) == 1
+    assert exc_info.value.retry_after == 3600
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("5") == 5
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert _parse_retry_after("soon") is None
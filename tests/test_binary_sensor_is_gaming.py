@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.retroarchievements.binary_sensor import (
     RetroAchievementsIsGamingBinarySensor,
@@ -121,3 +124,81 @@ async def test_is_gaming_false_on_unparseable_timestamp(hass):
     )
     sensor = RetroAchievementsIsGamingBinarySensor(coord, "TestUser")
     assert sensor.is_on is False
+
+
+async def test_is_gaming_turns_off_when_idle_threshold_passes(hass, freezer):
+    coord = _make_coord_with_data(
+        hass,
+        {
+            "RichPresenceMsg": "Playing Sonic",
+            "Status": "Online",
+            "LastActivity": {"timestamp": _ts_minutes_ago(3)},
+        },
+    )
+    sensor = RetroAchievementsIsGamingBinarySensor(coord, "TestUser")
+    sensor.hass = hass
+    with patch.object(sensor, "async_write_ha_state") as write:
+        sensor._handle_coordinator_update()
+        assert sensor.is_on is True
+        write.reset_mock()
+
+        freezer.tick(timedelta(minutes=1, seconds=30))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        write.assert_not_called()
+
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        write.assert_called_once()
+        assert sensor.is_on is False
+
+
+async def test_is_gaming_reschedules_on_new_activity(hass, freezer):
+    summary = {
+        "RichPresenceMsg": "Playing Sonic",
+        "Status": "Online",
+        "LastActivity": {"timestamp": _ts_minutes_ago(4)},
+    }
+    coord = _make_coord_with_data(hass, summary)
+    sensor = RetroAchievementsIsGamingBinarySensor(coord, "TestUser")
+    sensor.hass = hass
+    with patch.object(sensor, "async_write_ha_state") as write:
+        sensor._handle_coordinator_update()
+        first = sensor._unsub_idle
+
+        coord.data = {
+            "user_summary": {
+                **summary,
+                "LastActivity": {"timestamp": _ts_minutes_ago(0)},
+            }
+        }
+        sensor._handle_coordinator_update()
+        assert sensor._unsub_idle is not first
+        write.reset_mock()
+
+        freezer.tick(timedelta(minutes=2))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        write.assert_not_called()
+        assert sensor.is_on is True
+        sensor._cancel_idle_transition()
+
+
+async def test_last_activity_is_parsed_once_per_summary(hass):
+    coord = _make_coord_with_data(
+        hass,
+        {
+            "RichPresenceMsg": "Playing Sonic",
+            "Status": "Online",
+            "LastActivity": {"timestamp": _ts_minutes_ago(1)},
+        },
+    )
+    with patch.object(
+        RetroAchievementsDataUpdateCoordinator,
+        "_parse_last_activity",
+        wraps=RetroAchievementsDataUpdateCoordinator._parse_last_activity,
+    ) as parse:
+        for _ in range(5):
+            coord.is_gaming()
+    assert parse.call_count == 1
@@ -0,0 +1,62 @@
+"""Tests for the endpoint circuit breaker."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.retroarchievements.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+def test_stays_closed_below_threshold():
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure(Exception("boom"))
+    breaker.record_failure(Exception("boom"))
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow() is True
+
+
+def test_opens_after_threshold_and_probes_later(freezer):
+    breaker = CircuitBreaker(failure_threshold=2, base_delay=60, max_delay=600)
+    breaker.record_failure()
+    breaker.record_failure(Exception("boom"))
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow() is False
+    assert breaker.as_dict()["last_error"] == "boom"
+
+    freezer.tick(timedelta(seconds=59))
+    assert breaker.allow() is False
+    freezer.tick(timedelta(seconds=1))
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow() is True
+
+
+def test_failed_probes_back_off_exponentially(freezer):
+    breaker = CircuitBreaker(failure_threshold=1, base_delay=60, max_delay=200)
+    steps = []
+    for _ in range(4):
+        before = dt_util.utcnow()
+        breaker.record_failure()
+        steps.append((breaker.next_probe - before).total_seconds())
+        freezer.move_to(breaker.next_probe)
+    assert steps == [60, 120, 200, 200]
+
+
+def test_success_closes_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(Exception("boom"))
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.as_dict() == {
+        "state": STATE_CLOSED,
+        "failures": 0,
+        "opened_at": None,
+        "next_probe": None,
+        "last_error": None,
+    }
@@ -0,0 +1,112 @@
+"""Tests for the persistent GetGameExtended cache."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.cache import GameExtendedCache
+from custom_components.retroarchievements.const import DOMAIN
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="cache_entry",
+    )
+
+
+async def test_set_compacts_payload(hass, game_extended_fixture):
+    cache = GameExtendedCache(hass, "test.cache")
+    data = cache.set(678, game_extended_fixture)
+    assert data["Title"] == "Sonic the Hedgehog"
+    assert data["Achievements"]["12345"] == {
+        "NumAwarded": 125,
+        "NumAwardedHardcore": 42,
+        "TrueRatio": 7,
+        "DisplayOrder": 1,
+        "Author": "Devname",
+    }
+    assert cache.revision(678) == 1
+    assert cache.get(678) is data
+
+
+async def test_lru_bound_on_entry_count(hass, game_extended_fixture):
+    cache = GameExtendedCache(hass, "test.cache", max_entries=2)
+    cache.set(1, game_extended_fixture)
+    cache.set(2, game_extended_fixture)
+    cache.get(1)  # 2 is now least recently used
+    cache.set(3, game_extended_fixture)
+    assert 1 in cache
+    assert 2 not in cache
+    assert 3 in cache
+
+
+async def test_lru_bound_on_total_size(hass, game_extended_fixture):
+    cache = GameExtendedCache(hass, "test.cache")
+    cache.set(1, game_extended_fixture)
+    one_entry = cache.total_bytes
+    bounded = GameExtendedCache(hass, "test.cache", max_bytes=one_entry * 2)
+    for game_id in range(5):
+        bounded.set(game_id, game_extended_fixture)
+    assert len(bounded) == 2
+    assert bounded.total_bytes <= one_entry * 2
+
+
+async def test_cache_round_trips_through_store(
+    hass, hass_storage, game_extended_fixture
+):
+    cache = GameExtendedCache(hass, "test.cache")
+    cache.set(678, game_extended_fixture)
+    hass_storage["test.cache"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "test.cache",
+        "data": cache._data_to_save(),
+    }
+
+    restored = GameExtendedCache(hass, "test.cache")
+    await restored.async_load()
+    assert restored.get(678) == cache.get(678)
+    assert restored.revision(678) == 1
+
+
+async def test_coordinator_reuses_cache_across_instances(
+    hass, mock_api_client, mock_entry, hass_storage
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord._get_cached_game_extended(678)
+    await coord._get_cached_game_extended(678)
+    assert mock_api_client.async_get_game_extended.await_count == 1
+
+
+async def test_unknown_achievement_refetches_revised_set(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord._get_cached_game_extended(678, 12345)
+    await coord._get_cached_game_extended(678, 12345)
+    assert mock_api_client.async_get_game_extended.await_count == 1
+    await coord._get_cached_game_extended(678, 99999)
+    assert mock_api_client.async_get_game_extended.await_count == 2
+
+
+async def test_recently_played_count_change_invalidates_entry(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord._get_cached_game_extended(678)
+    coord._invalidate_revised_games(
+        {"RecentlyPlayed": [{"GameID": 678, "AchievementsTotal": 1}]}
+    )
+    assert 678 in coord._game_extended_cache
+    coord._invalidate_revised_games(
+        {"RecentlyPlayed": [{"GameID": 678, "AchievementsTotal": 40}]}
+    )
+    assert 678 not in coord._game_extended_cache
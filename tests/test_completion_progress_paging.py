@@ -0,0 +1,188 @@
+"""Tests for paging GetUserCompletionProgress and folding it incrementally."""
+
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.api import RetroAchievementsApiClient
+from custom_components.retroarchievements.const import (
+    BASE_URL,
+    COMPLETION_PROGRESS_FULL_SYNC,
+    DOMAIN,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+PROGRESS_URL = re.compile(rf"^{re.escape(BASE_URL)}API_GetUserCompletionProgress\.php")
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def _game(game_id: int, day: int) -> dict:
+    return {
+        "GameID": game_id,
+        "Title": f"Game {game_id}",
+        "ImageIcon": "/Images/icon.png",
+        "ConsoleName": "Mega Drive",
+        "MaxPossible": 10,
+        "NumAwarded": 1,
+        "NumAwardedHardcore": 1,
+        "MostRecentAwardedDate": f"2026-01-{day:02d}T00:00:00.000Z",
+        "HighestAwardKind": None,
+        "HighestAwardDate": None,
+    }
+
+
+class FakeSite:
+    """Serve a played-game list in pages, most recently awarded first."""
+
+    def __init__(self, games: list[dict]) -> None:
+        self.games = games
+        self.offsets: list[int] = []
+
+    def page(self, offset: int, count: int) -> dict:
+        self.offsets.append(offset)
+        ordered = sorted(
+            self.games, key=lambda g: g["MostRecentAwardedDate"], reverse=True
+        )
+        results = [dict(game) for game in ordered[offset : offset + count]]
+        return {"Count": len(results), "Total": len(self.games), "Results": results}
+
+    def callback(self, url, **_kwargs) -> CallbackResult:
+        query = parse_qs(urlparse(str(url)).query)
+        return CallbackResult(payload=self.page(int(query["o"][0]), int(query["c"][0])))
+
+    async def iterate(self, page_size: int = 2, **_kw):
+        first = self.page(0, page_size)
+        yield first
+        for offset in range(page_size, first["Total"], page_size):
+            yield self.page(offset, page_size)
+
+
+async def test_iterator_walks_every_page(session):
+    site = FakeSite([_game(i, i) for i in range(1, 1201)])
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, callback=site.callback, repeat=True)
+        client = RetroAchievementsApiClient("TestUser", "key", session)
+        pages = [page async for page in client.async_iter_user_completion_progress()]
+    assert sorted(site.offsets) == [0, 500, 1000]
+    assert [len(page["Results"]) for page in pages] == [500, 500, 200]
+
+
+async def test_pages_keep_only_model_fields(session):
+    site = FakeSite([_game(1, 1)])
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, callback=site.callback)
+        client = RetroAchievementsApiClient("TestUser", "key", session)
+        page = await client.async_get_user_completion_progress_page()
+    assert page["Total"] == 1
+    assert "ImageIcon" not in page["Results"][0]
+    assert page["Results"][0]["GameID"] == 1
+
+
+async def test_merged_progress_is_no_longer_truncated(session):
+    site = FakeSite([_game(i, 1 + i % 28) for i in range(1, 601)])
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, callback=site.callback, repeat=True)
+        client = RetroAchievementsApiClient("TestUser", "key", session)
+        result = await client.async_get_user_completion_progress()
+    assert result["Total"] == result["Count"] == 600
+    assert len({game["GameID"] for game in result["Results"]}) == 600
+
+
+async def test_stopping_early_skips_remaining_pages(session):
+    site = FakeSite([_game(i, 1 + i % 28) for i in range(1, 1201)])
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, callback=site.callback, repeat=True)
+        client = RetroAchievementsApiClient("TestUser", "key", session)
+        async for _page in client.async_iter_user_completion_progress(concurrency=1):
+            break
+    assert site.offsets == [0]
+
+
+@pytest.fixture
+def site(mock_api_client):
+    site = FakeSite([_game(i, i) for i in range(1, 8)])
+    mock_api_client.async_iter_user_completion_progress.side_effect = site.iterate
+    return site
+
+
+def _coordinator(hass, mock_api_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        entry_id="test_entry",
+    )
+    return RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+
+
+async def test_coordinator_keeps_a_record_per_game(hass, mock_api_client, site):
+    coord = _coordinator(hass, mock_api_client)
+    progress = await coord._get_completion_progress()
+    assert progress["Total"] == 7
+    assert set(progress["Games"]) == {str(i) for i in range(1, 8)}
+    assert site.offsets == [0, 2, 4, 6]
+
+
+async def test_unchanged_progress_reads_only_the_first_page(
+    hass, mock_api_client, site
+):
+    coord = _coordinator(hass, mock_api_client)
+    await coord._get_completion_progress()
+    site.offsets.clear()
+
+    await coord._get_completion_progress()
+    assert site.offsets == [0]
+
+
+async def test_new_unlocks_read_until_known_games(hass, mock_api_client, site):
+    coord = _coordinator(hass, mock_api_client)
+    await coord._get_completion_progress()
+    site.offsets.clear()
+
+    # Two old games get new unlocks and jump to the front of the list.
+    for game in site.games:
+        if game["GameID"] in (1, 2):
+            game["MostRecentAwardedDate"] = "2026-02-01T00:00:00.000Z"
+            game["NumAwarded"] = 5
+    progress = await coord._get_completion_progress()
+
+    assert site.offsets == [0, 2]
+    assert progress["Games"]["1"]["NumAwarded"] == 5
+    assert progress["Games"]["2"]["NumAwarded"] == 5
+    assert len(progress["Games"]) == 7
+
+
+async def test_total_change_walks_every_page(hass, mock_api_client, site):
+    coord = _coordinator(hass, mock_api_client)
+    await coord._get_completion_progress()
+    site.offsets.clear()
+
+    site.games.append(_game(99, 20))
+    progress = await coord._get_completion_progress()
+
+    assert site.offsets == [0, 0, 2, 4, 6]
+    assert progress["Total"] == 8
+    assert "99" in progress["Games"]
+
+
+async def test_full_sync_runs_periodically(hass, mock_api_client, site, freezer):
+    coord = _coordinator(hass, mock_api_client)
+    await coord._get_completion_progress()
+    site.offsets.clear()
+
+    freezer.tick(timedelta(seconds=COMPLETION_PROGRESS_FULL_SYNC))
+    await coord._get_completion_progress()
+    assert site.offsets == [0, 2, 4, 6]
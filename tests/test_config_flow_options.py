@@ -11,6 +11,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.retroarchievements.const import (
     CONF_GAMING_IDLE_THRESHOLD,
     CONF_MONITORED_GAMES,
+    CONF_PRESENCE_PROBE_INTERVAL,
     DOMAIN,
 )
 
@@ -78,6 +79,26 @@ async def test_manage_step_rejects_threshold_too_high(
         )
 
 
+@pytest.mark.parametrize(("interval", "accepted"), [(0, True), (5, False), (30, True)])
+async def test_manage_step_requires_sensible_probe_interval(
+    hass, mock_entry, enable_custom_integrations, interval, accepted
+):
+    result = await _open_menu(hass, mock_entry)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "manage"}
+    )
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_MONITORED_GAMES: "", CONF_PRESENCE_PROBE_INTERVAL: interval},
+    )
+    if accepted:
+        assert result2["type"] == "create_entry"
+        assert result2["data"][CONF_PRESENCE_PROBE_INTERVAL] == interval
+    else:
+        assert result2["type"] == "form"
+        assert result2["errors"] == {"base": "probe_interval_too_short"}
+
+
 async def test_picker_selects_games(
     hass, mock_entry, enable_custom_integrations, patched_client
 ):
@@ -0,0 +1,90 @@
+"""Tests for activity-adaptive polling in the coordinator."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    DOMAIN,
+    UPDATE_INTERVAL,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+def _entry(**options):
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options=options,
+        entry_id="adaptive",
+    )
+
+
+def _summary(minutes_ago: int, *, online: bool = True) -> dict:
+    ts = (datetime.now(UTC) - timedelta(minutes=minutes_ago)).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+    return {
+        "RichPresenceMsg": "Playing Sonic",
+        "Status": "Online" if online else "Offline",
+        "LastActivity": {"timestamp": ts},
+        "RecentlyPlayed": [],
+        "RecentAchievements": {},
+    }
+
+
+@pytest.fixture
+def idle_summary():
+    # LastActivity must stay identical between refreshes to count as idle.
+    return _summary(120, online=False)
+
+
+async def test_interval_fixed_when_adaptive_disabled(
+    hass, mock_api_client, idle_summary
+):
+    mock_api_client.async_get_user_summary.return_value = idle_summary
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, _entry())
+    for _ in range(3):
+        await coord.async_refresh()
+    assert coord.update_interval == timedelta(seconds=UPDATE_INTERVAL)
+
+
+async def test_idle_backs_off_to_ceiling(hass, mock_api_client, idle_summary):
+    mock_api_client.async_get_user_summary.return_value = idle_summary
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass,
+        mock_api_client,
+        _entry(adaptive_polling=True, max_poll_interval=5),
+    )
+    await coord.async_refresh()  # first sighting of LastActivity counts as activity
+    assert coord.update_interval == timedelta(seconds=UPDATE_INTERVAL)
+    await coord.async_refresh()
+    assert coord.update_interval == timedelta(minutes=2)
+    await coord.async_refresh()
+    assert coord.update_interval == timedelta(minutes=4)
+    await coord.async_refresh()
+    assert coord.update_interval == timedelta(minutes=5)
+    await coord.async_refresh()
+    assert coord.update_interval == timedelta(minutes=5)
+
+
+async def test_activity_snaps_back_to_fast_polling(hass, mock_api_client, idle_summary):
+    mock_api_client.async_get_user_summary.return_value = idle_summary
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass,
+        mock_api_client,
+        _entry(adaptive_polling=True, max_poll_interval=30),
+    )
+    for _ in range(4):
+        await coord.async_refresh()
+    assert coord.update_interval > timedelta(seconds=UPDATE_INTERVAL)
+
+    mock_api_client.async_get_user_summary.return_value = _summary(1)
+    await coord.async_refresh()
+    assert coord.update_interval == timedelta(seconds=UPDATE_INTERVAL)
+    assert coord.is_gaming() is True
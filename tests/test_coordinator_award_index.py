@@ -0,0 +1,97 @@
+"""Tests for diffing awards through the key->award index."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import DOMAIN, EVENT_AWARD_EARNED
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="t",
+    )
+
+
+def test_index_awards_keys_every_visible_award(user_awards_fixture):
+    index = RetroAchievementsDataUpdateCoordinator._index_awards(user_awards_fixture)
+    assert set(index) == {"Mastery/Completion:678:1", "Game Beaten:700:1"}
+    assert index["Game Beaten:700:1"]["Title"] == "Streets of Rage"
+
+
+def test_index_awards_skips_malformed_entries():
+    index = RetroAchievementsDataUpdateCoordinator._index_awards(
+        {"VisibleUserAwards": [None, "x", {"AwardType": "Site", "AwardData": 1}]}
+    )
+    assert list(index) == ["Site:1:None"]
+    assert RetroAchievementsDataUpdateCoordinator._index_awards(None) == {}
+
+
+async def test_unchanged_awards_payload_reuses_index(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    index = coord._award_index
+    await coord.async_refresh()  # medium tier not due: same awards object
+    assert coord._award_index is index
+
+
+async def _refresh_with_new_awards(hass, coord, mock_api_client, awards) -> float:
+    """Refresh with five awards prepended to a large list; return the refresh time."""
+    earned, awards["VisibleUserAwards"] = (
+        awards["VisibleUserAwards"][:5],
+        awards["VisibleUserAwards"][5:],
+    )
+    mock_api_client.async_get_user_awards.return_value = awards
+    await coord.async_refresh()
+
+    mock_api_client.async_get_user_awards.return_value = {
+        **awards,
+        "VisibleUserAwards": earned + awards["VisibleUserAwards"],
+    }
+    coord._tier_last_refresh.clear()  # slow/medium tiers are cached otherwise
+    start = time.perf_counter()
+    await coord.async_refresh()
+    elapsed = time.perf_counter() - start
+    await hass.async_block_till_done()
+    return elapsed
+
+
+async def test_large_award_list_fires_only_new_awards(
+    hass, mock_api_client, mock_entry, large_user_awards_fixture
+):
+    fired = []
+    hass.bus.async_listen(EVENT_AWARD_EARNED, lambda e: fired.append(e))
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await _refresh_with_new_awards(
+        hass, coord, mock_api_client, large_user_awards_fixture
+    )
+    assert sorted(e.data["game_id"] for e in fired) == [
+        10_000,
+        10_001,
+        10_002,
+        10_003,
+        10_004,
+    ]
+
+
+@pytest.mark.benchmark
+async def test_benchmark_large_award_list_diff(
+    hass, mock_api_client, mock_entry, large_user_awards_fixture
+):
+    """Time a refresh diffing 2,000 awards; run with RA_BENCHMARK=1 pytest -s."""
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    elapsed = await _refresh_with_new_awards(
+        hass, coord, mock_api_client, large_user_awards_fixture
+    )
+    print(f"\nrefresh with 2,000 awards, 5 new: {elapsed * 1000:.1f} ms")  # noqa: T201
+    assert elapsed < 0.5
@@ -0,0 +1,105 @@
+"""Tests for skipping failing optional endpoints behind circuit breakers."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    CIRCUIT_BASE_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CONF_MONITORED_GAMES,
+    DOMAIN,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+from custom_components.retroarchievements.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+def _coordinator(hass, mock_api_client, **options):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options=options,
+        entry_id="test_entry",
+    )
+    return RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+
+
+async def _refresh_all(coord):
+    coord._tier_last_refresh.clear()  # slow/medium tiers are cached otherwise
+    await coord.async_refresh()
+
+
+async def test_failing_endpoint_is_skipped_then_probed(hass, mock_api_client, freezer):
+    mock_api_client.async_get_user_set_requests.return_value = {"Total": 1}
+    coord = _coordinator(hass, mock_api_client)
+    await _refresh_all(coord)
+
+    mock_api_client.async_get_user_set_requests.side_effect = Exception("boom")
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD + 2):
+        await _refresh_all(coord)
+    calls = mock_api_client.async_get_user_set_requests.await_count
+    assert calls == 1 + CIRCUIT_FAILURE_THRESHOLD
+    assert coord.breakers["set requests"].state == "open"
+    # Failing and skipped refreshes keep the last value.
+    assert coord.data["set_requests"] == {"Total": 1}
+    # Healthy endpoints are unaffected.
+    assert mock_api_client.async_get_user_points.await_count == calls + 2
+
+    mock_api_client.async_get_user_set_requests.side_effect = None
+    mock_api_client.async_get_user_set_requests.return_value = {"Total": 2}
+    freezer.tick(timedelta(seconds=CIRCUIT_BASE_DELAY))
+    await _refresh_all(coord)
+    assert coord.breakers["set requests"].state == "closed"
+    assert coord.data["set_requests"] == {"Total": 2}
+
+
+async def test_endpoint_failing_from_start_is_empty(hass, mock_api_client):
+    mock_api_client.async_get_user_set_requests.side_effect = Exception("boom")
+    coord = _coordinator(hass, mock_api_client)
+    await _refresh_all(coord)
+    assert coord.last_update_success
+    assert coord.data["set_requests"] == {}
+
+
+async def test_failing_game_keeps_last_known_data(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, **{CONF_MONITORED_GAMES: "1\n2"})
+    await coord.async_refresh()
+    known = coord.data["Leaderboards"]["1"]
+
+    async def leaderboards(game_id):
+        if game_id == 1:
+            raise Exception("boom")  # noqa: TRY002
+        return {"Results": []}
+
+    mock_api_client.async_get_user_game_leaderboards.side_effect = leaderboards
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD + 2):
+        await coord.async_refresh()
+
+    requested = [
+        call.args[0]
+        for call in mock_api_client.async_get_user_game_leaderboards.await_args_list
+    ]
+    assert requested.count(1) == 1 + CIRCUIT_FAILURE_THRESHOLD
+    assert coord.breakers["Leaderboards:1"].state == "open"
+    assert coord.breakers["Leaderboards:2"].state == "closed"
+    assert coord.data["Leaderboards"]["1"] == known
+
+
+async def test_diagnostics_report_breakers(hass, mock_api_client):
+    mock_api_client.async_get_users_following_me.side_effect = Exception("boom")
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    coord.entry.runtime_data = coord
+
+    result = await async_get_config_entry_diagnostics(hass, coord.entry)
+
+    followers = result["circuit_breakers"]["users following me"]
+    assert followers["failures"] == 1
+    assert followers["last_error"] == "boom"
+    assert result["circuit_breakers"]["user points"]["state"] == "closed"
@@ -112,6 +112,7 @@ async def test_aotw_change_fires_event(hass, mock_api_client, mock_entry, aotw_f
         "Achievement": {**aotw_fixture["Achievement"], "ID": 88888, "Title": "New"},
     }
     mock_api_client.async_get_achievement_of_the_week.return_value = new_aotw
+    coord._tier_last_refresh.clear()  # slow/medium tiers are cached otherwise
     await coord.async_refresh()
     await hass.async_block_till_done()
 
@@ -0,0 +1,111 @@
+"""Tests for the bounded per-game fetch pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    CONF_GAME_FETCH_CONCURRENCY,
+    CONF_MONITORED_GAMES,
+    DOMAIN,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+LATENCY = 0.05  # simulated seconds per API round trip
+
+
+def _entry(game_count: int, concurrency: int) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={
+            CONF_MONITORED_GAMES: "\n".join(str(i) for i in range(1, game_count + 1)),
+            CONF_GAME_FETCH_CONCURRENCY: concurrency,
+        },
+        entry_id="test_entry",
+    )
+
+
+def _slow_client(mock_api_client, in_flight: list[int]):
+    """Make per-game calls sleep LATENCY and record the peak in-flight count."""
+    active = 0
+
+    def delayed(result):
+        async def call(*_args):
+            nonlocal active
+            active += 1
+            in_flight.append(active)
+            await asyncio.sleep(LATENCY)
+            active -= 1
+            return result
+
+        return call
+
+    mock_api_client.async_get_user_progress_batch.side_effect = delayed({})
+    mock_api_client.async_get_user_game_leaderboards.side_effect = delayed({})
+    mock_api_client.async_get_user_game_rank_and_score.side_effect = delayed(
+        [{"Score": 1}]
+    )
+    return mock_api_client
+
+
+async def test_requests_in_flight_are_capped(hass, mock_api_client):
+    in_flight: list[int] = []
+    client = _slow_client(mock_api_client, in_flight)
+    coord = RetroAchievementsDataUpdateCoordinator(hass, client, _entry(10, 3))
+    game_data = await coord._get_game_data()
+    assert max(in_flight) == 3
+    assert len(in_flight) == 1 + 2 * 10
+    assert set(game_data["RankScore"]) == {str(i) for i in range(1, 11)}
+
+
+async def test_progress_chunks_share_the_cap(hass, mock_api_client, monkeypatch):
+    monkeypatch.setattr(
+        "custom_components.retroarchievements.coordinator.USER_PROGRESS_CHUNK_SIZE", 4
+    )
+    in_flight: list[int] = []
+    client = _slow_client(mock_api_client, in_flight)
+    coord = RetroAchievementsDataUpdateCoordinator(hass, client, _entry(10, 3))
+    await coord._get_game_data()
+    assert max(in_flight) == 3
+    assert client.async_get_user_progress_batch.call_count == 3
+    assert len(in_flight) == 3 + 2 * 10
+
+
+async def test_all_sections_share_one_round_trip(hass, mock_api_client):
+    in_flight: list[int] = []
+    client = _slow_client(mock_api_client, in_flight)
+    coord = RetroAchievementsDataUpdateCoordinator(hass, client, _entry(5, 32))
+    await coord._get_game_data()
+    # Progress, leaderboards and rank for every game are in flight together.
+    assert max(in_flight) == 1 + 2 * 5
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("game_count", [1, 5, 10, 25, 50])
+async def test_benchmark_game_data_wall_clock(hass, mock_api_client, game_count):
+    """
+    Report _get_game_data wall-clock time against monitored game count.
+
+    Run with `RA_BENCHMARK=1 pytest -s -k benchmark` to see the table; with
+    the default concurrency the time grows in steps of one round trip per 8
+    requests.
+    """
+    client = _slow_client(mock_api_client, [])
+    coord = RetroAchievementsDataUpdateCoordinator(hass, client, _entry(game_count, 8))
+    start = time.perf_counter()
+    await coord._get_game_data()
+    elapsed = time.perf_counter() - start
+    requests = 1 + 2 * game_count
+    waves = -(-requests // 8)
+    print(  # noqa: T201
+        f"\n{game_count:>3} games, {requests:>3} requests: "
+        f"{elapsed * 1000:7.1f} ms ({waves} round trips at {LATENCY * 1000:.0f} ms)"
+    )
+    assert elapsed < (waves + 1) * LATENCY * 1.5
@@ -0,0 +1,215 @@
+"""Tests for the shared site-wide (global) coordinator."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    DATA_GLOBAL_COORDINATOR,
+    DOMAIN,
+    EVENT_AOTW_CHANGED,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+    RetroAchievementsGlobalDataUpdateCoordinator,
+    snapshot_store_key,
+)
+
+
+def _entry(entry_id: str, username: str = "TestUser") -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": username, "api_key": "key"},
+        options={},
+        entry_id=entry_id,
+    )
+
+
+async def test_global_coordinator_fetches_site_wide_data(hass, mock_api_client):
+    coord = RetroAchievementsGlobalDataUpdateCoordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    assert coord.data["aotw"]["Achievement"]["ID"] == 99999
+    assert coord.data["top_ten"][0]["1"] == "AlphaPlayer"
+    assert coord.data["recent_game_awards"]["Total"] > 0
+    mock_api_client.async_get_user_summary.assert_not_awaited()
+
+
+async def test_global_coordinator_fires_aotw_changed_once(
+    hass, mock_api_client, aotw_fixture
+):
+    fired = []
+    hass.bus.async_listen(EVENT_AOTW_CHANGED, lambda e: fired.append(e))
+    coord = RetroAchievementsGlobalDataUpdateCoordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    mock_api_client.async_get_achievement_of_the_week.return_value = {
+        **aotw_fixture,
+        "Achievement": {**aotw_fixture["Achievement"], "ID": 88888},
+    }
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert [event.data["achievement_id"] for event in fired] == [88888]
+
+
+async def test_global_coordinator_keeps_last_value_on_failure(hass, mock_api_client):
+    fired = []
+    hass.bus.async_listen(EVENT_AOTW_CHANGED, lambda e: fired.append(e))
+    coord = RetroAchievementsGlobalDataUpdateCoordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    mock_api_client.async_get_achievement_of_the_week.side_effect = Exception("boom")
+    await coord.async_refresh()
+    assert coord.data["aotw"]["Achievement"]["ID"] == 99999
+
+    mock_api_client.async_get_achievement_of_the_week.side_effect = None
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    # The same AOTW coming back is not a change.
+    assert fired == []
+
+
+async def test_entry_coordinator_reads_global_data(hass, mock_api_client):
+    global_coord = RetroAchievementsGlobalDataUpdateCoordinator(hass, mock_api_client)
+    await global_coord.async_refresh()
+    mock_api_client.async_get_achievement_of_the_week.reset_mock()
+    mock_api_client.async_get_top_ten_users.reset_mock()
+
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass, mock_api_client, _entry("a"), global_coordinator=global_coord
+    )
+    await coord.async_refresh()
+
+    mock_api_client.async_get_achievement_of_the_week.assert_not_awaited()
+    mock_api_client.async_get_top_ten_users.assert_not_awaited()
+    assert coord.data["aotw"]["Achievement"]["ID"] == 99999
+    assert coord.data["top_ten"][0]["1"] == "AlphaPlayer"
+    assert coord.is_aotw_unlocked() is False
+
+
+async def test_global_update_fans_out_to_entry(hass, mock_api_client, aotw_fixture):
+    global_coord = RetroAchievementsGlobalDataUpdateCoordinator(hass, mock_api_client)
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass, mock_api_client, _entry("a"), global_coordinator=global_coord
+    )
+    await coord.async_refresh()
+    assert coord.data["aotw"] == {}
+
+    listener = MagicMock()
+    unsub_entry = coord.async_add_listener(listener)
+    unsub_global = global_coord.async_add_listener(coord.async_handle_global_update)
+    await global_coord.async_refresh()
+
+    assert coord.data["aotw"]["Achievement"]["ID"] == 99999
+    listener.assert_called()
+    unsub_global()
+    unsub_entry()
+
+
+async def test_entries_share_one_global_coordinator(
+    hass, enable_custom_integrations, mock_api_client
+):
+    first = _entry("first", "UserA")
+    second = _entry("second", "UserB")
+    first.add_to_hass(hass)
+    second.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        # Setting up the domain sets up both entries.
+        await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+
+        global_coord = hass.data[DOMAIN][DATA_GLOBAL_COORDINATOR]
+        assert first.runtime_data.global_coordinator is global_coord
+        assert second.runtime_data.global_coordinator is global_coord
+        assert mock_api_client.async_get_achievement_of_the_week.await_count == 1
+        assert second.runtime_data.data["aotw"]["Achievement"]["ID"] == 99999
+
+        await hass.config_entries.async_unload(first.entry_id)
+        assert DATA_GLOBAL_COORDINATOR in hass.data[DOMAIN]
+        await hass.config_entries.async_unload(second.entry_id)
+        await hass.async_block_till_done()
+    assert DATA_GLOBAL_COORDINATOR not in hass.data[DOMAIN]
+
+
+async def test_reloading_first_entry_keeps_global_coordinator_running(
+    hass, enable_custom_integrations, mock_api_client
+):
+    first = _entry("first", "UserA")
+    second = _entry("second", "UserB")
+    first.add_to_hass(hass)
+    second.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+        global_coord = hass.data[DOMAIN][DATA_GLOBAL_COORDINATOR]
+
+        await hass.config_entries.async_reload(first.entry_id)
+        await hass.async_block_till_done()
+
+        assert hass.data[DOMAIN][DATA_GLOBAL_COORDINATOR] is global_coord
+        assert first.runtime_data.global_coordinator is global_coord
+        mock_api_client.async_get_achievement_of_the_week.reset_mock()
+        await global_coord.async_refresh()
+        mock_api_client.async_get_achievement_of_the_week.assert_awaited_once()
+
+        await hass.config_entries.async_unload(first.entry_id)
+        await hass.config_entries.async_unload(second.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_released_owner_hands_client_to_remaining_entry(
+    hass, enable_custom_integrations, mock_api_client
+):
+    first = _entry("first", "UserA")
+    second = _entry("second", "UserB")
+    first.add_to_hass(hass)
+    second.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+        global_coord = hass.data[DOMAIN][DATA_GLOBAL_COORDINATOR]
+        global_coord._breaker("top ten users").record_failure()
+        replacement = MagicMock()
+        first.runtime_data.api_client = replacement
+
+        # The entry set up last owns the shared client.
+        await hass.config_entries.async_unload(second.entry_id)
+        await hass.async_block_till_done()
+        assert global_coord.api_client is replacement
+        assert global_coord.breakers == {}
+
+        await hass.config_entries.async_unload(first.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_aotw_change_during_downtime_fires_after_restore(
+    hass, hass_storage, enable_custom_integrations, mock_api_client
+):
+    hass_storage[snapshot_store_key("first")] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": snapshot_store_key("first"),
+        "data": {"data": {}, "achievement_ids": [], "award_keys": [], "aotw_id": 88888},
+    }
+    fired = []
+    hass.bus.async_listen(EVENT_AOTW_CHANGED, lambda e: fired.append(e))
+    first = _entry("first")
+    first.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+        await hass.config_entries.async_unload(first.entry_id)
+        await hass.async_block_till_done()
+    assert [event.data["achievement_id"] for event in fired] == [99999]
@@ -68,6 +68,7 @@ async def test_new_award_fires_event(
         ],
     }
     mock_api_client.async_get_user_awards.return_value = new_awards
+    coord._tier_last_refresh.clear()  # slow/medium tiers are cached otherwise
     await coord.async_refresh()
     await hass.async_block_till_done()
 
@@ -0,0 +1,126 @@
+"""Tests for prefetching GetGameExtended for the current game."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    DOMAIN,
+    EVENT_ACHIEVEMENT_UNLOCKED,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+@pytest.fixture(autouse=True)
+def _unrevised_set(user_summary_fixture):
+    """Match the sample set size so cached entries are not seen as revised."""
+    user_summary_fixture["RecentlyPlayed"][0]["AchievementsTotal"] = 1
+
+
+def _coordinator(hass, mock_api_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        entry_id="test_entry",
+    )
+    return RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+
+
+def _requested(mock_api_client) -> list[int]:
+    return [
+        call.args[0] for call in mock_api_client.async_get_game_extended.await_args_list
+    ]
+
+
+def test_current_game_prefers_last_game_id():
+    current = RetroAchievementsDataUpdateCoordinator._current_game_id
+    assert current({"LastGameID": 5, "RecentlyPlayed": [{"GameID": 6}]}) == 5
+    assert current({"RecentlyPlayed": [{"GameID": 6}]}) == 6
+    assert current({"RecentlyPlayed": []}) is None
+    assert current({"LastGameID": "x"}) is None
+
+
+async def test_new_game_is_prefetched_once(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert _requested(mock_api_client) == [678]
+    assert 678 in coord._game_extended_cache
+
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert _requested(mock_api_client) == [678]
+
+
+async def test_failed_prefetch_is_retried(hass, mock_api_client, game_extended_fixture):
+    coord = _coordinator(hass, mock_api_client)
+    mock_api_client.async_get_game_extended.side_effect = RuntimeError("boom")
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert 678 not in coord._game_extended_cache
+
+    mock_api_client.async_get_game_extended.side_effect = None
+    mock_api_client.async_get_game_extended.return_value = game_extended_fixture
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert _requested(mock_api_client) == [678, 678]
+    assert 678 in coord._game_extended_cache
+
+
+async def test_switching_games_prefetches_the_new_one(
+    hass, mock_api_client, user_summary_fixture
+):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    mock_api_client.async_get_user_summary.return_value = {
+        **user_summary_fixture,
+        "LastGameID": 900,
+    }
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert _requested(mock_api_client) == [678, 900]
+
+
+async def test_unlock_after_prefetch_is_a_cache_hit(
+    hass, mock_api_client, user_summary_fixture, game_extended_fixture
+):
+    fired = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_UNLOCKED, lambda e: fired.append(e))
+    game_extended_fixture["Achievements"]["777"] = {"NumAwarded": 5}
+    user_summary_fixture["RecentlyPlayed"][0]["AchievementsTotal"] = 2
+    mock_api_client.async_get_game_extended.return_value = game_extended_fixture
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    mock_api_client.async_get_game_extended.reset_mock()
+
+    recent = user_summary_fixture["RecentAchievements"]
+    mock_api_client.async_get_user_summary.return_value = {
+        **user_summary_fixture,
+        "RecentAchievements": {
+            "678": {
+                **recent["678"],
+                "777": {"ID": 777, "DateAwarded": "2026-05-18 12:30:00"},
+            }
+        },
+    }
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert len(fired) == 1
+    mock_api_client.async_get_game_extended.assert_not_awaited()
+
+
+async def test_revised_current_game_is_prefetched_again(
+    hass, mock_api_client, user_summary_fixture
+):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    user_summary_fixture["RecentlyPlayed"][0]["AchievementsTotal"] = 30
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert _requested(mock_api_client) == [678, 678]
@@ -0,0 +1,120 @@
+"""Tests for the lightweight presence probe between full refreshes."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.retroarchievements.const import (
+    CONF_PRESENCE_PROBE_INTERVAL,
+    DOMAIN,
+    MIN_PRESENCE_PROBE_INTERVAL,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+def _coordinator(hass, mock_api_client, **options):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options=options,
+        entry_id="test_entry",
+    )
+    return RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+
+
+def _profile(message: str, game_id: int = 678) -> dict:
+    return {
+        "RichPresenceMsg": message,
+        "LastGameID": game_id,
+        "RichPresenceMsgDate": "2026-10-18 12:00:00",
+    }
+
+
+def test_probe_disabled_by_default(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    assert coord.async_start_presence_probe() is None
+
+
+async def test_probe_starts_when_configured(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, **{CONF_PRESENCE_PROBE_INTERVAL: 30})
+    unsub = coord.async_start_presence_probe()
+    assert unsub is not None
+    unsub()
+
+
+async def test_probe_interval_has_a_floor(hass, mock_api_client, freezer):
+    # An interval stored before the minimum existed still probes sparingly.
+    coord = _coordinator(hass, mock_api_client, **{CONF_PRESENCE_PROBE_INTERVAL: 5})
+    coord.async_probe_presence = AsyncMock()
+    unsub = coord.async_start_presence_probe()
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    coord.async_probe_presence.assert_not_awaited()
+    freezer.tick(timedelta(seconds=MIN_PRESENCE_PROBE_INTERVAL))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    coord.async_probe_presence.assert_awaited()
+    unsub()
+
+
+async def test_probe_skipped_before_first_refresh(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_probe_presence()
+    mock_api_client.async_get_user_profile.assert_not_awaited()
+
+
+async def test_unchanged_presence_does_not_refresh(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    coord.async_request_refresh = AsyncMock()
+    mock_api_client.async_get_user_profile.return_value = _profile("Menu")
+
+    await coord.async_probe_presence()
+    await coord.async_probe_presence()
+
+    assert mock_api_client.async_get_user_profile.await_count == 2
+    coord.async_request_refresh.assert_not_awaited()
+
+
+async def test_presence_change_patches_summary_and_refreshes(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    coord.async_request_refresh = AsyncMock()
+    listener_calls = []
+    unsub = coord.async_add_listener(
+        lambda: listener_calls.append(coord.changed_sections)
+    )
+
+    mock_api_client.async_get_user_profile.return_value = _profile("Menu")
+    await coord.async_probe_presence()
+    mock_api_client.async_get_user_profile.return_value = _profile("World 1-2", 999)
+    await coord.async_probe_presence()
+
+    summary = coord.data["user_summary"]
+    assert summary["RichPresenceMsg"] == "World 1-2"
+    assert summary["LastGameID"] == 999
+    assert summary["LastActivity"]["timestamp"] == "2026-10-18 12:00:00"
+    assert listener_calls
+    assert "user_summary" in listener_calls[-1]
+    coord.async_request_refresh.assert_awaited_once()
+    unsub()
+
+
+async def test_probe_errors_are_swallowed(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client)
+    await coord.async_refresh()
+    before = coord.data
+    mock_api_client.async_get_user_profile.side_effect = Exception("boom")
+
+    await coord.async_probe_presence()
+
+    assert coord.data is before
@@ -0,0 +1,81 @@
+"""Tests for the derived RecentAchievements index."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import DOMAIN
+from custom_components.retroarchievements.coordinator import (
+    RecentAchievementsIndex,
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+RECENT = {
+    "678": {
+        "1": {"ID": 1, "DateAwarded": "2026-05-18 10:00:00"},
+        "2": {"ID": 2, "DateAwarded": "2026-05-18 12:00:00"},
+    },
+    "999": {
+        "3": {"ID": 3, "DateAwarded": "2026-05-18 11:00:00"},
+        "bad": "not an achievement",
+    },
+    "broken": None,
+}
+
+
+def test_build_flattens_and_sorts_newest_first():
+    index = RecentAchievementsIndex.build(RECENT)
+    assert [a["ID"] for a in index.unlocks] == [2, 3, 1]
+    assert index.latest["ID"] == 2
+    assert index.by_id[3] == (RECENT["999"]["3"], 999)
+    assert [a["ID"] for a in index.by_game["678"]] == [1, 2]
+    assert "broken" not in index.by_game
+
+
+def test_empty_index():
+    index = RecentAchievementsIndex.build({})
+    assert index.unlocks == []
+    assert index.latest is None
+    assert index.by_id == {}
+    assert RecentAchievementsIndex.build(None).by_id == {}
+
+
+def test_by_id_covers_every_game():
+    index = RecentAchievementsIndex.build(
+        {
+            "678": {"12345": {"ID": 12345}, "67890": {"ID": 67890}},
+            "999": {"55555": {"ID": 55555}},
+        }
+    )
+    assert set(index.by_id) == {12345, 67890, 55555}
+
+
+def test_by_id_skips_non_integer_keys():
+    index = RecentAchievementsIndex.build(
+        {"678": {"abc": {"ID": 0}, "12345": {"ID": 12345}}}
+    )
+    assert set(index.by_id) == {12345}
+
+
+def test_by_id_looks_up_payload_and_game_id():
+    achievement = {"ID": 12345, "Title": "First Blood"}
+    index = RecentAchievementsIndex.build({"678": {"12345": achievement}})
+    assert index.by_id[12345] == (achievement, 678)
+    assert 99999 not in index.by_id
+
+
+async def test_index_is_built_once_per_payload(hass, mock_api_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        entry_id="t",
+    )
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+    await coord.async_refresh()
+    index = coord.recent_index
+    assert coord.recent_index is index
+    assert 12345 in index.by_id
+
+    coord.data = {**coord.data, "RecentAchievements": RECENT}
+    assert coord.recent_index is not index
+    assert coord.recent_index.latest["ID"] == 2
@@ -0,0 +1,116 @@
+"""Tests for refreshing monitored games round-robin."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    CONF_GAMES_PER_REFRESH,
+    CONF_MONITORED_GAMES,
+    DOMAIN,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+def _coordinator(hass, mock_api_client, per_refresh: int, games=(1, 2, 3, 4, 5)):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={
+            CONF_MONITORED_GAMES: "\n".join(str(game) for game in games),
+            CONF_GAMES_PER_REFRESH: per_refresh,
+        },
+        entry_id="test_entry",
+    )
+
+    async def progress(game_ids):
+        return {str(game_id): {"NumAchieved": 1} for game_id in game_ids}
+
+    mock_api_client.async_get_user_progress_batch.side_effect = progress
+    return RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+
+
+def _fetched(mock_api_client) -> list[int]:
+    calls = mock_api_client.async_get_user_game_leaderboards.await_args_list
+    fetched = [call.args[0] for call in calls]
+    mock_api_client.async_get_user_game_leaderboards.reset_mock()
+    return fetched
+
+
+async def test_zero_refreshes_every_game(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, 0)
+    await coord._get_game_data()
+    await coord._get_game_data()
+    assert sorted(_fetched(mock_api_client)) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+
+async def test_first_fetch_is_capped_then_slices_rotate(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, 2)
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [1, 2]
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [3, 4]
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [5, 1]
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [2, 3]
+
+
+def _last_known(games=(1, 2, 3, 4, 5)) -> dict:
+    return {
+        "Awarded": {str(game): {"NumAchieved": 1} for game in games},
+        "Leaderboards": {str(game): {"fresh": False} for game in games},
+        "RankScore": {},
+    }
+
+
+async def test_restored_games_count_as_fetched(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, 2)
+    coord._endpoint_data["game_data"] = _last_known()
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [1, 2]
+    assert coord._fetched_games == {1, 2, 3, 4, 5}
+
+
+async def test_unrefreshed_games_keep_last_known_data(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, 1)
+    coord._endpoint_data["game_data"] = _last_known()
+    mock_api_client.async_get_user_game_leaderboards.return_value = {"fresh": True}
+    game_data = await coord._get_game_data()
+    assert set(game_data["Awarded"]) == {"1", "2", "3", "4", "5"}
+    assert game_data["Leaderboards"]["1"] == {"fresh": True}
+    assert game_data["Leaderboards"]["2"] == {"fresh": False}
+
+
+async def test_played_and_unlocked_games_jump_the_queue(
+    hass, mock_api_client, user_summary_fixture
+):
+    coord = _coordinator(hass, mock_api_client, 1, games=(1, 2, 678, 900))
+    await coord._get_game_data()
+    _fetched(mock_api_client)
+    coord._recent_game_stamps = {678: "2026-05-18 11:50:00"}
+    coord._update_game_priorities(user_summary_fixture, set())
+    assert coord._priority_games == set()
+
+    coord._update_game_priorities(user_summary_fixture, {12345})
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [678]
+
+    user_summary_fixture["RecentlyPlayed"][0]["GameID"] = 900
+    coord._update_game_priorities(user_summary_fixture, set())
+    await coord._get_game_data()
+    assert _fetched(mock_api_client) == [900]
+
+
+async def test_removed_games_are_dropped(hass, mock_api_client):
+    coord = _coordinator(hass, mock_api_client, 1)
+    coord._endpoint_data["game_data"] = await coord._get_game_data()
+    coord.entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coord.entry.data),
+        options={CONF_MONITORED_GAMES: "1\n2", CONF_GAMES_PER_REFRESH: 1},
+    )
+    game_data = await coord._get_game_data()
+    assert set(game_data["Awarded"]) == {"1", "2"}
@@ -0,0 +1,179 @@
+"""Tests for the coordinator's persisted warm-start snapshot."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    DOMAIN,
+    EVENT_ACHIEVEMENT_UNLOCKED,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+    snapshot_store_key,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="snap",
+    )
+
+
+def _stored(snapshot: dict) -> dict:
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": snapshot_store_key("snap"),
+        "data": snapshot,
+    }
+
+
+async def test_snapshot_holds_data_and_baselines(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    snapshot = coord._snapshot_to_save()
+    assert snapshot["data"] is coord.data
+    assert snapshot["achievement_ids"] == [12345]
+    assert snapshot["aotw_id"] == 99999
+    assert len(snapshot["award_keys"]) == 2
+
+
+async def test_snapshot_saved_only_when_something_changed(
+    hass, mock_api_client, mock_entry, user_points_fixture
+):
+    # The fixture's unlocks predate the rolling window and would age out.
+    mock_api_client.async_get_achievements_earned_between.return_value = []
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    coord._snapshot_store.async_delay_save = MagicMock()
+    await coord.async_refresh()
+    assert coord._snapshot_store.async_delay_save.call_count == 1
+
+    coord._tier_last_refresh.clear()
+    await coord.async_refresh()
+    assert coord.changed_sections == frozenset()
+    assert coord._snapshot_store.async_delay_save.call_count == 1
+
+    mock_api_client.async_get_user_points.return_value = {
+        **user_points_fixture,
+        "Points": user_points_fixture["Points"] + 10,
+    }
+    coord._tier_last_refresh.clear()
+    await coord.async_refresh()
+    assert coord._snapshot_store.async_delay_save.call_count == 2
+
+
+async def test_restore_without_snapshot_returns_false(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    assert await coord.async_restore_snapshot() is False
+    assert coord.data is None
+
+
+async def test_restore_sets_data_and_baselines(
+    hass, hass_storage, mock_api_client, mock_entry
+):
+    hass_storage[snapshot_store_key("snap")] = _stored(
+        {
+            "data": {"user_summary": {"User": "TestUser"}},
+            "achievement_ids": [1, 2],
+            "award_keys": ["a:1:1"],
+            "aotw_id": 5,
+        }
+    )
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    assert await coord.async_restore_snapshot() is True
+    assert coord.data == {"user_summary": {"User": "TestUser"}}
+    assert coord._previous_achievement_ids == {1, 2}
+    assert coord._previous_award_keys == {"a:1:1"}
+    assert coord._previous_aotw_id == 5
+    assert coord._first_run is False
+
+
+async def test_restored_baseline_fires_unlocks_from_downtime(
+    hass, hass_storage, mock_api_client, mock_entry
+):
+    hass_storage[snapshot_store_key("snap")] = _stored(
+        {"data": {}, "achievement_ids": [], "award_keys": [], "aotw_id": 99999}
+    )
+    fired = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_UNLOCKED, lambda e: fired.append(e))
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_restore_snapshot()
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert [event.data["achievement_id"] for event in fired] == [12345]
+
+
+async def test_reload_soon_after_unlock_does_not_refire(
+    hass,
+    hass_storage,
+    enable_custom_integrations,
+    mock_api_client,
+    mock_entry,
+    user_summary_fixture,
+):
+    hass_storage[snapshot_store_key("snap")] = _stored(
+        {"data": {}, "achievement_ids": [12345], "award_keys": [], "aotw_id": 99999}
+    )
+    fired = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_UNLOCKED, lambda e: fired.append(e))
+    mock_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+        assert fired == []
+
+        recent = user_summary_fixture["RecentAchievements"]["678"]
+        mock_api_client.async_get_user_summary.return_value = {
+            **user_summary_fixture,
+            "RecentAchievements": {
+                "678": {**recent, "777": {**recent["12345"], "ID": 777}}
+            },
+        }
+        mock_entry.runtime_data._tier_last_refresh.clear()
+        await mock_entry.runtime_data.async_refresh()
+        await hass.async_block_till_done()
+
+        # Well inside SNAPSHOT_SAVE_DELAY: only the unload flush saves it.
+        await hass.config_entries.async_reload(mock_entry.entry_id)
+        await hass.async_block_till_done()
+        await hass.config_entries.async_unload(mock_entry.entry_id)
+        await hass.async_block_till_done()
+    assert [event.data["achievement_id"] for event in fired] == [777]
+    assert 777 in hass_storage[snapshot_store_key("snap")]["data"]["achievement_ids"]
+
+
+async def test_setup_with_snapshot_does_not_block_on_refresh(
+    hass, hass_storage, enable_custom_integrations, mock_api_client, mock_entry
+):
+    hass_storage[snapshot_store_key("snap")] = _stored(
+        {
+            "data": {"user_summary": {"User": "TestUser"}, "recent_games": []},
+            "achievement_ids": [],
+            "award_keys": [],
+            "aotw_id": None,
+        }
+    )
+    mock_api_client.async_get_user_summary.side_effect = RuntimeError("down")
+    mock_entry.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
+    assert mock_entry.state is ConfigEntryState.LOADED
+    assert mock_entry.runtime_data.data["user_summary"] == {"User": "TestUser"}
@@ -0,0 +1,107 @@
+"""Tests for the coordinator's tiered polling schedule."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    DOMAIN,
+    TIER_INTERVALS,
+    TIER_MEDIUM,
+    TIER_SLOW,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="tiers",
+    )
+
+
+async def test_first_refresh_fetches_every_tier(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    mock_api_client.async_get_user_summary.assert_awaited_once()
+    mock_api_client.async_get_user_points.assert_awaited_once()
+    mock_api_client.async_get_top_ten_users.assert_awaited_once()
+
+
+async def test_slower_tiers_reuse_cached_data(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    await coord.async_refresh()
+
+    assert mock_api_client.async_get_user_summary.await_count == 2
+    assert mock_api_client.async_get_achievements_earned_on_day.await_count == 2
+    assert mock_api_client.async_get_user_points.await_count == 1
+    assert mock_api_client.async_get_achievement_of_the_week.await_count == 1
+    assert mock_api_client.async_get_recent_game_awards.await_count == 1
+    # Cached tiers keep the same coordinator.data shape.
+    assert coord.data["user_points"]["Points"] == 1500
+    assert coord.data["aotw"]["Achievement"]["ID"] == 99999
+    assert coord.data["top_ten"][0]["1"] == "AlphaPlayer"
+
+
+async def test_medium_tier_refetched_once_interval_elapsed(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    coord._tier_last_refresh[TIER_MEDIUM] -= timedelta(
+        seconds=TIER_INTERVALS[TIER_MEDIUM]
+    )
+    await coord.async_refresh()
+
+    assert mock_api_client.async_get_user_points.await_count == 2
+    assert mock_api_client.async_get_user_awards.await_count == 2
+    assert mock_api_client.async_get_top_ten_users.await_count == 1
+
+
+async def test_unlock_pulls_medium_tier_into_next_cycle(
+    hass, mock_api_client, mock_entry, user_summary_fixture
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    recent = user_summary_fixture["RecentAchievements"]["678"]
+    mock_api_client.async_get_user_summary.return_value = {
+        **user_summary_fixture,
+        "RecentAchievements": {
+            "678": {**recent, "777": {**recent["12345"], "ID": 777}}
+        },
+    }
+    await coord.async_refresh()  # detects the unlock
+    assert mock_api_client.async_get_user_points.await_count == 1
+
+    await coord.async_refresh()
+    assert mock_api_client.async_get_user_points.await_count == 2
+    assert mock_api_client.async_get_user_awards.await_count == 2
+    assert mock_api_client.async_get_top_ten_users.await_count == 1
+
+    await coord.async_refresh()  # no new unlock: back on the medium interval
+    assert mock_api_client.async_get_user_points.await_count == 2
+
+
+async def test_full_refresh_refetches_every_tier(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    assert TIER_SLOW in coord._tier_last_refresh
+
+    coord.async_request_refresh = AsyncMock()
+    await coord.async_request_full_refresh()
+    coord.async_request_refresh.assert_awaited_once()
+    assert coord._tier_last_refresh == {}
+
+    await coord.async_refresh()
+    assert mock_api_client.async_get_top_ten_users.await_count == 2
+    assert mock_api_client.async_get_user_set_requests.await_count == 2
@@ -0,0 +1,129 @@
+"""Tests for concurrent enrichment and batched achievement events."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    CONF_ACHIEVEMENT_BATCH_EVENT,
+    DOMAIN,
+    EVENT_ACHIEVEMENT_BATCH,
+    EVENT_ACHIEVEMENT_UNLOCKED,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+def _entry(*, batch_event: bool = False) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={CONF_ACHIEVEMENT_BATCH_EVENT: batch_event},
+        entry_id="test_entry",
+    )
+
+
+def _ach(ach_id: int, date: str, points: int = 5) -> dict:
+    return {
+        "ID": ach_id,
+        "Title": f"Ach {ach_id}",
+        "Points": points,
+        "DateAwarded": date,
+        "HardcoreMode": 1,
+    }
+
+
+@pytest.fixture
+def burst_summary(user_summary_fixture) -> dict:
+    """Return a summary with three new unlocks across two games."""
+    recent = user_summary_fixture["RecentAchievements"]
+    return {
+        **user_summary_fixture,
+        "RecentAchievements": {
+            **recent,
+            "678": {
+                **recent["678"],
+                "3": _ach(3, "2026-05-18 12:02:00"),
+                "1": _ach(1, "2026-05-18 12:00:00", points=10),
+            },
+            "900": {"2": _ach(2, "2026-05-18 12:01:00")},
+        },
+    }
+
+
+async def _burst(hass, mock_api_client, entry, burst_summary):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+    await coord.async_refresh()
+    mock_api_client.async_get_game_extended.reset_mock()
+    mock_api_client.async_get_user_summary.return_value = burst_summary
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    return coord
+
+
+async def test_burst_fires_in_unlock_order(hass, mock_api_client, burst_summary):
+    fired = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_UNLOCKED, lambda e: fired.append(e))
+    await _burst(hass, mock_api_client, _entry(), burst_summary)
+    assert [e.data["achievement_id"] for e in fired] == [1, 2, 3]
+
+
+async def test_each_game_is_enriched_once_and_concurrently(
+    hass, mock_api_client, burst_summary, game_extended_fixture
+):
+    # Match the sample set size so the current game is not re-prefetched.
+    burst_summary["RecentlyPlayed"][0]["AchievementsTotal"] = 1
+    in_flight = 0
+    peak = 0
+
+    async def game_extended(game_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return game_extended_fixture
+
+    mock_api_client.async_get_game_extended.side_effect = game_extended
+    await _burst(hass, mock_api_client, _entry(), burst_summary)
+    requested = [
+        call.args[0] for call in mock_api_client.async_get_game_extended.await_args_list
+    ]
+    assert sorted(requested) == [678, 900]
+    assert peak == 2
+
+
+async def test_batch_event_is_opt_in(hass, mock_api_client, burst_summary):
+    batches = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_BATCH, lambda e: batches.append(e))
+    await _burst(hass, mock_api_client, _entry(), burst_summary)
+    assert batches == []
+
+
+async def test_batch_event_summarises_the_burst(hass, mock_api_client, burst_summary):
+    batches = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_BATCH, lambda e: batches.append(e))
+    await _burst(hass, mock_api_client, _entry(batch_event=True), burst_summary)
+    assert len(batches) == 1
+    data = batches[0].data
+    assert data["count"] == 3
+    assert data["points"] == 20
+    assert data["game_ids"] == [678, 900]
+    assert [a["achievement_id"] for a in data["achievements"]] == [1, 2, 3]
+    assert data["username"] == "TestUser"
+
+
+async def test_no_batch_event_without_new_unlocks(hass, mock_api_client):
+    batches = []
+    hass.bus.async_listen(EVENT_ACHIEVEMENT_BATCH, lambda e: batches.append(e))
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass, mock_api_client, _entry(batch_event=True)
+    )
+    await coord.async_refresh()
+    await coord.async_refresh()
+    await hass.async_block_till_done()
+    assert batches == []
@@ -0,0 +1,94 @@
+"""Tests for the coordinator's incremental unlock history log."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import DOMAIN, EARNED_HISTORY_DAYS
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="unlock_log",
+    )
+
+
+def _day(offset: int) -> str:
+    return (dt_util.now().date() + timedelta(days=offset)).isoformat()
+
+
+def _unlock(ach_id: int, day: str, title: str = "t") -> dict:
+    return {"ID": ach_id, "Title": title, "HardcoreMode": 1, "Date": f"{day} 10:00:00"}
+
+
+async def test_first_refresh_requests_full_window(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    mock_api_client.async_get_achievements_earned_between.assert_awaited_once_with(
+        _day(-EARNED_HISTORY_DAYS), _day(0)
+    )
+    assert [u["Title"] for u in coord.data["earned_between"]] == [
+        "First Steps",
+        "Speed Demon",
+        "Brawler",
+    ]
+
+
+async def test_later_refresh_only_requests_since_last_sync(
+    hass, mock_api_client, mock_entry
+):
+    api = mock_api_client.async_get_achievements_earned_between
+    api.return_value = [_unlock(1, _day(-3), "old")]
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+
+    api.return_value = [_unlock(2, _day(0), "new")]
+    await coord.async_refresh()
+
+    api.assert_awaited_with(_day(-1), _day(0))
+    assert [u["Title"] for u in coord.data["earned_between"]] == ["old", "new"]
+
+
+async def test_incremental_merge_deduplicates_and_evicts(
+    hass, mock_api_client, mock_entry
+):
+    api = mock_api_client.async_get_achievements_earned_between
+    api.return_value = [
+        _unlock(1, _day(-EARNED_HISTORY_DAYS - 1), "expired"),
+        _unlock(2, _day(0), "today"),
+    ]
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+
+    api.return_value = [_unlock(2, _day(0), "today")]
+    await coord.async_refresh()
+
+    assert [u["Title"] for u in coord.data["earned_between"]] == ["today"]
+
+
+async def test_failed_sync_keeps_log_and_forces_full_resync(
+    hass, mock_api_client, mock_entry
+):
+    api = mock_api_client.async_get_achievements_earned_between
+    api.return_value = [_unlock(1, _day(0), "kept")]
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+
+    api.side_effect = RuntimeError("boom")
+    await coord.async_refresh()
+    assert [u["Title"] for u in coord.data["earned_between"]] == ["kept"]
+
+    api.side_effect = None
+    await coord.async_refresh()
+    api.assert_awaited_with(_day(-EARNED_HISTORY_DAYS), _day(0))
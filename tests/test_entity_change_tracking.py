@@ -0,0 +1,120 @@
+"""Tests for skipping entity state writes when coordinator data is unchanged."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.binary_sensor import (
+    RetroAchievementsIsGamingBinarySensor,
+)
+from custom_components.retroarchievements.const import DOMAIN
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+from custom_components.retroarchievements.sensor import (
+    USER_SENSORS,
+    RetroAchievementsAOTWSensor,
+    RetroAchievementsUserSensor,
+)
+
+
+@pytest.fixture
+def mock_entry():
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={},
+        entry_id="t",
+    )
+
+
+async def _refresh_all(coord):
+    coord._tier_last_refresh.clear()  # slow/medium tiers are cached otherwise
+    await coord.async_refresh()
+
+
+def _changed(coord) -> frozenset[str]:
+    # The fixture unlocks predate the rolling window, so the incremental sync
+    # after the first refresh evicts them and earned_between always changes.
+    return coord.changed_sections - {"earned_between"}
+
+
+async def test_first_refresh_marks_every_section_changed(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    assert coord.changed_sections is None
+    await coord.async_refresh()
+    assert coord.changed_sections == frozenset(coord.data)
+
+
+async def test_unchanged_refresh_reports_no_changes(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    await _refresh_all(coord)
+    assert _changed(coord) == frozenset()
+
+
+async def test_only_changed_sections_are_reported(hass, mock_api_client, mock_entry):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    mock_api_client.async_get_user_points.return_value = {
+        "Points": 1,
+        "SoftcorePoints": 2,
+    }
+    await _refresh_all(coord)
+    assert _changed(coord) == frozenset({"user_points"})
+
+
+def _sensor(coord, key):
+    description = next(d for d in USER_SENSORS if d.key == key)
+    return RetroAchievementsUserSensor(coord, "TestUser", description)
+
+
+async def test_entity_skips_write_when_its_sections_are_unchanged(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    aotw = RetroAchievementsAOTWSensor(coord, "TestUser")
+    points = _sensor(coord, "hardcore_points")
+    gaming = RetroAchievementsIsGamingBinarySensor(coord, "TestUser")
+    entities = (aotw, points, gaming)
+    with (
+        patch.object(aotw, "async_write_ha_state") as aotw_write,
+        patch.object(points, "async_write_ha_state") as points_write,
+        patch.object(gaming, "async_write_ha_state") as gaming_write,
+    ):
+        for entity in entities:
+            entity._handle_coordinator_update()
+        assert aotw_write.call_count == points_write.call_count == 1
+
+        mock_api_client.async_get_user_points.return_value = {"Points": 1}
+        await _refresh_all(coord)
+        for entity in entities:
+            entity._handle_coordinator_update()
+        assert aotw_write.call_count == 1
+        assert points_write.call_count == 2
+        # is_gaming reads only user_summary; its idle flip is timer-driven.
+        assert gaming_write.call_count == 1
+
+
+async def test_entity_writes_when_availability_changes(
+    hass, mock_api_client, mock_entry
+):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, mock_entry)
+    await coord.async_refresh()
+    aotw = RetroAchievementsAOTWSensor(coord, "TestUser")
+    with patch.object(aotw, "async_write_ha_state") as write:
+        aotw._handle_coordinator_update()
+        await _refresh_all(coord)
+        aotw._handle_coordinator_update()
+        coord.last_update_success = False
+        aotw._handle_coordinator_update()
+        aotw._handle_coordinator_update()
+        coord.last_update_success = True
+        aotw._handle_coordinator_update()
+    assert write.call_count == 3
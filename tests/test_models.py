@@ -0,0 +1,67 @@
+"""Tests for compacting API payloads into the integration's models."""
+
+from __future__ import annotations
+
+from custom_components.retroarchievements.models import (
+    parse_unlocks,
+    parse_user_awards,
+    parse_user_summary,
+)
+
+
+def test_user_summary_drops_unused_fields(user_summary_fixture):
+    payload = {
+        **user_summary_fixture,
+        "Motto": "Hi",
+        "Awarded": {"678": {"NumPossibleAchievements": 24}},
+        "LastGame": {"ID": 678, "Title": "Sonic the Hedgehog"},
+    }
+    payload["RecentlyPlayed"] = [
+        {**game, "NumAchieved": 3} for game in payload["RecentlyPlayed"]
+    ]
+
+    summary = parse_user_summary(payload)
+
+    assert summary == user_summary_fixture
+    assert "Awarded" not in summary
+    assert "NumAchieved" not in summary["RecentlyPlayed"][0]
+
+
+def test_user_summary_keeps_achievement_fields(user_summary_fixture):
+    recent = user_summary_fixture["RecentAchievements"]
+    game_id, achievements = next(iter(recent.items()))
+    ach_id, achievement = next(iter(achievements.items()))
+    achievement["Type"] = "progression"
+    achievement["IsAwarded"] = "1"
+
+    summary = parse_user_summary(user_summary_fixture)
+
+    kept = summary["RecentAchievements"][game_id][ach_id]
+    assert "Type" not in kept
+    assert "IsAwarded" not in kept
+    assert kept["BadgeName"] == achievement["BadgeName"]
+
+
+def test_user_summary_tolerates_odd_shapes():
+    assert parse_user_summary(None) == {}
+    summary = parse_user_summary({"RecentAchievements": [], "RecentlyPlayed": None})
+    assert summary == {"RecentAchievements": [], "RecentlyPlayed": []}
+
+
+def test_awards_drop_unused_fields(large_user_awards_fixture):
+    awards = parse_user_awards(large_user_awards_fixture)
+
+    assert len(awards["VisibleUserAwards"]) == len(
+        large_user_awards_fixture["VisibleUserAwards"]
+    )
+    assert all(
+        "Flags" not in award and "Value" not in award
+        for award in awards["VisibleUserAwards"]
+    )
+    assert awards["TotalAwardsCount"] == large_user_awards_fixture["TotalAwardsCount"]
+
+
+def test_unlocks_skip_non_dicts():
+    unlocks = parse_unlocks([{"ID": 1, "Date": "2026-01-01", "Type": "x"}, "junk"])
+    assert unlocks == [{"ID": 1, "Date": "2026-01-01"}]
+    assert parse_unlocks({"error": "x"}) == []
@@ -0,0 +1,138 @@
+"""Tests for the opt-in refresh phase profiler."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.const import (
+    CONF_PROFILE_REFRESHES,
+    DOMAIN,
+    SERVICE_GET_REFRESH_PROFILE,
+)
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+from custom_components.retroarchievements.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.retroarchievements.profiler import RefreshProfiler
+
+PHASES = ["fetch", "diff", "events", "assemble"]
+
+
+def _entry(**options) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options=options,
+        entry_id="t",
+    )
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = RefreshProfiler()
+    profiler.start()
+    profiler.lap("fetch")
+    profiler.finish(success=True)
+    assert profiler.as_list() == []
+
+
+def test_profiler_records_phases_and_totals():
+    profiler = RefreshProfiler(enabled=True)
+    profiler.start()
+    profiler.lap("fetch")
+    profiler.lap("events")
+    profiler.finish(success=False)
+    (refresh,) = profiler.as_list()
+    assert list(refresh["phases"]) == ["fetch", "events"]
+    assert refresh["success"] is False
+    assert refresh["wall_ms"] >= refresh["phases"]["fetch"]["wall_ms"]
+    assert set(refresh["phases"]["fetch"]) == {"wall_ms", "cpu_ms"}
+
+
+def test_profiler_keeps_only_recent_history():
+    profiler = RefreshProfiler(3, enabled=True)
+    for _ in range(5):
+        profiler.start()
+        profiler.finish(success=True)
+    assert len(profiler.as_list()) == 3
+
+
+def test_lap_outside_a_refresh_is_ignored():
+    profiler = RefreshProfiler(enabled=True)
+    profiler.lap("fetch")
+    profiler.finish(success=True)
+    assert profiler.as_list() == []
+
+
+async def test_coordinator_profiles_each_phase(hass, mock_api_client):
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass, mock_api_client, _entry(**{CONF_PROFILE_REFRESHES: True})
+    )
+    await coord.async_refresh()
+    (refresh,) = coord.profiler.as_list()
+    assert list(refresh["phases"]) == PHASES
+    assert refresh["success"] is True
+
+
+async def test_coordinator_records_failed_refresh(hass, mock_api_client):
+    coord = RetroAchievementsDataUpdateCoordinator(
+        hass, mock_api_client, _entry(**{CONF_PROFILE_REFRESHES: True})
+    )
+    mock_api_client.async_get_user_summary.side_effect = RuntimeError("boom")
+    await coord.async_refresh()
+    assert coord.last_update_success is False
+    (refresh,) = coord.profiler.as_list()
+    assert refresh["success"] is False
+    assert "assemble" not in refresh["phases"]
+
+
+async def test_coordinator_profiler_off_by_default(hass, mock_api_client):
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, _entry())
+    await coord.async_refresh()
+    assert coord.profiler.enabled is False
+    assert coord.profiler.as_list() == []
+
+
+@pytest.fixture
+async def loaded_entry(hass, enable_custom_integrations, mock_api_client):
+    entry = _entry(**{CONF_PROFILE_REFRESHES: True})
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.retroarchievements.RetroAchievementsApiClient",
+        return_value=mock_api_client,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_service_returns_profile_per_entry(hass, loaded_entry):
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_REFRESH_PROFILE,
+        {},
+        blocking=True,
+        return_response=True,
+    )
+    profile = response["entries"][loaded_entry.entry_id]
+    assert profile["username"] == "TestUser"
+    assert profile["enabled"] is True
+    assert list(profile["refreshes"][0]["phases"]) == PHASES
+
+
+async def test_service_removed_on_last_unload(hass, loaded_entry):
+    await hass.config_entries.async_unload(loaded_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.services.has_service(DOMAIN, SERVICE_GET_REFRESH_PROFILE) is False
+
+
+async def test_diagnostics_include_refresh_profile(hass, loaded_entry):
+    diagnostics = await async_get_config_entry_diagnostics(hass, loaded_entry)
+    assert diagnostics["refresh_profile"] == (
+        loaded_entry.runtime_data.profiler.as_list()
+    )
+    assert diagnostics["refresh_profile"]
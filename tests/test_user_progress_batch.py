@@ -0,0 +1,87 @@
+"""Tests for batching monitored-game progress into API_GetUserProgress."""
+
+from __future__ import annotations
+
+import re
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.retroarchievements.api import RetroAchievementsApiClient
+from custom_components.retroarchievements.const import BASE_URL, DOMAIN
+from custom_components.retroarchievements.coordinator import (
+    RetroAchievementsDataUpdateCoordinator,
+)
+
+PROGRESS_URL = re.compile(rf"^{re.escape(BASE_URL)}API_GetUserProgress\.php")
+
+
+@pytest.fixture
+async def session():
+    async with aiohttp.ClientSession() as s:
+        yield s
+
+
+def _progress(*game_ids: int) -> dict:
+    return {
+        str(game_id): {"NumPossibleAchievements": 10, "NumAchieved": game_id % 10}
+        for game_id in game_ids
+    }
+
+
+async def test_batch_splits_ids_into_chunks(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, payload=_progress(1, 2))
+        m.get(PROGRESS_URL, payload=_progress(3))
+        result = await client.async_get_user_progress_batch([3, 1, 2], chunk_size=2)
+        sent = sorted(
+            call.kwargs["params"]["i"]
+            for calls in m.requests.values()
+            for call in calls
+        )
+    assert sent == ["1,2", "3"]
+    assert set(result) == {"1", "2", "3"}
+    assert result["3"]["NumAchieved"] == 3
+
+
+async def test_single_game_progress_uses_batch(session):
+    client = RetroAchievementsApiClient("TestUser", "key", session)
+    with aioresponses() as m:
+        m.get(PROGRESS_URL, payload=_progress(678))
+        result = await client.async_get_user_progress(678)
+    assert result == {"NumPossibleAchievements": 10, "NumAchieved": 8}
+
+
+async def test_coordinator_fetches_progress_in_one_call(hass, mock_api_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={"monitored_games": "678\n1234"},
+        entry_id="test_entry",
+    )
+    mock_api_client.async_get_user_progress_batch.return_value = _progress(678, 1234)
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+    await coord.async_refresh()
+    mock_api_client.async_get_user_progress_batch.assert_awaited_once()
+    mock_api_client.async_get_user_progress.assert_not_awaited()
+    assert set(coord.data["Awarded"]) == {"678", "1234"}
+
+
+async def test_coordinator_keeps_other_sections_when_progress_fails(
+    hass, mock_api_client
+):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "TestUser", "api_key": "key"},
+        options={"monitored_games": "678"},
+        entry_id="test_entry",
+    )
+    mock_api_client.async_get_user_progress_batch.side_effect = Exception("boom")
+    coord = RetroAchievementsDataUpdateCoordinator(hass, mock_api_client, entry)
+    await coord.async_refresh()
+    assert coord.last_update_success
+    assert coord.data["Awarded"] == {}
+    assert "678" in coord.data["Leaderboards"]